@@ -0,0 +1,21 @@
+"""Add trigram index for files path search."""
+
+from alembic import op
+
+
+revision = "014_add_files_path_trgm_index"
+down_revision = "013_add_files_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_files_path_trgm "
+        "ON files USING gin (path gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_files_path_trgm")
@@ -0,0 +1,30 @@
+"""Add composite indexes for websites list and recent activity queries."""
+
+from alembic import op
+
+
+revision = "015_add_websites_list_indexes"
+down_revision = "014_add_files_path_trgm_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_websites_user_active_saved_at
+        ON websites (user_id, saved_at DESC NULLS LAST, created_at DESC)
+        WHERE deleted_at IS NULL
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_websites_user_last_opened_at
+        ON websites (user_id, last_opened_at DESC)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_websites_user_last_opened_at")
+    op.execute("DROP INDEX IF EXISTS idx_websites_user_active_saved_at")
@@ -0,0 +1,19 @@
+"""Add server-side timestamp defaults for websites."""
+
+from alembic import op
+
+
+revision = "016_add_websites_timestamp_defaults"
+down_revision = "015_add_websites_list_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE websites ALTER COLUMN created_at SET DEFAULT now()")
+    op.execute("ALTER TABLE websites ALTER COLUMN updated_at SET DEFAULT now()")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE websites ALTER COLUMN updated_at DROP DEFAULT")
+    op.execute("ALTER TABLE websites ALTER COLUMN created_at DROP DEFAULT")
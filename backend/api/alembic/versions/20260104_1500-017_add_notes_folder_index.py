@@ -0,0 +1,23 @@
+"""Add prefix index on notes metadata folder."""
+
+from alembic import op
+
+
+revision = "017_add_notes_folder_index"
+down_revision = "016_add_websites_timestamp_defaults"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_notes_user_folder
+        ON notes (user_id, (metadata->>'folder') text_pattern_ops)
+        WHERE deleted_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_notes_user_folder")
@@ -0,0 +1,32 @@
+"""Add trigram indexes for notes and websites substring search."""
+
+from alembic import op
+
+
+revision = "018_add_notes_websites_trgm_indexes"
+down_revision = "017_add_notes_folder_index"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("idx_notes_title_trgm", "notes", "title"),
+    ("idx_notes_content_trgm", "notes", "content"),
+    ("idx_websites_title_trgm", "websites", "title"),
+    ("idx_websites_content_trgm", "websites", "content"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in INDEXES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} "
+            f"ON {table} USING gin ({column} gin_trgm_ops) "
+            "WHERE deleted_at IS NULL"
+        )
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,33 @@
+"""Add stored full-text search vectors for notes and websites."""
+
+from alembic import op
+
+
+revision = "019_add_notes_websites_search_tsv"
+down_revision = "018_add_notes_websites_trgm_indexes"
+branch_labels = None
+depends_on = None
+
+
+SEARCH_TSV_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    for table in ("notes", "websites"):
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_TSV_EXPRESSION}) STORED"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_search_tsv "
+            f"ON {table} USING gin (search_tsv)"
+        )
+
+
+def downgrade() -> None:
+    for table in ("websites", "notes"):
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_search_tsv")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_tsv")
@@ -0,0 +1,23 @@
+"""Add partial index for listing live notes by recency."""
+
+from alembic import op
+
+
+revision = "020_add_notes_user_updated_index"
+down_revision = "019_add_notes_websites_search_tsv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_notes_user_active_updated_at
+        ON notes (user_id, updated_at DESC)
+        WHERE deleted_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_notes_user_active_updated_at")
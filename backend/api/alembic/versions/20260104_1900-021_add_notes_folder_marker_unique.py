@@ -0,0 +1,40 @@
+"""Enforce one live folder marker per user folder."""
+
+from alembic import op
+
+
+revision = "021_add_notes_folder_marker_unique"
+down_revision = "020_add_notes_user_updated_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Soft-delete duplicate markers, keeping the oldest, so the index can build.
+    op.execute(
+        """
+        UPDATE notes SET deleted_at = now(), updated_at = now()
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY user_id, metadata->>'folder'
+                    ORDER BY created_at, id
+                ) AS rn
+                FROM notes
+                WHERE (metadata->>'folder_marker') = 'true' AND deleted_at IS NULL
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_notes_user_folder_marker
+        ON notes (user_id, (metadata->>'folder'))
+        WHERE (metadata->>'folder_marker') = 'true' AND deleted_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_notes_user_folder_marker")
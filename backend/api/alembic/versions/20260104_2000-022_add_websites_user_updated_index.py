@@ -0,0 +1,23 @@
+"""Add partial index for ordering live websites by recency."""
+
+from alembic import op
+
+
+revision = "022_add_websites_user_updated_index"
+down_revision = "021_add_notes_folder_marker_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_websites_user_active_updated_at
+        ON websites (user_id, updated_at DESC)
+        WHERE deleted_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_websites_user_active_updated_at")
@@ -0,0 +1,34 @@
+"""Add stored archived flag for notes derived from the folder."""
+
+from alembic import op
+
+
+revision = "023_add_notes_archived_column"
+down_revision = "022_add_websites_user_updated_index"
+branch_labels = None
+depends_on = None
+
+
+ARCHIVED_EXPRESSION = (
+    "coalesce((metadata->>'folder') = 'Archive' "
+    "OR (metadata->>'folder') LIKE 'Archive/%', false)"
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE notes ADD COLUMN IF NOT EXISTS archived boolean "
+        f"GENERATED ALWAYS AS ({ARCHIVED_EXPRESSION}) STORED"
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_notes_user_unarchived_updated_at
+        ON notes (user_id, updated_at DESC)
+        WHERE deleted_at IS NULL AND archived = false
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_notes_user_unarchived_updated_at")
+    op.execute("ALTER TABLE notes DROP COLUMN IF EXISTS archived")
@@ -0,0 +1,23 @@
+"""Drop user_memories indexes duplicated by the (user_id, path) unique constraint."""
+
+from alembic import op
+
+
+revision = "024_drop_redundant_user_memories_indexes"
+down_revision = "023_add_notes_archived_column"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_user_memories_user_id_path")
+    op.execute("DROP INDEX IF EXISTS ix_user_memories_user_id")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_user_memories_user_id_path
+        ON user_memories (user_id, path)
+        """
+    )
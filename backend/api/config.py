@@ -70,6 +70,7 @@ class Settings(BaseSettings):
     skill_timeout_seconds: int = 30
     skill_max_output_bytes: int = 10 * 1024 * 1024  # 10MB
     skill_max_concurrent: int = 5
+    skill_worker_processes: int = 5  # warm forking workers; 0 = fresh subprocess per call
 
     # Storage
     storage_backend: str = "local"  # local or r2
@@ -79,6 +80,11 @@ class Settings(BaseSettings):
     r2_access_key: str = ""
     r2_secret_access_key: str = ""
 
+    # Development diagnostics: warn when a request issues more SQL statements
+    # than this (0 disables); strict mode raises instead, for test runs.
+    query_budget_per_request: int = 0
+    query_budget_strict: bool = False
+
     # Future JWT config (Phase 2)
     # jwt_secret: str = None
     # jwt_algorithm: str = "HS256"
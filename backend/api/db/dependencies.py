@@ -6,7 +6,7 @@ from typing import Annotated
 DEFAULT_USER_ID = "81326b53-b7eb-42e2-b645-0c03cb5d5dd4"
 
 
-def get_current_user_id(
+async def get_current_user_id(
     x_user_id: Annotated[str | None, Header()] = None
 ) -> str:
     """
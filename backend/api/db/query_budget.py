@@ -0,0 +1,72 @@
+"""Per-request SQL statement budget for catching N+1 patterns in development."""
+from __future__ import annotations
+
+import logging
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode when a request issues more statements than allowed."""
+
+
+class _QueryCounter:
+    __slots__ = ("count", "limit", "strict")
+
+    def __init__(self, limit: int, strict: bool) -> None:
+        self.count = 0
+        self.limit = limit
+        self.strict = strict
+
+
+# The counter object is shared by reference, so threadpool copies of the
+# request context still increment the same count.
+_current_counter: ContextVar[_QueryCounter | None] = ContextVar("query_budget", default=None)
+
+
+def install_query_budget(engine: Engine) -> None:
+    """Count statements executed on ``engine`` against the active request budget."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_statement(conn, cursor, statement, parameters, context, executemany):
+        counter = _current_counter.get()
+        if counter is None:
+            return
+        counter.count += 1
+        if counter.strict and counter.count > counter.limit:
+            raise QueryBudgetExceeded(
+                f"Request issued {counter.count} SQL statements (budget {counter.limit})"
+            )
+
+
+class QueryBudgetMiddleware:
+    """Warn (or fail, in strict mode) when an HTTP request exceeds its query budget."""
+
+    def __init__(self, app, limit: int, strict: bool = False):
+        self.app = app
+        self.limit = limit
+        self.strict = strict
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = _QueryCounter(self.limit, self.strict)
+        token = _current_counter.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_counter.reset(token)
+            if counter.count > self.limit:
+                logger.warning(
+                    "%s %s issued %d SQL statements (budget %d); possible N+1",
+                    scope.get("method"),
+                    scope.get("path"),
+                    counter.count,
+                    self.limit,
+                )
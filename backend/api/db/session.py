@@ -1,4 +1,5 @@
 """Database session management."""
+import orjson
 from fastapi import Depends
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
@@ -7,12 +8,20 @@ from typing import Generator
 from api.config import settings
 from api.db.dependencies import get_current_user_id
 
+
+def _json_serializer(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create engine - Always use PostgreSQL
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
+    pool_size=20,
+    max_overflow=10,
+    pool_recycle=1800,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create SessionLocal class
@@ -1,14 +1,81 @@
 """Execute skill scripts with security hardening and resource limits."""
 import subprocess
+import importlib.util
 import json
 import os
 import asyncio
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from api.config import settings
+from api.executors.skill_worker import BACKEND_ROOT, SkillWorkerPool
 from api.security.audit_logger import AuditLogger
 
+# Runtime secrets/config passed through to skill scripts (required for DB-backed skills).
+PASSTHROUGH_ENV = (
+    "DOPPLER_TOKEN",
+    "BEARER_TOKEN",
+    "ANTHROPIC_API_KEY",
+    "DATABASE_URL",
+    "SUPABASE_POSTGRES_PSWD",
+    "SUPABASE_PROJECT_ID",
+    "SUPABASE_USE_POOLER",
+    "SUPABASE_POOLER_HOST",
+    "SUPABASE_POOLER_USER",
+    "SUPABASE_DB_NAME",
+    "SUPABASE_DB_PORT",
+    "SUPABASE_DB_USER",
+    "SUPABASE_SSLMODE",
+    "SUPABASE_APP_PSWD",
+    "OPENAI_API_KEY",
+    "GOOGLE_API_KEY",
+    "JINA_API_KEY",
+    "JINA_SSL_VERIFY",
+    "JINA_CA_BUNDLE",
+    "REQUESTS_CA_BUNDLE",
+    "SSL_CERT_FILE",
+    "R2_ENDPOINT",
+    "R2_BUCKET",
+    "R2_ACCESS_KEY_ID",
+    "R2_ACCESS_KEY",
+    "R2_SECRET_ACCESS_KEY",
+    "STORAGE_BACKEND",
+)
+
+_worker_pool: Optional[SkillWorkerPool] = None
+
+
+def _script_env(workspace_base: Path) -> Dict[str, str]:
+    """Minimal environment for skill scripts - only what's needed."""
+    # Scripts import api.* from the backend root (/app in the container).
+    pythonpath = os.environ.get("PYTHONPATH", "")
+    pythonpath = f"{pythonpath}:{BACKEND_ROOT}" if pythonpath else str(BACKEND_ROOT)
+
+    env = {
+        "WORKSPACE_BASE": str(workspace_base),
+        "PATH": os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin"),
+        "PYTHONPATH": pythonpath,
+    }
+    for key in PASSTHROUGH_ENV:
+        if key in os.environ:
+            env[key] = os.environ[key]
+    return env
+
+
+@lru_cache(maxsize=None)
+def _load_script_function(script_path: str, function_name: str) -> Optional[Callable]:
+    """Import a skill script once and return one of its functions."""
+    path = Path(script_path)
+    spec = importlib.util.spec_from_file_location(
+        f"_skill_{path.parent.parent.name}_{path.stem}", path
+    )
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, function_name, None)
+
 
 class SkillExecutor:
     """
@@ -86,6 +153,117 @@ class SkillExecutor:
                     if ".." in arg:
                         raise ValueError(f"Path traversal not allowed: {arg}")
 
+    @staticmethod
+    def start_worker_pool(size: Optional[int] = None) -> None:
+        """Run scripts on warm forking workers instead of a fresh interpreter per call.
+
+        Call from the running event loop (app lifespan). A size of 0 keeps
+        the plain subprocess path.
+        """
+        global _worker_pool
+        size = settings.skill_worker_processes if size is None else size
+        if _worker_pool is not None or size <= 0 or not hasattr(os, "fork"):
+            return
+        _worker_pool = SkillWorkerPool(size, _script_env(settings.workspace_base))
+        _worker_pool.start()
+
+    @staticmethod
+    async def stop_worker_pool() -> None:
+        """Shut the workers down; later calls fall back to subprocesses."""
+        global _worker_pool
+        if _worker_pool is None:
+            return
+        pool, _worker_pool = _worker_pool, None
+        await pool.stop()
+
+    async def _run_script(self, script_path: Path, args: List[str]) -> Tuple[int, str, str]:
+        """Run a script and return (returncode, stdout, stderr).
+
+        Raises ``subprocess.TimeoutExpired`` when the script overruns.
+        """
+        env = _script_env(self.workspace_base)
+        if _worker_pool is not None:
+            return await _worker_pool.run(
+                str(script_path),
+                args,
+                env,
+                str(self.workspace_base),
+                settings.skill_timeout_seconds,
+            )
+
+        # Execute with strict timeout and no shell
+        result = subprocess.run(
+            ["python", str(script_path), *args],
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=settings.skill_timeout_seconds,
+            shell=False,  # Explicit: never use shell
+            cwd=self.workspace_base  # Run in workspace (not skills dir)
+        )
+        return result.returncode, result.stdout, result.stderr
+
+    def load_function(self, skill_name: str, script_name: str, function_name: str) -> Optional[Callable]:
+        """Return a function defined by a validated skill script, or None."""
+        try:
+            script_path = self._validate_script_path(skill_name, script_name)
+            return _load_script_function(str(script_path), function_name)
+        except Exception:
+            # Anything that stops the import (e.g. ImportError) falls back to execute().
+            return None
+
+    async def execute_function(
+        self,
+        skill_name: str,
+        script_name: str,
+        function: Callable,
+        kwargs: Dict[str, Any],
+        args: List[str],
+        user_id: str = None,
+    ) -> Dict[str, Any]:
+        """Run a skill script's entry function in a worker thread.
+
+        Skips the interpreter start of ``execute`` for trusted in-repo scripts
+        and returns the same ``success``/``data``/``error`` shape the script
+        would print. Path validation, the timeout and the output cap match
+        ``execute``; a timed-out call is abandoned, since threads cannot be
+        killed, and the function runs with the server's environment.
+        """
+        start_time = time.time()
+
+        async with self._semaphore:
+            error = None
+            try:
+                self._validate_workspace_paths(args)
+                data = await asyncio.wait_for(
+                    asyncio.to_thread(function, **kwargs),
+                    settings.skill_timeout_seconds,
+                )
+                output = {"success": True, "data": data}
+                output_bytes = len(json.dumps(output, default=str).encode("utf-8"))
+                if output_bytes > settings.skill_max_output_bytes:
+                    raise ValueError(
+                        f"stdout exceeded limit: {output_bytes} > {settings.skill_max_output_bytes}"
+                    )
+            except asyncio.TimeoutError:
+                error = f"Script execution timeout ({settings.skill_timeout_seconds}s)"
+            except (ValueError, FileExistsError, FileNotFoundError) as e:
+                error = str(e)
+            except Exception as e:
+                error = f"Unexpected error: {str(e)}"
+
+        AuditLogger.log_tool_call(
+            tool_name=f"{skill_name}.{script_name}",
+            parameters={"args": args},
+            duration_ms=(time.time() - start_time) * 1000,
+            success=error is None,
+            error=error,
+            user_id=user_id
+        )
+        if error is not None:
+            return {"success": False, "error": error}
+        return output
+
     async def execute(
         self,
         skill_name: str,
@@ -106,69 +284,15 @@ class SkillExecutor:
                 # Validate workspace paths
                 self._validate_workspace_paths(args)
 
-                # Build command (no shell=True to prevent injection)
-                cmd = ["python", str(script_path)] + args
+                script_args = list(args)
                 if expect_json and "--json" not in args:
-                    cmd.append("--json")
-
-                # Minimal environment - only what's needed
-                pythonpath = os.environ.get("PYTHONPATH", "")
-                if Path("/app").exists():
-                    pythonpath = f"{pythonpath}:/app" if pythonpath else "/app"
-
-                env = {
-                    "WORKSPACE_BASE": str(self.workspace_base),
-                    "PATH": os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin"),
-                    "PYTHONPATH": pythonpath,
-                }
-
-                # Add selected runtime secrets/config if present (required for DB-backed skills)
-                for key in (
-                    "DOPPLER_TOKEN",
-                    "BEARER_TOKEN",
-                    "ANTHROPIC_API_KEY",
-                    "DATABASE_URL",
-                    "SUPABASE_POSTGRES_PSWD",
-                    "SUPABASE_PROJECT_ID",
-                    "SUPABASE_USE_POOLER",
-                    "SUPABASE_POOLER_HOST",
-                    "SUPABASE_POOLER_USER",
-                    "SUPABASE_DB_NAME",
-                    "SUPABASE_DB_PORT",
-                    "SUPABASE_DB_USER",
-                    "SUPABASE_SSLMODE",
-                    "SUPABASE_APP_PSWD",
-                    "OPENAI_API_KEY",
-                    "GOOGLE_API_KEY",
-                    "JINA_API_KEY",
-                    "JINA_SSL_VERIFY",
-                    "JINA_CA_BUNDLE",
-                    "REQUESTS_CA_BUNDLE",
-                    "SSL_CERT_FILE",
-                    "R2_ENDPOINT",
-                    "R2_BUCKET",
-                    "R2_ACCESS_KEY_ID",
-                    "R2_ACCESS_KEY",
-                    "R2_SECRET_ACCESS_KEY",
-                    "STORAGE_BACKEND",
-                ):
-                    if key in os.environ:
-                        env[key] = os.environ[key]
-
-                # Execute with strict timeout and no shell
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    env=env,
-                    timeout=settings.skill_timeout_seconds,
-                    shell=False,  # Explicit: never use shell
-                    cwd=self.workspace_base  # Run in workspace (not skills dir)
-                )
+                    script_args.append("--json")
+
+                returncode, stdout, stderr = await self._run_script(script_path, script_args)
 
                 # Enforce output size limits
-                stdout_bytes = len(result.stdout.encode('utf-8'))
-                stderr_bytes = len(result.stderr.encode('utf-8'))
+                stdout_bytes = len(stdout.encode('utf-8'))
+                stderr_bytes = len(stderr.encode('utf-8'))
 
                 if stdout_bytes > settings.skill_max_output_bytes:
                     raise ValueError(
@@ -182,15 +306,15 @@ class SkillExecutor:
 
                 duration_ms = (time.time() - start_time) * 1000
 
-                if result.returncode == 0:
+                if returncode == 0:
                     if expect_json:
-                        output = json.loads(result.stdout)
+                        output = json.loads(stdout)
                     else:
                         output = {
                             "success": True,
                             "data": {
-                                "stdout": result.stdout,
-                                "stderr": result.stderr,
+                                "stdout": stdout,
+                                "stderr": stderr,
                             },
                         }
                     # Audit log success
@@ -204,9 +328,9 @@ class SkillExecutor:
                     return output
                 else:
                     try:
-                        error = json.loads(result.stderr)
+                        error = json.loads(stderr)
                     except:
-                        error = {"error": result.stderr}
+                        error = {"error": stderr}
 
                     # Audit log failure
                     AuditLogger.log_tool_call(
@@ -0,0 +1,262 @@
+"""Warm worker processes for running skill scripts.
+
+Each worker is a long-lived interpreter that imports the modules skill
+scripts depend on once at startup. Per call it forks, and the child runs the
+script as ``__main__`` with the request's argv, environment and cwd, so
+scripts stay isolated from each other exactly as with a fresh subprocess but
+skip interpreter start and the shared imports.
+
+Frames on the worker's stdin/stdout are a 4-byte big-endian length followed
+by an orjson body.
+"""
+import asyncio
+import importlib
+import os
+import runpy
+import selectors
+import signal
+import struct
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+_HEADER = struct.Struct("!I")
+
+# Imported by the worker before forking; missing optional deps are skipped.
+# argparse is shared by nearly every skill CLI.
+PRELOAD_MODULES = (
+    "argparse",
+    "json",
+    "api.services.skill_file_ops",
+    "api.services.skill_file_transfer",
+    "api.services.notes_service",
+    "api.db.session",
+)
+
+
+def _preload() -> None:
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"skill worker: could not preload {name}: {e}", file=sys.stderr)
+
+
+def _exec_script(request: dict) -> int:
+    """Run the requested script in the forked child and return its exit code."""
+    try:
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        script = request["script"]
+        sys.argv = [script, *request["args"]]
+        sys.path.insert(0, os.path.dirname(script))
+        runpy.run_path(script, run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except Exception:
+        pass
+    return code
+
+
+def _collect(pid: int, out_r: int, err_r: int, timeout: float) -> Tuple[bytes, bytes, bool]:
+    """Read the child's stdout/stderr until EOF or the deadline passes."""
+    deadline = time.monotonic() + timeout
+    chunks: Dict[int, List[bytes]] = {out_r: [], err_r: []}
+    timed_out = False
+    with selectors.DefaultSelector() as selector:
+        for fd in chunks:
+            selector.register(fd, selectors.EVENT_READ)
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            for key, _ in selector.select(remaining):
+                data = os.read(key.fd, 65536)
+                if data:
+                    chunks[key.fd].append(data)
+                else:
+                    selector.unregister(key.fd)
+    if timed_out:
+        os.kill(pid, signal.SIGKILL)
+    return b"".join(chunks[out_r]), b"".join(chunks[err_r]), timed_out
+
+
+def _run(request: dict) -> dict:
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        os.close(out_r)
+        os.close(err_r)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(out_w, 1)
+        os.dup2(err_w, 2)
+        os._exit(_exec_script(request))
+
+    os.close(out_w)
+    os.close(err_w)
+    try:
+        stdout, stderr, timed_out = _collect(pid, out_r, err_r, request["timeout"])
+    finally:
+        os.close(out_r)
+        os.close(err_r)
+    _, status = os.waitpid(pid, 0)
+    return {
+        "returncode": os.waitstatus_to_exitcode(status),
+        "stdout": stdout.decode("utf-8", errors="replace"),
+        "stderr": stderr.decode("utf-8", errors="replace"),
+        "timed_out": timed_out,
+    }
+
+
+def _read_frame(stream) -> Optional[bytes]:
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    return stream.read(_HEADER.unpack(header)[0])
+
+
+def main() -> None:
+    """Serve requests from stdin until the pool closes it."""
+    # Keep the protocol on a private fd; stray prints go to stderr instead.
+    protocol = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    _preload()
+    requests = sys.stdin.buffer
+    while True:
+        frame = _read_frame(requests)
+        if frame is None:
+            return
+        try:
+            response = _run(orjson.loads(frame))
+        except Exception as e:
+            response = {
+                "returncode": 1,
+                "stdout": "",
+                "stderr": orjson.dumps({"error": f"Skill worker error: {e}"}).decode(),
+                "timed_out": False,
+            }
+        body = orjson.dumps(response)
+        protocol.write(_HEADER.pack(len(body)) + body)
+        protocol.flush()
+
+
+class SkillWorkerPool:
+    """Fixed set of warm skill workers; one request in flight per worker."""
+
+    def __init__(self, size: int, env: Dict[str, str]):
+        """``env`` must put the backend root on PYTHONPATH so workers can import api."""
+        self.size = size
+        self._env = env
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.subprocess.Process] = []
+
+    def start(self) -> None:
+        # Workers are spawned on first checkout; None marks an empty slot.
+        self._idle = asyncio.Queue()
+        for _ in range(self.size):
+            self._idle.put_nowait(None)
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            if worker.returncode is None:
+                worker.stdin.close()
+        for worker in self._workers:
+            try:
+                await asyncio.wait_for(worker.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                worker.kill()
+                await worker.wait()
+        self._workers.clear()
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        worker = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "api.executors.skill_worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=self._env,
+            cwd=BACKEND_ROOT,
+        )
+        self._workers.append(worker)
+        return worker
+
+    def _discard(self, worker: asyncio.subprocess.Process) -> None:
+        if worker.returncode is None:
+            worker.kill()
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+    async def run(
+        self,
+        script_path: str,
+        args: List[str],
+        env: Dict[str, str],
+        cwd: str,
+        timeout: float,
+    ) -> Tuple[int, str, str]:
+        """Run a script on an idle worker and return (returncode, stdout, stderr).
+
+        Raises ``subprocess.TimeoutExpired`` like ``subprocess.run`` does.
+        """
+        worker = await self._idle.get()
+        try:
+            if worker is not None and worker.returncode is not None:
+                self._discard(worker)
+                worker = None
+            if worker is None:
+                worker = await self._spawn()
+            request = orjson.dumps({
+                "script": script_path,
+                "args": args,
+                "env": env,
+                "cwd": cwd,
+                "timeout": timeout,
+            })
+            worker.stdin.write(_HEADER.pack(len(request)) + request)
+            await worker.stdin.drain()
+            # The worker enforces the timeout; this only guards against a hung worker.
+            header = await asyncio.wait_for(worker.stdout.readexactly(_HEADER.size), timeout + 10)
+            body = await worker.stdout.readexactly(_HEADER.unpack(header)[0])
+        except BaseException:
+            # Protocol state is unknown (including on cancellation); replace the worker.
+            if worker is not None:
+                self._discard(worker)
+            self._idle.put_nowait(None)
+            raise
+        self._idle.put_nowait(worker)
+
+        response = orjson.loads(body)
+        if response["timed_out"]:
+            raise subprocess.TimeoutExpired([script_path, *args], timeout)
+        return response["returncode"], response["stdout"], response["stderr"]
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,16 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import GZipMiddleware
 from fastmcp import FastMCP
 from api.routers import health, chat, conversations, files, websites, scratchpad, notes, settings as user_settings, places, skills, weather, memories
 from api.mcp.tools import register_mcp_tools
 from api.config import settings
+from api.responses import OrjsonResponse
+from api.db.query_budget import QueryBudgetMiddleware, install_query_budget
+from api.db.session import engine
 from api.executors.skill_executor import SkillExecutor
+from api.security.audit_logger import AuditLogger
 from api.security.path_validator import PathValidator
 import logging
 
@@ -37,8 +42,13 @@ async def lifespan(app: FastAPI):
             workspace_base=settings.workspace_base,
             writable_paths=settings.writable_paths
         )
-        yield
-        # Cleanup happens here if needed
+        AuditLogger.start_background_logging()
+        SkillExecutor.start_worker_pool()
+        try:
+            yield
+        finally:
+            await SkillExecutor.stop_worker_pool()
+            AuditLogger.stop_background_logging()
 
 
 # Create main FastAPI app with combined lifespan
@@ -46,10 +56,41 @@ app = FastAPI(
     title="sideBar Skills API",
     description="Skills API with FastAPI REST + MCP Streamable HTTP",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
 )
 
 
+class SelectiveGZipMiddleware:
+    """GZip responses except streaming endpoints, where buffering breaks SSE."""
+
+    def __init__(self, app, minimum_size: int = 1024, excluded_prefixes: tuple[str, ...] = ()):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.excluded_prefixes = excluded_prefixes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not scope["path"].startswith(self.excluded_prefixes):
+            await self.gzip(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=1024,
+    excluded_prefixes=("/api/chat/stream", "/mcp"),
+)
+
+if settings.query_budget_per_request > 0:
+    install_query_budget(engine)
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        limit=settings.query_budget_per_request,
+        strict=settings.query_budget_strict,
+    )
+
+
 # Unified authentication middleware
 @app.middleware("http")
 async def auth_middleware(request: Request, call_next):
@@ -1,15 +1,45 @@
 """Note model for markdown notes stored in Postgres."""
-from sqlalchemy import Column, DateTime, Text
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Boolean, Column, Computed, DateTime, Index, Text, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 from datetime import datetime, timezone
 import uuid
 from api.db.base import Base
+from api.models.search import SEARCH_TSV_EXPRESSION
+
+# Mirrors NotesService.is_archived_folder.
+ARCHIVED_EXPRESSION = (
+    "coalesce((metadata->>'folder') = 'Archive' "
+    "OR (metadata->>'folder') LIKE 'Archive/%', false)"
+)
 
 
 class Note(Base):
     """Note model with markdown content and JSONB metadata."""
 
     __tablename__ = "notes"
+    __table_args__ = (
+        Index("idx_notes_search_tsv", "search_tsv", postgresql_using="gin"),
+        Index(
+            "idx_notes_user_active_updated_at",
+            "user_id",
+            text("updated_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_notes_user_unarchived_updated_at",
+            "user_id",
+            text("updated_at DESC"),
+            postgresql_where=text("deleted_at IS NULL AND archived = false"),
+        ),
+        Index(
+            "uq_notes_user_folder_marker",
+            "user_id",
+            text("(metadata->>'folder')"),
+            unique=True,
+            postgresql_where=text("(metadata->>'folder_marker') = 'true' AND deleted_at IS NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(Text, nullable=False, index=True)
@@ -20,6 +50,8 @@ class Note(Base):
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
     last_opened_at = Column(DateTime(timezone=True), nullable=True, index=True)
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    archived = Column(Boolean, Computed(ARCHIVED_EXPRESSION, persisted=True))
+    search_tsv = deferred(Column(TSVECTOR, Computed(SEARCH_TSV_EXPRESSION, persisted=True)))
 
     def __repr__(self):
         return f"<Note(id={self.id}, title='{self.title}')>"
@@ -0,0 +1,7 @@
+"""Full-text search column definitions shared by searchable models."""
+
+# Generated ``search_tsv`` column for notes and websites (title weighted over content).
+SEARCH_TSV_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
@@ -2,7 +2,7 @@
 from datetime import datetime, timezone
 import uuid
 
-from sqlalchemy import Column, DateTime, Text, UniqueConstraint, Index
+from sqlalchemy import Column, DateTime, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 
 from api.db.base import Base
@@ -14,7 +14,7 @@ class UserMemory(Base):
     __tablename__ = "user_memories"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(Text, nullable=False, index=True)
+    user_id = Column(Text, nullable=False)
     path = Column(Text, nullable=False)
     content = Column(Text, nullable=False)
     created_at = Column(
@@ -28,9 +28,10 @@ class UserMemory(Base):
         nullable=False,
     )
 
+    # The unique constraint's index serves (user_id, path) lookups and
+    # user_id prefix scans, so no separate indexes are declared.
     __table_args__ = (
         UniqueConstraint("user_id", "path", name="uq_user_memories_user_id_path"),
-        Index("idx_user_memories_user_id_path", "user_id", "path"),
     )
 
     def __repr__(self) -> str:
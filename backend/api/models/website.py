@@ -1,9 +1,10 @@
 """Website model for archived markdown content."""
-from sqlalchemy import Column, DateTime, Text, Index, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from datetime import datetime, timezone
+from sqlalchemy import Column, Computed, DateTime, Text, Index, UniqueConstraint, func, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 import uuid
 from api.db.base import Base
+from api.models.search import SEARCH_TSV_EXPRESSION
 
 
 class Website(Base):
@@ -13,6 +14,21 @@ class Website(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "url", name="uq_websites_user_id_url"),
         Index("idx_websites_user_id", "user_id"),
+        Index(
+            "idx_websites_user_active_saved_at",
+            "user_id",
+            text("saved_at DESC NULLS LAST"),
+            text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_websites_user_active_updated_at",
+            "user_id",
+            text("updated_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("idx_websites_user_last_opened_at", "user_id", text("last_opened_at DESC")),
+        Index("idx_websites_search_tsv", "search_tsv", postgresql_using="gin"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -26,10 +42,11 @@ class Website(Base):
     saved_at = Column(DateTime(timezone=True), nullable=True)
     published_at = Column(DateTime(timezone=True), nullable=True)
     metadata_ = Column("metadata", JSONB, nullable=False, default=dict)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     last_opened_at = Column(DateTime(timezone=True), nullable=True, index=True)
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    search_tsv = deferred(Column(TSVECTOR, Computed(SEARCH_TSV_EXPRESSION, persisted=True)))
 
     def __repr__(self):
         return f"<Website(id={self.id}, url='{self.url}')>"
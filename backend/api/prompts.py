@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 
 DEFAULT_COMMUNICATION_STYLE = """Use UK English.
@@ -483,26 +484,50 @@ def build_system_prompt(
     return resolve_template(SYSTEM_PROMPT_TEMPLATE, variables)
 
 
+def _profile_field(settings_record: Any, attr: str) -> str | None:
+    value = getattr(settings_record, attr) if settings_record else None
+    return value.strip() if value else None
+
+
 def build_first_message_prompt(
     settings_record: Any,
     operating_system: str | None,
     now: datetime,
 ) -> str:
-    communication_style = resolve_default(
-        settings_record.communication_style if settings_record else None,
-        DEFAULT_COMMUNICATION_STYLE,
+    # The prompt only depends on the profile fields and today's age, so the
+    # rendered text is cached on those values rather than rebuilt per chat.
+    return _render_first_message_prompt(
+        _profile_field(settings_record, "name"),
+        _profile_field(settings_record, "gender"),
+        _profile_field(settings_record, "pronouns"),
+        _profile_field(settings_record, "job_title"),
+        _profile_field(settings_record, "employer"),
+        calculate_age(settings_record.date_of_birth if settings_record else None, now.date()),
+        operating_system,
+        resolve_default(
+            settings_record.communication_style if settings_record else None,
+            DEFAULT_COMMUNICATION_STYLE,
+        ),
+        resolve_default(
+            settings_record.working_relationship if settings_record else None,
+            DEFAULT_WORKING_RELATIONSHIP,
+        ),
     )
-    working_relationship = resolve_default(
-        settings_record.working_relationship if settings_record else None,
-        DEFAULT_WORKING_RELATIONSHIP,
-    )
-    variables = build_prompt_variables(settings_record, "", None, None, operating_system, now)
-    age = variables.get("age")
-    name = variables.get("name")
-    gender = variables.get("gender")
-    pronouns = variables.get("pronouns")
-    job_title = variables.get("jobTitle")
-    employer = variables.get("employer")
+
+
+@lru_cache(maxsize=1024)
+def _render_first_message_prompt(
+    name: str | None,
+    gender: str | None,
+    pronouns: str | None,
+    job_title: str | None,
+    employer: str | None,
+    age: int | None,
+    operating_system: str | None,
+    communication_style: str,
+    working_relationship: str,
+) -> str:
+    name = name or "the user"
 
     context_lines = []
     intro_parts = []
@@ -524,11 +549,11 @@ def build_first_message_prompt(
         context_lines.append(f"I am {job_title}.")
 
     conversation_context = "\n\n".join(context_lines) if context_lines else "I am the user."
-    variables.update(
+    return resolve_template(
+        FIRST_MESSAGE_TEMPLATE,
         {
             "conversation_context": conversation_context,
             "communication_style": communication_style,
             "working_relationship": working_relationship,
-        }
+        },
     )
-    return resolve_template(FIRST_MESSAGE_TEMPLATE, variables)
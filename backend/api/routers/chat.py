@@ -1,7 +1,8 @@
 """Chat router with SSE streaming support."""
-import json
 import os
 from datetime import datetime, timezone
+
+import orjson
 from fastapi import APIRouter, Request, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
@@ -20,6 +21,31 @@ from api.models.conversation import Conversation
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# SSE frame prefixes. Events in _SSE_PREFIXES are sent whole; events in
+# _SSE_DATA_PREFIXES forward only their "data" payload.
+_SSE_PREFIXES = {
+    event_type: f"event: {event_type}\ndata: ".encode()
+    for event_type in ("token", "tool_call", "tool_result", "error")
+}
+_SSE_DATA_PREFIXES = {
+    event_type: f"event: {event_type}\ndata: ".encode()
+    for event_type in (
+        "note_created",
+        "note_updated",
+        "website_saved",
+        "note_deleted",
+        "website_deleted",
+        "ui_theme_set",
+        "scratchpad_updated",
+        "scratchpad_cleared",
+        "prompt_preview",
+        "tool_start",
+        "tool_end",
+    )
+}
+ERROR_PREFIX = _SSE_PREFIXES["error"]
+COMPLETE_FRAME = b"event: complete\ndata: {}\n\n"
+
 
 def _build_history(messages, user_message_id, latest_message):
     history = []
@@ -89,7 +115,7 @@ async def stream_chat(
         - complete: Stream finished
         - error: Error occurred
     """
-    data = await request.json()
+    data = orjson.loads(await request.body())
     message = data.get("message")
     conversation_id = data.get("conversation_id")
     user_message_id = data.get("user_message_id")
@@ -126,6 +152,7 @@ async def stream_chat(
         current_location_levels=current_location_levels,
         current_weather=current_weather,
         now=now,
+        settings_record=settings_record,
     )
     enabled_skills = _resolve_enabled_skills(settings_record)
     if not history:
@@ -156,44 +183,23 @@ async def stream_chat(
             ):
                 event_type = event.get("type")
 
-                if event_type == "token":
-                    # Stream text token
-                    yield f"event: token\ndata: {json.dumps(event)}\n\n"
-
-                elif event_type == "tool_call":
-                    # Tool execution started
-                    yield f"event: tool_call\ndata: {json.dumps(event)}\n\n"
-
-                elif event_type == "tool_result":
-                    # Tool execution completed
-                    yield f"event: tool_result\ndata: {json.dumps(event)}\n\n"
-
-                elif event_type in {
-                    "note_created",
-                    "note_updated",
-                    "website_saved",
-                    "note_deleted",
-                    "website_deleted",
-                    "ui_theme_set",
-                    "scratchpad_updated",
-                    "scratchpad_cleared",
-                    "prompt_preview",
-                    "tool_start",
-                    "tool_end",
-                }:
-                    yield f"event: {event_type}\ndata: {json.dumps(event.get('data', {}))}\n\n"
-
-                elif event_type == "error":
-                    # Error occurred
-                    yield f"event: error\ndata: {json.dumps(event)}\n\n"
-                    return
+                prefix = _SSE_PREFIXES.get(event_type)
+                if prefix is not None:
+                    yield prefix + orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+                    if event_type == "error":
+                        return
+                    continue
+
+                prefix = _SSE_DATA_PREFIXES.get(event_type)
+                if prefix is not None:
+                    yield prefix + orjson.dumps(event.get("data", {}), option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
 
             # Stream complete
-            yield f"event: complete\ndata: {{}}\n\n"
+            yield COMPLETE_FRAME
 
         except Exception as e:
             error_event = {"type": "error", "error": str(e)}
-            yield f"event: error\ndata: {json.dumps(error_event)}\n\n"
+            yield ERROR_PREFIX + orjson.dumps(error_event, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -226,7 +232,7 @@ async def generate_title(
             "fallback": false  # true if fallback was used
         }
     """
-    data = await request.json()
+    data = orjson.loads(await request.body())
     conversation_id = data.get("conversation_id")
 
     if not conversation_id:
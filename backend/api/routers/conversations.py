@@ -57,7 +57,7 @@ router = APIRouter(prefix="/conversations", tags=["conversations"])
 
 
 @router.post("/", response_model=ConversationResponse)
-async def create_conversation(
+def create_conversation(
     data: ConversationCreate,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -84,7 +84,7 @@ async def create_conversation(
 
 
 @router.get("/", response_model=List[ConversationResponse])
-async def list_conversations(
+def list_conversations(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
@@ -118,7 +118,7 @@ async def list_conversations(
 
 
 @router.get("/{conversation_id}", response_model=ConversationWithMessages)
-async def get_conversation(
+def get_conversation(
     conversation_id: UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -145,7 +145,7 @@ async def get_conversation(
 
 
 @router.post("/{conversation_id}/messages")
-async def add_message(
+def add_message(
     conversation_id: UUID,
     message: MessageCreate,
     user_id: str = Depends(get_current_user_id),
@@ -183,7 +183,7 @@ async def add_message(
 
 
 @router.put("/{conversation_id}")
-async def update_conversation(
+def update_conversation(
     conversation_id: UUID,
     updates: ConversationUpdate,
     user_id: str = Depends(get_current_user_id),
@@ -213,7 +213,7 @@ async def update_conversation(
 
 
 @router.delete("/{conversation_id}")
-async def delete_conversation(
+def delete_conversation(
     conversation_id: UUID,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -235,7 +235,7 @@ async def delete_conversation(
 
 
 @router.post("/search", response_model=List[ConversationResponse])
-async def search_conversations(
+def search_conversations(
     query: str,
     limit: int = 10,
     user_id: str = Depends(get_current_user_id),
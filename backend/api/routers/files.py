@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import mimetypes
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.auth import verify_bearer_token
@@ -20,6 +22,11 @@ router = APIRouter(prefix="/files", tags=["files"])
 
 storage_backend = get_storage_backend()
 
+TREE_CACHE_TTL_SECONDS = 5.0
+TREE_CACHE_MAX_ENTRIES = 1024
+# (user_id, base_path) -> (prefix version, built at, payload), oldest entry first.
+_tree_cache: Dict[tuple[str, str], tuple[tuple, float, Dict[str, Any]]] = {}
+
 
 def _normalize_base_path(base_path: str) -> str:
     return (base_path or "").strip("/")
@@ -49,6 +56,23 @@ def _bucket_key(user_id: str, full_path: str) -> str:
     return f"{user_id}/{full_path.strip('/')}"
 
 
+async def _move_folder(db: Session, user_id: str, old_full_path: str, new_full_path: str) -> None:
+    """Move stored objects one by one, then rewrite their records in a single UPDATE."""
+    records = FilesService.list_by_prefix(db, user_id, f"{old_full_path}/")
+    for item in records:
+        if item.category == "folder":
+            continue
+        new_key = _bucket_key(user_id, item.path.replace(old_full_path, new_full_path, 1))
+        await run_in_threadpool(storage_backend.move_object, item.bucket_key, new_key)
+    FilesService.move_prefix_ids(
+        db, user_id, [item.id for item in records], old_full_path, new_full_path
+    )
+
+
+def _tree_sort_key(item: Dict[str, Any]) -> tuple[bool, str]:
+    return item["type"] != "directory", item["name"].lower()
+
+
 def _build_tree_from_records(records: list, base_path: str) -> Dict[str, Any]:
     root = {
         "name": base_path or "files",
@@ -115,15 +139,12 @@ def _build_tree_from_records(records: list, base_path: str) -> Dict[str, Any]:
             }
         )
 
-    def sort_children(node: Dict[str, Any]) -> None:
-        node["children"].sort(
-            key=lambda item: (item.get("type") != "directory", item.get("name", "").lower())
-        )
-        for child in node["children"]:
-            if child.get("type") == "directory":
-                sort_children(child)
-
-    sort_children(root)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        children = node["children"]
+        children.sort(key=_tree_sort_key)
+        stack.extend(child for child in children if child["type"] == "directory")
     return root
 
 
@@ -148,9 +169,21 @@ async def get_file_tree(
         }
     """
     base_path = _normalize_base_path(basePath)
+    cache_key = (user_id, base_path)
+    version = FilesService.prefix_version(db, user_id, base_path)
+    cached = _tree_cache.get(cache_key)
+    now = time.monotonic()
+    if cached and cached[0] == version and now - cached[1] < TREE_CACHE_TTL_SECONDS:
+        return cached[2]
+
     records = FilesService.list_by_prefix(db, user_id, base_path)
     tree = _build_tree_from_records(records, base_path)
-    return {"children": tree.get("children", [])}
+    payload = {"children": tree.get("children", [])}
+    _tree_cache.pop(cache_key, None)
+    while len(_tree_cache) >= TREE_CACHE_MAX_ENTRIES:
+        del _tree_cache[next(iter(_tree_cache))]
+    _tree_cache[cache_key] = (version, now, payload)
+    return payload
 
 
 @router.post("/search")
@@ -260,26 +293,14 @@ async def rename_file_or_folder(
     if not is_folder:
         old_key = record.bucket_key
         new_key = _bucket_key(user_id, new_full_path)
-        storage_backend.move_object(old_key, new_key)
+        await run_in_threadpool(storage_backend.move_object, old_key, new_key)
         record.path = new_full_path
         record.bucket_key = new_key
         record.updated_at = datetime.now(timezone.utc)
         db.commit()
         return {"success": True, "newPath": new_rel}
 
-    records = FilesService.list_by_prefix(db, user_id, f"{old_full_path}/")
-    for item in records:
-        if item.category == "folder":
-            item.path = item.path.replace(old_full_path, new_full_path, 1)
-            item.bucket_key = _bucket_key(user_id, f"{item.path}/")
-            item.updated_at = datetime.now(timezone.utc)
-            continue
-        old_key = item.bucket_key
-        item.path = item.path.replace(old_full_path, new_full_path, 1)
-        item.bucket_key = _bucket_key(user_id, item.path)
-        item.updated_at = datetime.now(timezone.utc)
-        storage_backend.move_object(old_key, item.bucket_key)
-    db.commit()
+    await _move_folder(db, user_id, old_full_path, new_full_path)
     return {"success": True, "newPath": new_rel}
 
 
@@ -327,26 +348,14 @@ async def move_file_or_folder(
     if not is_folder:
         old_key = record.bucket_key
         new_key = _bucket_key(user_id, new_full_path)
-        storage_backend.move_object(old_key, new_key)
+        await run_in_threadpool(storage_backend.move_object, old_key, new_key)
         record.path = new_full_path
         record.bucket_key = new_key
         record.updated_at = datetime.now(timezone.utc)
         db.commit()
         return {"success": True, "newPath": _relative_path(base_path, new_full_path)}
 
-    records = FilesService.list_by_prefix(db, user_id, f"{full_path}/")
-    for item in records:
-        if item.category == "folder":
-            item.path = item.path.replace(full_path, new_full_path, 1)
-            item.bucket_key = _bucket_key(user_id, f"{item.path}/")
-            item.updated_at = datetime.now(timezone.utc)
-            continue
-        old_key = item.bucket_key
-        item.path = item.path.replace(full_path, new_full_path, 1)
-        item.bucket_key = _bucket_key(user_id, item.path)
-        item.updated_at = datetime.now(timezone.utc)
-        storage_backend.move_object(old_key, item.bucket_key)
-    db.commit()
+    await _move_folder(db, user_id, full_path, new_full_path)
     return {"success": True, "newPath": _relative_path(base_path, new_full_path)}
 
 
@@ -375,7 +384,7 @@ async def delete_file_or_folder(
     full_path = _full_path(base_path, path)
     record = FilesService.get_by_path(db, user_id, full_path)
     if record:
-        storage_backend.delete_object(record.bucket_key)
+        await run_in_threadpool(storage_backend.delete_object, record.bucket_key)
         FilesService.mark_deleted(db, user_id, full_path)
         return {"success": True}
 
@@ -385,8 +394,8 @@ async def delete_file_or_folder(
 
     for item in records:
         if item.category != "folder":
-            storage_backend.delete_object(item.bucket_key)
-        FilesService.mark_deleted(db, user_id, item.path)
+            await run_in_threadpool(storage_backend.delete_object, item.bucket_key)
+    FilesService.mark_deleted_ids(db, user_id, [item.id for item in records])
     return {"success": True}
 
 
@@ -405,10 +414,9 @@ async def download_file(
     if not record or record.category == "folder":
         raise HTTPException(status_code=404, detail="File not found")
 
-    content = storage_backend.get_object(record.bucket_key)
     content_type = record.content_type or mimetypes.guess_type(path)[0] or "application/octet-stream"
-    return Response(
-        content,
+    return StreamingResponse(
+        storage_backend.iter_object(record.bucket_key),
         media_type=content_type,
         headers={"Content-Disposition": f'attachment; filename="{Path(path).name}"'},
     )
@@ -445,26 +453,19 @@ async def get_file_content(
     if not record or record.category == "folder":
         raise HTTPException(status_code=404, detail="File not found")
 
-    content = storage_backend.get_object(record.bucket_key)
-    if record.content_type and record.content_type.startswith("text/"):
-        return {
-            "content": content.decode("utf-8"),
-            "name": Path(path).name,
-            "path": path,
-            "modified": record.updated_at.timestamp() if record.updated_at else None,
-        }
-
+    content = await run_in_threadpool(storage_backend.get_object, record.bucket_key)
     try:
         decoded = content.decode("utf-8")
-        return {
-            "content": decoded,
-            "name": Path(path).name,
-            "path": path,
-            "modified": record.updated_at.timestamp() if record.updated_at else None,
-        }
     except UnicodeDecodeError:
         raise HTTPException(status_code=400, detail="File is not a text file")
 
+    return {
+        "content": decoded,
+        "name": Path(path).name,
+        "path": path,
+        "modified": record.updated_at.timestamp() if record.updated_at else None,
+    }
+
 
 @router.post("/content")
 async def update_file_content(
@@ -499,7 +500,7 @@ async def update_file_content(
     full_path = _full_path(base_path, path)
     bucket_key = _bucket_key(user_id, full_path)
     data = content.encode("utf-8")
-    storage_backend.put_object(bucket_key, data, content_type="text/plain")
+    await run_in_threadpool(storage_backend.put_object, bucket_key, data, content_type="text/plain")
     record = FilesService.upsert_file(
         db,
         user_id,
@@ -4,18 +4,25 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, load_only
+from sqlalchemy import exists, func, lambda_stmt, literal_column, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
 
 from api.auth import verify_bearer_token
 from api.db.dependencies import get_current_user_id
 from api.db.session import get_db
 from api.models.note import Note
+from api.responses import OrjsonResponse
+from api.services.markdown_download import markdown_download_response
 from api.services.notes_service import NotesService, NoteNotFoundError
+from api.services.prompt_context_service import PromptContextService
+from api.services.text_search import apply_search, escape_like
 
 router = APIRouter(prefix="/notes", tags=["notes"])
 
+FOLDER_MARKER_INDEX_EXPRESSION = text("(metadata->>'folder')")
+FOLDER_MARKER_INDEX_WHERE = text("(metadata->>'folder_marker') = 'true' AND deleted_at IS NULL")
+
 
 def require_note_id(value: str):
     note_id = NotesService.parse_note_id(value)
@@ -24,25 +31,74 @@ def require_note_id(value: str):
     return note_id
 
 
+def _folder_filter(path: str):
+    """Match notes in ``path`` or any of its subfolders (served by the folder index)."""
+    folder = Note.metadata_["folder"].astext
+    return or_(folder == path, folder.like(f"{escape_like(path)}/%", escape="\\"))
+
+
+def _move_folder_prefix(db: Session, user_id: str, old_path: str, new_folder: str) -> None:
+    folder = Note.metadata_["folder"].astext
+    updated_folder = func.concat(new_folder, func.substr(folder, len(old_path) + 1))
+
+    # Drop markers that would collide with a marker already at the destination.
+    target = aliased(Note)
+    db.query(Note).filter(
+        Note.user_id == user_id,
+        Note.deleted_at.is_(None),
+        Note.metadata_["folder_marker"].astext == "true",
+        _folder_filter(old_path),
+        exists().where(
+            target.user_id == user_id,
+            target.id != Note.id,
+            target.deleted_at.is_(None),
+            target.metadata_["folder_marker"].astext == "true",
+            target.metadata_["folder"].astext == updated_folder,
+        ),
+    ).update({Note.deleted_at: func.now(), Note.updated_at: func.now()}, synchronize_session=False)
+
+    db.query(Note).filter(
+        Note.user_id == user_id,
+        Note.deleted_at.is_(None),
+        _folder_filter(old_path),
+    ).update(
+        {
+            Note.metadata_: func.jsonb_set(
+                Note.metadata_, literal_column("'{folder}'::text[]"), func.to_jsonb(updated_folder)
+            ),
+            Note.updated_at: func.now(),
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+
 @router.get("/tree")
-async def list_notes_tree(
+def list_notes_tree(
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
-    notes = (
-        db.query(Note)
-        .options(load_only(Note.id, Note.title, Note.metadata_, Note.updated_at))
-        .filter(Note.user_id == user_id, Note.deleted_at.is_(None))
-        .order_by(Note.updated_at.desc())
-        .all()
+    stmt = lambda_stmt(
+        lambda: select(
+            Note.id,
+            Note.title,
+            Note.metadata_["folder"].astext.label("folder"),
+            Note.metadata_["pinned"].astext.label("pinned"),
+            Note.metadata_["folder_marker"].astext.label("folder_marker"),
+            Note.archived,
+            Note.updated_at,
+        )
     )
+    stmt += lambda s: s.where(Note.user_id == user_id, Note.deleted_at.is_(None))
+    stmt += lambda s: s.order_by(Note.updated_at.desc())
+    notes = db.execute(stmt).all()
     tree = NotesService.build_notes_tree(notes)
-    return {"children": tree.get("children", [])}
+    return OrjsonResponse({"children": tree.get("children", [])})
 
 
 @router.post("/search")
-async def search_notes(
+def search_notes(
     query: str,
     limit: int = 50,
     user_id: str = Depends(get_current_user_id),
@@ -52,39 +108,29 @@ async def search_notes(
     if not query:
         raise HTTPException(status_code=400, detail="query required")
 
-    notes = (
-        db.query(Note)
-        .filter(
-            Note.user_id == user_id,
-            Note.deleted_at.is_(None),
-            or_(
-                Note.title.ilike(f"%{query}%"),
-                Note.content.ilike(f"%{query}%"),
-            ),
-        )
-        .order_by(Note.updated_at.desc())
-        .limit(limit)
-        .all()
-    )
+    stmt = lambda_stmt(lambda: select(Note))
+    stmt += lambda s: s.where(Note.user_id == user_id, Note.deleted_at.is_(None))
+    stmt = apply_search(stmt, Note, query)
+    stmt += lambda s: s.limit(limit)
+    notes = db.execute(stmt).scalars().all()
 
     items = []
     for note in notes:
         metadata = note.metadata_ or {}
-        folder = metadata.get("folder") or ""
         items.append({
             "name": f"{note.title}.md",
             "path": str(note.id),
             "type": "file",
             "modified": note.updated_at.timestamp() if note.updated_at else None,
             "pinned": bool(metadata.get("pinned")),
-            "archived": NotesService.is_archived_folder(folder)
+            "archived": note.archived
         })
 
-    return {"items": items}
+    return OrjsonResponse({"items": items})
 
 
 @router.post("/folders")
-async def create_folder(
+def create_folder(
     request: dict,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
@@ -94,30 +140,34 @@ async def create_folder(
     if not path:
         raise HTTPException(status_code=400, detail="path required")
 
-    notes = db.query(Note).filter(Note.user_id == user_id, Note.deleted_at.is_(None)).all()
-    for note in notes:
-        note_folder = (note.metadata_ or {}).get("folder") or ""
-        if note_folder == path or note_folder.startswith(f"{path}/"):
-            return {"success": True, "exists": True}
-
     now = datetime.now(timezone.utc)
-    note = Note(
-        user_id=user_id,
-        title="__folder__",
-        content="",
-        metadata_={"folder": path, "pinned": False, "folder_marker": True},
-        created_at=now,
-        updated_at=now,
-        last_opened_at=None,
-        deleted_at=None
-    )
-    db.add(note)
+    # The unique marker index makes this idempotent in a single statement.
+    inserted = db.execute(
+        insert(Note)
+        .values(
+            user_id=user_id,
+            title="__folder__",
+            content="",
+            metadata_={"folder": path, "pinned": False, "folder_marker": True},
+            created_at=now,
+            updated_at=now,
+            last_opened_at=None,
+            deleted_at=None,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[Note.user_id, FOLDER_MARKER_INDEX_EXPRESSION],
+            index_where=FOLDER_MARKER_INDEX_WHERE,
+        )
+        .returning(Note.id)
+    ).first()
     db.commit()
-    return {"success": True, "id": str(note.id)}
+    if inserted is None:
+        return {"success": True, "exists": True}
+    return {"success": True, "id": str(inserted.id)}
 
 
 @router.patch("/folders/rename")
-async def rename_folder(
+def rename_folder(
     request: dict,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
@@ -131,19 +181,12 @@ async def rename_folder(
     parent = "/".join(old_path.split("/")[:-1])
     new_folder = f"{parent}/{new_name}".strip("/") if parent else new_name
 
-    notes = db.query(Note).filter(Note.user_id == user_id, Note.deleted_at.is_(None)).all()
-    for note in notes:
-        folder = (note.metadata_ or {}).get("folder") or ""
-        if folder == old_path or folder.startswith(f"{old_path}/"):
-            updated_folder = folder.replace(old_path, new_folder, 1)
-            note.metadata_ = {**(note.metadata_ or {}), "folder": updated_folder}
-            note.updated_at = datetime.now(timezone.utc)
-    db.commit()
+    _move_folder_prefix(db, user_id, old_path, new_folder)
     return {"success": True, "newPath": f"folder:{new_folder}"}
 
 
 @router.patch("/folders/move")
-async def move_folder(
+def move_folder(
     request: dict,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
@@ -160,19 +203,12 @@ async def move_folder(
     basename = old_path.split("/")[-1]
     new_folder = f"{new_parent}/{basename}".strip("/") if new_parent else basename
 
-    notes = db.query(Note).filter(Note.user_id == user_id, Note.deleted_at.is_(None)).all()
-    for note in notes:
-        folder = (note.metadata_ or {}).get("folder") or ""
-        if folder == old_path or folder.startswith(f"{old_path}/"):
-            updated_folder = folder.replace(old_path, new_folder, 1)
-            note.metadata_ = {**(note.metadata_ or {}), "folder": updated_folder}
-            note.updated_at = datetime.now(timezone.utc)
-    db.commit()
+    _move_folder_prefix(db, user_id, old_path, new_folder)
     return {"success": True, "newPath": f"folder:{new_folder}"}
 
 
 @router.delete("/folders")
-async def delete_folder(
+def delete_folder(
     request: dict,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
@@ -182,48 +218,45 @@ async def delete_folder(
     if not path:
         raise HTTPException(status_code=400, detail="path required")
 
-    notes = db.query(Note).filter(Note.user_id == user_id, Note.deleted_at.is_(None)).all()
-    now = datetime.now(timezone.utc)
-    for note in notes:
-        note_folder = (note.metadata_ or {}).get("folder") or ""
-        if note_folder == path or note_folder.startswith(f"{path}/"):
-            note.deleted_at = now
-            note.updated_at = now
+    db.query(Note).filter(
+        Note.user_id == user_id,
+        Note.deleted_at.is_(None),
+        _folder_filter(path),
+    ).update({Note.deleted_at: func.now(), Note.updated_at: func.now()}, synchronize_session=False)
     db.commit()
     return {"success": True}
 
 
 @router.get("/{note_id}")
-async def get_note(
+def get_note(
     note_id: str,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
     note_uuid = require_note_id(note_id)
-    note = (
-        db.query(Note)
-        .filter(Note.user_id == user_id, Note.id == note_uuid, Note.deleted_at.is_(None))
-        .first()
-    )
+    # Read the note and stamp last_opened_at in a single round-trip.
+    note = db.execute(
+        update(Note)
+        .where(Note.user_id == user_id, Note.id == note_uuid, Note.deleted_at.is_(None))
+        .values(last_opened_at=func.now())
+        .returning(Note.id, Note.title, Note.content, Note.updated_at)
+    ).first()
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
-
-    content = note.content
-    title = note.title
-    modified = note.updated_at.timestamp() if note.updated_at else None
-    note.last_opened_at = datetime.now(timezone.utc)
     db.commit()
+    PromptContextService.invalidate_recent_activity(user_id)
+
     return {
-        "content": content,
-        "name": f"{title}.md",
+        "content": note.content,
+        "name": f"{note.title}.md",
         "path": str(note.id),
-        "modified": modified
+        "modified": note.updated_at.timestamp() if note.updated_at else None
     }
 
 
 @router.post("")
-async def create_note(
+def create_note(
     request: dict,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
@@ -246,7 +279,7 @@ async def create_note(
 
 
 @router.patch("/{note_id}")
-async def update_note(
+def update_note(
     note_id: str,
     request: dict,
     user_id: str = Depends(get_current_user_id),
@@ -267,7 +300,7 @@ async def update_note(
 
 
 @router.patch("/{note_id}/rename")
-async def rename_note(
+def rename_note(
     note_id: str,
     request: dict,
     user_id: str = Depends(get_current_user_id),
@@ -279,24 +312,15 @@ async def rename_note(
         raise HTTPException(status_code=400, detail="newName required")
 
     note_uuid = require_note_id(note_id)
-    note = (
-        db.query(Note)
-        .filter(Note.user_id == user_id, Note.id == note_uuid, Note.deleted_at.is_(None))
-        .first()
-    )
-    if not note:
+    try:
+        note = NotesService.rename_note(db, user_id, note_uuid, Path(new_name).stem)
+    except NoteNotFoundError:
         raise HTTPException(status_code=404, detail="Note not found")
-
-    title = Path(new_name).stem
-    note.title = title
-    note.content = NotesService.update_content_title(note.content, title)
-    note.updated_at = datetime.now(timezone.utc)
-    db.commit()
     return {"success": True, "newPath": str(note.id)}
 
 
 @router.delete("/{note_id}")
-async def delete_note(
+def delete_note(
     note_id: str,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
@@ -310,7 +334,7 @@ async def delete_note(
 
 
 @router.get("/{note_id}/download")
-async def download_note(
+def download_note(
     note_id: str,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
@@ -318,20 +342,18 @@ async def download_note(
 ):
     note_uuid = require_note_id(note_id)
     note = (
-        db.query(Note)
+        db.query(Note.title, Note.content, func.octet_length(Note.content).label("byte_length"))
         .filter(Note.user_id == user_id, Note.id == note_uuid, Note.deleted_at.is_(None))
         .first()
     )
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
 
-    filename = f"{note.title}.md"
-    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-    return Response(note.content or "", media_type="text/markdown", headers=headers)
+    return markdown_download_response(note.title, note.content, note.byte_length)
 
 
 @router.patch("/{note_id}/pin")
-async def update_pin(
+def update_pin(
     note_id: str,
     request: dict,
     user_id: str = Depends(get_current_user_id),
@@ -350,7 +372,7 @@ async def update_pin(
 
 
 @router.patch("/{note_id}/move")
-async def update_folder(
+def update_folder(
     note_id: str,
     request: dict,
     user_id: str = Depends(get_current_user_id),
@@ -369,7 +391,7 @@ async def update_folder(
 
 
 @router.patch("/{note_id}/archive")
-async def update_archive(
+def update_archive(
     note_id: str,
     request: dict,
     user_id: str = Depends(get_current_user_id),
@@ -19,7 +19,7 @@ def ensure_title(content: str) -> str:
 
 
 @router.get("")
-async def get_scratchpad(
+def get_scratchpad(
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db)
@@ -43,7 +43,7 @@ async def get_scratchpad(
 
 
 @router.post("")
-async def update_scratchpad(
+def update_scratchpad(
     request: dict,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
@@ -72,7 +72,7 @@ async def update_scratchpad(
 
 
 @router.delete("")
-async def clear_scratchpad(
+def clear_scratchpad(
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db)
@@ -1,43 +1,46 @@
 """Websites router for archived web content in Postgres."""
-import uuid
-from sqlalchemy import or_
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import Response
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.orm import Session
 from api.auth import verify_bearer_token
 from api.db.dependencies import get_current_user_id
 from api.db.session import get_db
 from api.models.website import Website
+from api.responses import OrjsonResponse
+from api.services.markdown_download import markdown_download_response
+from api.services.prompt_context_service import PromptContextService
 from api.services.websites_service import WebsitesService, WebsiteNotFoundError
+from api.services.text_search import apply_search
+from api.services.ids import is_uuid
 
 router = APIRouter(prefix="/websites", tags=["websites"])
 
 
-def parse_website_id(value: str):
-    try:
-        return uuid.UUID(value)
-    except (ValueError, TypeError):
+def parse_website_id(value: str) -> str:
+    if not is_uuid(value):
         raise HTTPException(status_code=400, detail="Invalid website id")
+    return value
 
 
 def website_summary(website: Website) -> dict:
+    """Summary payload; datetimes are left for the response encoder to serialize."""
     metadata = website.metadata_ or {}
     return {
         "id": str(website.id),
         "title": website.title,
         "url": website.url,
         "domain": website.domain,
-        "saved_at": website.saved_at.isoformat() if website.saved_at else None,
-        "published_at": website.published_at.isoformat() if website.published_at else None,
+        "saved_at": website.saved_at,
+        "published_at": website.published_at,
         "pinned": metadata.get("pinned", False),
         "archived": metadata.get("archived", False),
-        "updated_at": website.updated_at.isoformat() if website.updated_at else None,
-        "last_opened_at": website.last_opened_at.isoformat() if website.last_opened_at else None
+        "updated_at": website.updated_at,
+        "last_opened_at": website.last_opened_at
     }
 
 
 @router.get("")
-async def list_websites(
+def list_websites(
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db)
@@ -45,11 +48,11 @@ async def list_websites(
     websites = (
         WebsitesService.list_websites(db, user_id)
     )
-    return {"items": [website_summary(site) for site in websites]}
+    return OrjsonResponse({"items": [website_summary(site) for site in websites]})
 
 
 @router.post("/search")
-async def search_websites(
+def search_websites(
     query: str,
     limit: int = 50,
     user_id: str = Depends(get_current_user_id),
@@ -59,21 +62,12 @@ async def search_websites(
     if not query:
         raise HTTPException(status_code=400, detail="query required")
 
-    websites = (
-        db.query(Website)
-        .filter(
-            Website.user_id == user_id,
-            Website.deleted_at.is_(None),
-            or_(
-                Website.title.ilike(f"%{query}%"),
-                Website.content.ilike(f"%{query}%"),
-            ),
-        )
-        .order_by(Website.updated_at.desc())
-        .limit(limit)
-        .all()
-    )
-    return {"items": [website_summary(site) for site in websites]}
+    stmt = lambda_stmt(lambda: select(Website))
+    stmt += lambda s: s.where(Website.user_id == user_id, Website.deleted_at.is_(None))
+    stmt = apply_search(stmt, Website, query)
+    stmt += lambda s: s.limit(limit)
+    websites = db.execute(stmt).scalars().all()
+    return OrjsonResponse({"items": [website_summary(site) for site in websites]})
 
 
 @router.post("/save")
@@ -97,15 +91,18 @@ async def save_website(
 
 
 @router.get("/{website_id}")
-async def get_website(
+def get_website(
     website_id: str,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db)
 ):
-    website = WebsitesService.get_website(db, user_id, website_id, mark_opened=True)
+    website = WebsitesService.get_website(
+        db, user_id, parse_website_id(website_id), mark_opened=True
+    )
     if not website:
         raise HTTPException(status_code=404, detail="Website not found")
+    PromptContextService.invalidate_recent_activity(user_id)
 
     return {
         **website_summary(website),
@@ -116,7 +113,7 @@ async def get_website(
 
 
 @router.patch("/{website_id}/pin")
-async def update_pin(
+def update_pin(
     website_id: str,
     request: dict,
     user_id: str = Depends(get_current_user_id),
@@ -134,7 +131,7 @@ async def update_pin(
 
 
 @router.patch("/{website_id}/rename")
-async def update_title(
+def update_title(
     website_id: str,
     request: dict,
     user_id: str = Depends(get_current_user_id),
@@ -154,7 +151,7 @@ async def update_title(
 
 
 @router.patch("/{website_id}/archive")
-async def update_archive(
+def update_archive(
     website_id: str,
     request: dict,
     user_id: str = Depends(get_current_user_id),
@@ -172,30 +169,39 @@ async def update_archive(
 
 
 @router.get("/{website_id}/download")
-async def download_website(
+def download_website(
     website_id: str,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db)
 ):
-    website_uuid = parse_website_id(website_id)
-    website = WebsitesService.get_website(db, user_id, website_uuid, mark_opened=False)
+    website = (
+        db.query(
+            Website.title,
+            Website.content,
+            func.octet_length(Website.content).label("byte_length"),
+        )
+        .filter(
+            Website.user_id == user_id,
+            Website.id == parse_website_id(website_id),
+            Website.deleted_at.is_(None),
+        )
+        .first()
+    )
     if not website:
         raise HTTPException(status_code=404, detail="Website not found")
 
-    filename = f"{website.title}.md"
-    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-    return Response(website.content or "", media_type="text/markdown", headers=headers)
+    return markdown_download_response(website.title, website.content, website.byte_length)
 
 
 @router.delete("/{website_id}")
-async def delete_website(
+def delete_website(
     website_id: str,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db)
 ):
-    deleted = WebsitesService.delete_website(db, user_id, website_id)
+    deleted = WebsitesService.delete_website(db, user_id, parse_website_id(website_id))
     if not deleted:
         raise HTTPException(status_code=404, detail="Website not found")
 
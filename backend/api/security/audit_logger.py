@@ -1,12 +1,40 @@
 """Structured audit logging for all tool calls."""
 import json
 import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 from pathlib import Path
 
 logger = logging.getLogger("sidebar.audit")
 
+_queue_handler: Optional[QueueHandler] = None
+_queue_listener: Optional[QueueListener] = None
+
+
+class _JsonMessage:
+    """Log argument that JSON-encodes the audit entry only when formatted."""
+
+    __slots__ = ("entry",)
+
+    def __init__(self, entry: dict[str, Any]):
+        self.entry = entry
+
+    def __str__(self) -> str:
+        return json.dumps(self.entry)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue records unformatted so encoding happens on the listener thread.
+
+    Audit entries are built fresh per call and not mutated afterwards, so the
+    record can safely cross threads as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
 class AuditLogger:
     """Log all tool calls with structured data for audit trails."""
@@ -22,6 +50,10 @@ class AuditLogger:
         user_id: Optional[str] = None
     ):
         """Log a tool call with all relevant metadata."""
+        level = logging.INFO if success else logging.ERROR
+        if not logger.isEnabledFor(level):
+            return
+
         # Redact secrets from parameters
         safe_params = AuditLogger._redact_secrets(parameters)
 
@@ -37,9 +69,39 @@ class AuditLogger:
         }
 
         if success:
-            logger.info(f"TOOL_CALL: {json.dumps(audit_entry)}")
+            logger.info("TOOL_CALL: %s", _JsonMessage(audit_entry))
         else:
-            logger.error(f"TOOL_CALL_FAILED: {json.dumps(audit_entry)}")
+            logger.error("TOOL_CALL_FAILED: %s", _JsonMessage(audit_entry))
+
+    @staticmethod
+    def start_background_logging() -> None:
+        """Hand audit records to a background thread so tool calls skip encoding and I/O.
+
+        Records are written by the root logger's handlers, as before, from a
+        QueueListener; call ``stop_background_logging`` to flush on shutdown.
+        """
+        global _queue_handler, _queue_listener
+        handlers = logging.getLogger().handlers
+        if _queue_listener is not None or not handlers:
+            return
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handler = _DeferredQueueHandler(records)
+        _queue_listener = QueueListener(records, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        logger.addHandler(_queue_handler)
+        logger.propagate = False
+
+    @staticmethod
+    def stop_background_logging() -> None:
+        """Flush queued audit records and log synchronously again."""
+        global _queue_handler, _queue_listener
+        if _queue_listener is None:
+            return
+        logger.removeHandler(_queue_handler)
+        logger.propagate = True
+        _queue_listener.stop()
+        _queue_handler = None
+        _queue_listener = None
 
     @staticmethod
     def _redact_secrets(params: dict[str, Any]) -> dict[str, Any]:
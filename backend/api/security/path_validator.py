@@ -1,8 +1,14 @@
 """Centralized path validation and jailing."""
+import os
 from pathlib import Path
 from typing import Tuple
 from fastapi import HTTPException, status
 
+R2_PATH_CACHE_MAX_ENTRIES = 1024
+# (workspace_base, path) -> resolved Path. R2 checks are string-only, so the
+# result can be shared by every validator for the same workspace.
+_r2_path_cache: dict[tuple[Path, str], Path] = {}
+
 
 class PathValidator:
     """
@@ -34,6 +40,10 @@ class PathValidator:
             settings = None
 
         if settings and settings.storage_backend.lower() == "r2":
+            key = (self.workspace_base, path)
+            cached = _r2_path_cache.get(key)
+            if cached is not None:
+                return cached
             if ".." in path:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -50,8 +60,13 @@ class PathValidator:
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Path not writable: profile-images"
                 )
-            return (self.workspace_base / normalized).resolve()
+            resolved = (self.workspace_base / normalized).resolve()
+            if len(_r2_path_cache) >= R2_PATH_CACHE_MAX_ENTRIES:
+                _r2_path_cache.clear()
+            _r2_path_cache[key] = resolved
+            return resolved
 
+        # Local checks hit the filesystem (symlinks), so they are never cached.
         # Reject obvious traversal attempts
         if ".." in path:
             raise HTTPException(
@@ -73,9 +88,7 @@ class PathValidator:
             )
 
         # Ensure path is within workspace
-        try:
-            abs_path.relative_to(self.workspace_base)
-        except ValueError:
+        if not self._is_relative_to(abs_path, self.workspace_base):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Path outside workspace: {path}"
@@ -101,9 +114,9 @@ class PathValidator:
 
     @staticmethod
     def _is_relative_to(path: Path, parent: Path) -> bool:
-        """Check if path is relative to parent (Python 3.9+ has this built-in)."""
-        try:
-            path.relative_to(parent)
+        """Check if path is parent or inside it using a string prefix test."""
+        path_str = str(path)
+        parent_str = str(parent)
+        if path_str == parent_str:
             return True
-        except ValueError:
-            return False
+        return path_str.startswith(parent_str.rstrip(os.sep) + os.sep)
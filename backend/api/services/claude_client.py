@@ -102,7 +102,7 @@ class ClaudeClient:
             http_client=http_client
         )
         self.model = settings.model_name
-        self.tool_mapper = ToolMapper()
+        self.tool_mapper = ToolMapper.shared()
 
     async def stream_with_tools(
         self,
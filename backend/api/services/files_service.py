@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
+from sqlalchemy import func, or_, update
 from sqlalchemy.orm import Session
 
 from api.models.file_object import FileObject
+from api.services.text_search import escape_like
 
 
 class FilesService:
@@ -70,7 +72,7 @@ class FilesService:
         )
 
     @staticmethod
-    def list_by_prefix(db: Session, user_id: str, prefix: str) -> list[FileObject]:
+    def _prefix_query(db: Session, user_id: str, prefix: str):
         prefix_norm = prefix.strip("/")
         if prefix_norm:
             match = f"{prefix_norm}%"
@@ -84,7 +86,71 @@ class FilesService:
                 FileObject.user_id == user_id,
                 FileObject.deleted_at.is_(None),
             )
-        return query.order_by(FileObject.path.asc()).all()
+        return query.order_by(FileObject.path.asc())
+
+    @staticmethod
+    def list_by_prefix(db: Session, user_id: str, prefix: str) -> list[FileObject]:
+        return FilesService._prefix_query(db, user_id, prefix).all()
+
+    @staticmethod
+    def iter_by_prefix(
+        db: Session, user_id: str, prefix: str, batch_size: int = 500
+    ) -> Iterator[FileObject]:
+        """Yield the same rows as ``list_by_prefix``, fetched ``batch_size`` at a time.
+
+        Rows are streamed from a server-side cursor, so the session must stay
+        open until iteration finishes or is abandoned.
+        """
+        yield from FilesService._prefix_query(db, user_id, prefix).yield_per(batch_size)
+
+    @staticmethod
+    def iter_search_candidates(
+        db: Session,
+        user_id: str,
+        prefix: str,
+        *,
+        name_like: Optional[str] = None,
+        case_sensitive: bool = False,
+        exclude_prefix: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> Iterator[FileObject]:
+        """Stream non-folder files under ``prefix`` in path order for fs search.
+
+        ``name_like`` is a LIKE pattern (escape ``\\``) for the last path
+        segment; since ``%`` may also span ``/`` it narrows rather than decides,
+        and callers re-check names. Paths at or under ``exclude_prefix`` are
+        left out.
+        """
+        query = FilesService._prefix_query(db, user_id, prefix).filter(
+            or_(FileObject.category.is_(None), FileObject.category != "folder"),
+        )
+        if exclude_prefix:
+            query = query.filter(
+                FileObject.path != exclude_prefix,
+                ~FileObject.path.like(f"{escape_like(exclude_prefix)}/%", escape="\\"),
+            )
+        if name_like is not None:
+            like = FileObject.path.like if case_sensitive else FileObject.path.ilike
+            query = query.filter(
+                or_(like(name_like, escape="\\"), like(f"%/{name_like}", escape="\\"))
+            )
+        yield from query.yield_per(batch_size)
+
+    @staticmethod
+    def prefix_version(db: Session, user_id: str, prefix: str) -> tuple[int, Optional[datetime]]:
+        """Return a cheap change marker (row count, latest update) for a prefix.
+
+        Every mutation bumps ``updated_at`` (soft deletes included), so the
+        marker changes whenever the listing under ``prefix`` would.
+        """
+        prefix_norm = prefix.strip("/")
+        query = db.query(func.count(FileObject.id), func.max(FileObject.updated_at)).filter(
+            FileObject.user_id == user_id,
+        )
+        if prefix_norm:
+            query = query.filter(FileObject.path.like(f"{prefix_norm}%"))
+        count, latest = query.one()
+        return count, latest
 
     @staticmethod
     def search_by_name(
@@ -124,8 +190,9 @@ class FilesService:
         )
         if not record:
             return False
-        record.deleted_at = datetime.now(timezone.utc)
-        record.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        record.deleted_at = now
+        record.updated_at = now
         db.commit()
         return True
 
@@ -146,3 +213,45 @@ class FilesService:
         record.updated_at = datetime.now(timezone.utc)
         db.commit()
         return True
+
+    @staticmethod
+    def mark_deleted_ids(db: Session, user_id: str, ids: list) -> int:
+        """Soft-delete many records in one statement."""
+        if not ids:
+            return 0
+        result = db.execute(
+            update(FileObject)
+            .where(
+                FileObject.user_id == user_id,
+                FileObject.id.in_(ids),
+                FileObject.deleted_at.is_(None),
+            )
+            .values(deleted_at=func.now(), updated_at=func.now())
+        )
+        db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def move_prefix_ids(
+        db: Session, user_id: str, ids: list, old_prefix: str, new_prefix: str
+    ) -> int:
+        """Swap ``old_prefix`` for ``new_prefix`` on path and bucket key in one statement."""
+        if not ids:
+            return 0
+        new_path = func.concat(new_prefix, func.substr(FileObject.path, len(old_prefix) + 1))
+        result = db.execute(
+            update(FileObject)
+            .where(
+                FileObject.user_id == user_id,
+                FileObject.id.in_(ids),
+                FileObject.deleted_at.is_(None),
+            )
+            .values(
+                path=new_path,
+                bucket_key=func.concat(f"{user_id}/", new_path),
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
@@ -0,0 +1,13 @@
+"""Identifier validation shared by routers and services."""
+from __future__ import annotations
+
+import re
+
+UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
+
+def is_uuid(value: object) -> bool:
+    """True for a canonical (hyphenated) UUID string; Postgres casts it on comparison."""
+    return isinstance(value, str) and UUID_PATTERN.fullmatch(value) is not None
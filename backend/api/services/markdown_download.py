@@ -0,0 +1,29 @@
+"""Streaming markdown downloads for notes and websites."""
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+from fastapi.responses import StreamingResponse
+
+DOWNLOAD_CHUNK_CHARS = 64 * 1024
+
+
+def _iter_encoded(content: str, chunk_chars: int = DOWNLOAD_CHUNK_CHARS) -> Iterator[bytes]:
+    for start in range(0, len(content), chunk_chars):
+        yield content[start:start + chunk_chars].encode("utf-8")
+
+
+def markdown_download_response(
+    title: str, content: Optional[str], byte_length: Optional[int]
+) -> StreamingResponse:
+    """Stream ``content`` as an attachment without building a second full-size bytes copy.
+
+    ``byte_length`` comes from ``octet_length(content)`` in the same SELECT.
+    """
+    headers = {
+        "Content-Disposition": f'attachment; filename="{title}.md"',
+        "Content-Length": str(byte_length or 0),
+    }
+    return StreamingResponse(
+        _iter_encoded(content or ""), media_type="text/markdown", headers=headers
+    )
@@ -2,26 +2,71 @@
 from __future__ import annotations
 
 import re
+import time
 import urllib.parse
+import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Text, and_, delete, exists, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
 
 from api.models.user_memory import UserMemory
 from api.security.audit_logger import AuditLogger
+from api.services.text_search import escape_like
+
+
+MAX_PATH_LENGTH = 500
+# Backslashes and control characters, rejected in a single scan.
+_INVALID_PATH_CHARS = re.compile(r"[\\\x00-\x1f]")
+
+
+@lru_cache(maxsize=1024)
+def _normalize_memory_path(path: str) -> str:
+    """Normalize and validate a memory path; cached since users touch few paths."""
+    path = path.strip()
+    if len(path) > MAX_PATH_LENGTH:
+        raise ValueError("Path too long")
+    if _INVALID_PATH_CHARS.search(path):
+        raise ValueError("Invalid path")
+    if path.endswith("/") and path != "/memories":
+        path = path.rstrip("/")
+    if not path.startswith("/memories"):
+        if path == "memories":
+            path = "/memories"
+        elif path.startswith("memories/"):
+            path = f"/{path}"
+        else:
+            path = f"/memories/{path.lstrip('/')}"
+    if path != "/memories" and not path.startswith("/memories/"):
+        raise ValueError("Invalid path")
+    if ".." in path or "//" in path:
+        raise ValueError("Invalid path")
+    if "%" in path:
+        decoded = urllib.parse.unquote(path)
+        if ".." in decoded or "\\" in decoded:
+            raise ValueError("Invalid path")
+    if path == "/memories":
+        return path
+    parts = path[len("/memories/"):].split("/")
+    for part in parts:
+        if part in {"", ".", ".."}:
+            raise ValueError("Invalid path")
+    return path
 
 
 class MemoryToolHandler:
     """Execute memory tool commands against user memories."""
 
-    MAX_PATH_LENGTH = 500
+    MAX_PATH_LENGTH = MAX_PATH_LENGTH
     LINE_LIMIT = 999_999
     HIDDEN_PATTERN = re.compile(r"^\.")
 
     @staticmethod
     def execute_command(db: Session, user_id: str, payload: dict[str, Any]) -> dict[str, Any]:
-        start = datetime.now(timezone.utc)
+        start = time.perf_counter()
         command = (payload.get("command") or "").strip()
         try:
             if command == "view":
@@ -42,7 +87,7 @@ class MemoryToolHandler:
             AuditLogger.log_tool_call(
                 tool_name="Memory Tool",
                 parameters=payload,
-                duration_ms=(datetime.now(timezone.utc) - start).total_seconds() * 1000,
+                duration_ms=(time.perf_counter() - start) * 1000,
                 success=result.get("success", False),
                 error=result.get("error"),
                 user_id=user_id,
@@ -54,7 +99,7 @@ class MemoryToolHandler:
             AuditLogger.log_tool_call(
                 tool_name="Memory Tool",
                 parameters=payload,
-                duration_ms=(datetime.now(timezone.utc) - start).total_seconds() * 1000,
+                duration_ms=(time.perf_counter() - start) * 1000,
                 success=False,
                 error=str(exc),
                 user_id=user_id,
@@ -64,7 +109,7 @@ class MemoryToolHandler:
             AuditLogger.log_tool_call(
                 tool_name="Memory Tool",
                 parameters=payload,
-                duration_ms=(datetime.now(timezone.utc) - start).total_seconds() * 1000,
+                duration_ms=(time.perf_counter() - start) * 1000,
                 success=False,
                 error=str(exc),
                 user_id=user_id,
@@ -85,13 +130,11 @@ class MemoryToolHandler:
     def build_memory_block(memories: list[dict[str, str]]) -> str:
         if not memories:
             return "<memory>\nNo stored memories.\n</memory>"
-        lines = ["<memory>", "The following entries are persistent user memories:"]
-        for memory in memories:
-            path = memory.get("path", "unknown")
-            content = memory.get("content", "")
-            lines.append(f"\n[path: {path}]\n{content}")
-        lines.append("</memory>")
-        return "\n".join(lines)
+        body = "\n".join(
+            f"\n[path: {memory.get('path', 'unknown')}]\n{memory.get('content', '')}"
+            for memory in memories
+        )
+        return f"<memory>\nThe following entries are persistent user memories:\n{body}\n</memory>"
 
     @staticmethod
     def _handle_view(db: Session, user_id: str, payload: dict[str, Any]) -> dict[str, Any]:
@@ -127,21 +170,27 @@ class MemoryToolHandler:
             content = payload.get("content")
         MemoryToolHandler._validate_content(content)
 
-        memories = MemoryToolHandler._list_memories(db, user_id)
-        if MemoryToolHandler._is_file(path, memories) or MemoryToolHandler._is_directory(path, memories):
-            return MemoryToolHandler._error(f"Error: File {path} already exists")
-
+        # Insert only if neither the file nor a directory at this path exists.
         now = datetime.now(timezone.utc)
-        memory = UserMemory(
-            user_id=user_id,
-            path=path,
-            content=content,
-            created_at=now,
-            updated_at=now,
-        )
-        db.add(memory)
+        created = db.execute(
+            insert(UserMemory)
+            .from_select(
+                ["id", "user_id", "path", "content", "created_at", "updated_at"],
+                select(
+                    literal(uuid.uuid4(), UserMemory.id.type),
+                    literal(user_id, Text),
+                    literal(path, Text),
+                    literal(content, Text),
+                    literal(now, UserMemory.created_at.type),
+                    literal(now, UserMemory.updated_at.type),
+                ).where(~exists().where(MemoryToolHandler._under_path(user_id, path))),
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "path"])
+            .returning(UserMemory.id)
+        ).first()
         db.commit()
-        db.refresh(memory)
+        if created is None:
+            return MemoryToolHandler._error(f"Error: File {path} already exists")
         return MemoryToolHandler._success(
             {"content": f"File created successfully at: {path}", "path": path}
         )
@@ -160,25 +209,27 @@ class MemoryToolHandler:
                 f"Error: The path {path} does not exist. Please provide a valid path."
             )
 
-        occurrences = MemoryToolHandler._find_occurrences(memory.content, old_str)
-        if not occurrences:
+        # maxsplit=2 stops scanning at the second match, and the two parts of
+        # a unique match rejoin into the result without a second pass.
+        parts = memory.content.split(old_str, 2) if old_str else [memory.content]
+        if len(parts) == 1:
             return MemoryToolHandler._error(
                 f"No replacement was performed, old_str `{old_str}` did not appear verbatim in {path}."
             )
-        if len(occurrences) > 1:
+        if len(parts) > 2:
+            occurrences = MemoryToolHandler._find_occurrences(memory.content, old_str)
             line_list = ", ".join(str(line) for line in sorted(set(occurrences)))
             return MemoryToolHandler._error(
                 "No replacement was performed. Multiple occurrences of "
                 f"old_str `{old_str}` in lines: {line_list}. Please ensure it is unique"
             )
 
-        updated_content = memory.content.replace(old_str, new_str)
+        updated_content = new_str.join(parts)
         MemoryToolHandler._validate_content(updated_content)
         memory.content = updated_content
         memory.updated_at = datetime.now(timezone.utc)
         db.commit()
-        db.refresh(memory)
-        snippet = MemoryToolHandler._format_file_view(path, memory.content, None)
+        snippet = MemoryToolHandler._format_file_view(path, updated_content, None)
         message = f"The memory file has been edited.\n{snippet}"
         return MemoryToolHandler._success({"content": message, "path": path})
 
@@ -213,7 +264,6 @@ class MemoryToolHandler:
         memory.content = updated
         memory.updated_at = datetime.now(timezone.utc)
         db.commit()
-        db.refresh(memory)
         return MemoryToolHandler._success(
             {"content": f"The file {path} has been edited.", "path": path}
         )
@@ -221,21 +271,14 @@ class MemoryToolHandler:
     @staticmethod
     def _handle_delete(db: Session, user_id: str, payload: dict[str, Any]) -> dict[str, Any]:
         path = MemoryToolHandler._normalize_path(payload.get("path"))
-        memories = MemoryToolHandler._list_memories(db, user_id)
-        if not MemoryToolHandler._is_file(path, memories) and not MemoryToolHandler._is_directory(path, memories):
-            return MemoryToolHandler._error(f"Error: The path {path} does not exist")
-
         if path == "/memories":
-            targets = memories
+            condition = UserMemory.user_id == user_id
         else:
-            targets = [
-                memory
-                for memory in memories
-                if memory.path == path or memory.path.startswith(f"{path}/")
-            ]
-        for memory in targets:
-            db.delete(memory)
+            condition = MemoryToolHandler._at_or_under_path(user_id, path)
+        deleted = db.execute(delete(UserMemory).where(condition)).rowcount
         db.commit()
+        if not deleted and path != "/memories":
+            return MemoryToolHandler._error(f"Error: The path {path} does not exist")
         return MemoryToolHandler._success(
             {"content": f"Successfully deleted {path}", "path": path}
         )
@@ -247,64 +290,63 @@ class MemoryToolHandler:
         if old_path == "/memories":
             return MemoryToolHandler._error("Error: The path /memories does not exist")
 
-        memories = MemoryToolHandler._list_memories(db, user_id)
-        if not MemoryToolHandler._is_file(old_path, memories) and not MemoryToolHandler._is_directory(old_path, memories):
-            return MemoryToolHandler._error(f"Error: The path {old_path} does not exist")
-        if MemoryToolHandler._is_file(new_path, memories) or MemoryToolHandler._is_directory(new_path, memories):
-            return MemoryToolHandler._error(f"Error: The destination {new_path} already exists")
         if new_path.startswith(f"{old_path}/"):
+            if not MemoryToolHandler._path_exists(db, user_id, old_path):
+                return MemoryToolHandler._error(f"Error: The path {old_path} does not exist")
             return MemoryToolHandler._error("Error: The destination cannot be within the source")
 
-        updated_at = datetime.now(timezone.utc)
-        targets = [
-            memory
-            for memory in memories
-            if memory.path == old_path or memory.path.startswith(f"{old_path}/")
-        ]
-        for memory in targets:
-            suffix = memory.path[len(old_path):]
-            memory.path = f"{new_path}{suffix}"
-            memory.updated_at = updated_at
+        # Move the file or directory in one statement unless the destination is taken.
+        target = aliased(UserMemory)
+        destination_taken = exists().where(
+            target.user_id == user_id,
+            or_(target.path == new_path, target.path.like(f"{escape_like(new_path)}/%", escape="\\")),
+        )
+        moved = db.execute(
+            update(UserMemory)
+            .where(MemoryToolHandler._at_or_under_path(user_id, old_path), ~destination_taken)
+            .values(
+                path=func.concat(new_path, func.substr(UserMemory.path, len(old_path) + 1)),
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
         db.commit()
+        if not moved:
+            if not MemoryToolHandler._path_exists(db, user_id, old_path):
+                return MemoryToolHandler._error(f"Error: The path {old_path} does not exist")
+            return MemoryToolHandler._error(f"Error: The destination {new_path} already exists")
         return MemoryToolHandler._success(
             {"content": f"Successfully renamed {old_path} to {new_path}", "path": new_path}
         )
 
+    @staticmethod
+    def _under_path(user_id: str, path: str):
+        return and_(
+            UserMemory.user_id == user_id,
+            UserMemory.path.like(f"{escape_like(path)}/%", escape="\\"),
+        )
+
+    @staticmethod
+    def _at_or_under_path(user_id: str, path: str):
+        return and_(
+            UserMemory.user_id == user_id,
+            or_(
+                UserMemory.path == path,
+                UserMemory.path.like(f"{escape_like(path)}/%", escape="\\"),
+            ),
+        )
+
+    @staticmethod
+    def _path_exists(db: Session, user_id: str, path: str) -> bool:
+        return db.query(
+            exists().where(MemoryToolHandler._at_or_under_path(user_id, path))
+        ).scalar()
+
     @staticmethod
     def _normalize_path(path: Any) -> str:
         if not isinstance(path, str):
             raise ValueError("Invalid path")
-        path = path.strip()
-        if len(path) > MemoryToolHandler.MAX_PATH_LENGTH:
-            raise ValueError("Path too long")
-        if "\\" in path:
-            raise ValueError("Invalid path")
-        if any(ord(ch) < 32 for ch in path):
-            raise ValueError("Invalid path")
-        if path.endswith("/") and path != "/memories":
-            path = path.rstrip("/")
-        if not path.startswith("/memories"):
-            if path == "memories":
-                path = "/memories"
-            elif path.startswith("memories/"):
-                path = f"/{path}"
-            else:
-                path = f"/memories/{path.lstrip('/')}"
-        if path != "/memories" and not path.startswith("/memories/"):
-            raise ValueError("Invalid path")
-        if ".." in path or "//" in path:
-            raise ValueError("Invalid path")
-        if "%" in path:
-            decoded = urllib.parse.unquote(path)
-            if ".." in decoded or "\\" in decoded:
-                raise ValueError("Invalid path")
-        if path == "/memories":
-            return path
-        parts = path[len("/memories/"):].split("/")
-        for part in parts:
-            if part in {"", ".", ".."}:
-                raise ValueError("Invalid path")
-        return path
+        return _normalize_memory_path(path)
 
     @staticmethod
     def _validate_content(content: Any) -> None:
@@ -322,11 +364,9 @@ class MemoryToolHandler:
 
     @staticmethod
     def _get_memory(db: Session, user_id: str, path: str) -> UserMemory | None:
-        return (
-            db.query(UserMemory)
-            .filter(UserMemory.user_id == user_id, UserMemory.path == path)
-            .first()
-        )
+        return db.execute(
+            select(UserMemory).where(UserMemory.user_id == user_id, UserMemory.path == path)
+        ).scalar_one_or_none()
 
     @staticmethod
     def _is_file(path: str, memories: list[UserMemory]) -> bool:
@@ -345,16 +385,15 @@ class MemoryToolHandler:
     def _find_occurrences(content: str, old_str: str) -> list[int]:
         if not old_str:
             return []
-        lines = content.splitlines()
         matches = []
-        for index, line in enumerate(lines, start=1):
-            start = 0
-            while True:
-                found = line.find(old_str, start)
-                if found == -1:
-                    break
-                matches.append(index)
-                start = found + max(1, len(old_str))
+        line = 1
+        position = 0
+        found = content.find(old_str)
+        while found != -1:
+            line += content.count("\n", position, found)
+            matches.append(line)
+            position = found
+            found = content.find(old_str, found + len(old_str))
         return matches
 
     @staticmethod
@@ -450,6 +489,10 @@ class MemoryToolHandler:
 
     @staticmethod
     def _content_size(content: str) -> int:
+        # str.isascii is O(1) in CPython, and ASCII text is one byte per char,
+        # so most markdown skips the encode copy entirely.
+        if content.isascii():
+            return len(content)
         return len(content.encode("utf-8"))
 
     @staticmethod
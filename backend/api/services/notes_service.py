@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 import re
-import uuid
 from datetime import datetime, timezone
 from typing import Iterable, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import Boolean, Text, case, cast, func, literal_column, or_, update
 from sqlalchemy.orm import Session
 
 from api.models.note import Note
+from api.services.ids import is_uuid
 
 
 class NoteNotFoundError(Exception):
@@ -35,27 +35,29 @@ class NotesService:
         return f"# {title}\n\n{content or ''}".strip() + "\n"
 
     @staticmethod
-    def parse_note_id(value: str) -> uuid.UUID | None:
-        try:
-            return uuid.UUID(value)
-        except (ValueError, TypeError):
-            return None
+    def parse_note_id(value: str) -> str | None:
+        """Validate a canonical UUID string; Postgres casts it on comparison."""
+        return value if is_uuid(value) else None
 
     @staticmethod
     def is_archived_folder(folder: str) -> bool:
         return folder == "Archive" or folder.startswith("Archive/")
 
     @staticmethod
-    def build_notes_tree(notes: Iterable[Note]) -> dict:
+    def build_notes_tree(notes: Iterable) -> dict:
+        """Build the sidebar tree from rows of (id, title, folder, pinned, folder_marker, archived, updated_at).
+
+        ``folder``, ``pinned`` and ``folder_marker`` are the metadata values
+        projected as text, so the full metadata JSON never has to be loaded.
+        """
         root = {"name": "notes", "path": "/", "type": "directory", "children": [], "expanded": False}
         index: dict[str, dict] = {"": root}
 
         for note in notes:
             if note.title == "✏️ Scratchpad":
                 continue
-            metadata = note.metadata_ or {}
-            folder = metadata.get("folder") or ""
-            is_folder_marker = bool(metadata.get("folder_marker"))
+            folder = note.folder or ""
+            is_folder_marker = note.folder_marker == "true"
             folder_parts = [part for part in folder.split("/") if part]
             current_path = ""
             current_node = root
@@ -77,14 +79,13 @@ class NotesService:
             if is_folder_marker:
                 continue
 
-            is_archived = NotesService.is_archived_folder(folder)
             current_node["children"].append({
                 "name": f"{note.title}.md",
                 "path": str(note.id),
                 "type": "file",
                 "modified": note.updated_at.timestamp() if note.updated_at else None,
-                "pinned": bool(metadata.get("pinned")),
-                "archived": is_archived
+                "pinned": note.pinned == "true",
+                "archived": note.archived
             })
 
         def sort_children(node: dict) -> None:
@@ -129,7 +130,7 @@ class NotesService:
     def update_note(
         db: Session,
         user_id: str,
-        note_id: uuid.UUID,
+        note_id: str,
         content: str,
         *,
         title: Optional[str] = None,
@@ -155,57 +156,87 @@ class NotesService:
         return note
 
     @staticmethod
-    def update_folder(
-        db: Session,
-        user_id: str,
-        note_id: uuid.UUID,
-        folder: str,
-    ) -> Note:
-        note = (
-            db.query(Note)
-            .filter(
+    def _update_active_note(db: Session, user_id: str, note_id: str, **values) -> Note:
+        """Apply ``values`` in a single UPDATE ... RETURNING round-trip."""
+        note = db.scalars(
+            update(Note)
+            .where(
                 Note.user_id == user_id,
                 Note.id == note_id,
                 Note.deleted_at.is_(None),
             )
-            .first()
-        )
-        if not note:
+            .values(updated_at=func.now(), **values)
+            .returning(Note)
+            .execution_options(populate_existing=True)
+        ).first()
+        if note is None:
             raise NoteNotFoundError(f"Note not found: {note_id}")
-
-        note.metadata_ = {**(note.metadata_ or {}), "folder": folder}
-        note.updated_at = datetime.now(timezone.utc)
         db.commit()
-        db.refresh(note)
         return note
 
+    @staticmethod
+    def _set_metadata_key(key: str, value):
+        return func.jsonb_set(
+            func.coalesce(Note.metadata_, literal_column("'{}'::jsonb")),
+            literal_column(f"'{{{key}}}'::text[]"),
+            func.to_jsonb(value),
+        )
+
+    @staticmethod
+    def update_folder(
+        db: Session,
+        user_id: str,
+        note_id: str,
+        folder: str,
+    ) -> Note:
+        return NotesService._update_active_note(
+            db,
+            user_id,
+            note_id,
+            metadata_=NotesService._set_metadata_key("folder", cast(folder, Text)),
+        )
+
     @staticmethod
     def update_pinned(
         db: Session,
         user_id: str,
-        note_id: uuid.UUID,
+        note_id: str,
         pinned: bool,
     ) -> Note:
-        note = (
-            db.query(Note)
-            .filter(
-                Note.user_id == user_id,
-                Note.id == note_id,
-                Note.deleted_at.is_(None),
-            )
-            .first()
+        return NotesService._update_active_note(
+            db,
+            user_id,
+            note_id,
+            metadata_=NotesService._set_metadata_key("pinned", cast(pinned, Boolean)),
         )
-        if not note:
-            raise NoteNotFoundError(f"Note not found: {note_id}")
 
-        note.metadata_ = {**(note.metadata_ or {}), "pinned": pinned}
-        note.updated_at = datetime.now(timezone.utc)
-        db.commit()
-        db.refresh(note)
-        return note
+    @staticmethod
+    def rename_note(
+        db: Session,
+        user_id: str,
+        note_id: str,
+        title: str,
+    ) -> Note:
+        # SQL mirror of update_content_title so the rename stays one statement.
+        h1_pattern = "(?n)^#\\s+.+$"
+        content = func.coalesce(Note.content, "")
+        new_content = case(
+            (
+                content.op("~")(h1_pattern),
+                func.regexp_replace(content, h1_pattern, "# " + title.replace("\\", "\\\\")),
+            ),
+            else_=func.concat(func.btrim(func.concat(f"# {title}\n\n", content), " \t\n\r"), "\n"),
+        )
+        return NotesService._update_active_note(
+            db,
+            user_id,
+            note_id,
+            title=title,
+            content=new_content,
+        )
 
     @staticmethod
-    def delete_note(db: Session, user_id: str, note_id: uuid.UUID) -> bool:
+    def delete_note(db: Session, user_id: str, note_id: str) -> bool:
         note = (
             db.query(Note)
             .filter(
@@ -228,7 +259,7 @@ class NotesService:
     def get_note(
         db: Session,
         user_id: str,
-        note_id: uuid.UUID,
+        note_id: str,
         *,
         mark_opened: bool = True,
     ) -> Optional[Note]:
@@ -305,9 +336,8 @@ class NotesService:
 
         if archived is not None:
             archived_filter = or_(
-                Note.metadata_["archived"].astext == str(archived).lower(),
-                Note.metadata_["folder"].astext.like("Archive/%"),
-                Note.metadata_["folder"].astext == "Archive",
+                Note.archived,
+                func.coalesce(Note.metadata_["archived"].astext == "true", False),
             )
             query = query.filter(archived_filter if archived else ~archived_filter)
 
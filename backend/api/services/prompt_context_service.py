@@ -1,9 +1,11 @@
 """Prompt context assembly for chat and tools."""
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 from typing import Any
 
+from sqlalchemy import Integer, Text, cast, func, literal, null, select, union_all
 from sqlalchemy.orm import Session
 
 from api.models.conversation import Conversation
@@ -20,6 +22,13 @@ from api.prompts import (
 )
 from api.services.user_settings_service import UserSettingsService
 
+RECENT_ACTIVITY_TTL_SECONDS = 30.0
+RECENT_ACTIVITY_CACHE_MAX_ENTRIES = 10_000
+# user_id -> (start of day, checked at, activity lists), oldest entry first.
+_recent_activity_cache: dict[
+    str, tuple[datetime, float, tuple[list[dict], list[dict], list[dict]]]
+] = {}
+
 
 class PromptContextService:
     """Build prompt context blocks from DB and open UI state."""
@@ -37,9 +46,11 @@ class PromptContextService:
         current_location_levels: dict[str, Any] | str | None = None,
         current_weather: dict[str, Any] | str | None = None,
         now: datetime | None = None,
+        settings_record: Any = UserSettingsService.UNSET,
     ) -> tuple[str, str]:
         timestamp = now or datetime.now(timezone.utc)
-        settings_record = UserSettingsService.get_settings(db, user_id)
+        if settings_record is UserSettingsService.UNSET:
+            settings_record = UserSettingsService.get_settings(db, user_id)
         location_fallback = (
             settings_record.location if settings_record and settings_record.location else "Unknown"
         )
@@ -105,6 +116,11 @@ class PromptContextService:
             return value
         return value[:max_chars]
 
+    @staticmethod
+    def invalidate_recent_activity(user_id: str) -> None:
+        """Drop cached recent activity after the user opens a note or website."""
+        _recent_activity_cache.pop(user_id, None)
+
     @staticmethod
     def _get_recent_activity(
         db: Session,
@@ -112,59 +128,97 @@ class PromptContextService:
         now: datetime,
     ) -> tuple[list[dict], list[dict], list[dict]]:
         start_of_day = PromptContextService._start_of_today(now)
+        cached = _recent_activity_cache.get(user_id)
+        checked_at = time.monotonic()
+        if (
+            cached
+            and cached[0] == start_of_day
+            and checked_at - cached[1] < RECENT_ACTIVITY_TTL_SECONDS
+        ):
+            result = cached[2]
+        else:
+            result = PromptContextService._query_recent_activity(db, user_id, start_of_day)
+            # Re-insert so the dict stays ordered by age, then evict the oldest.
+            _recent_activity_cache.pop(user_id, None)
+            while len(_recent_activity_cache) >= RECENT_ACTIVITY_CACHE_MAX_ENTRIES:
+                del _recent_activity_cache[next(iter(_recent_activity_cache))]
+            _recent_activity_cache[user_id] = (start_of_day, checked_at, result)
+        # Callers get their own copies so they cannot change the cached lists.
+        return tuple([dict(item) for item in items] for items in result)
 
-        notes = (
-            db.query(Note)
-            .filter(Note.last_opened_at >= start_of_day)
-            .filter(Note.user_id == user_id)
-            .order_by(Note.last_opened_at.desc())
-            .all()
-        )
-        websites = (
-            db.query(Website)
-            .filter(Website.last_opened_at >= start_of_day)
-            .filter(Website.user_id == user_id)
-            .order_by(Website.last_opened_at.desc())
-            .all()
-        )
-        conversations = (
-            db.query(Conversation)
-            .filter(
-                Conversation.user_id == user_id,
-                Conversation.is_archived == False,
-                Conversation.updated_at >= start_of_day,
-            )
-            .order_by(Conversation.updated_at.desc())
-            .all()
+    @staticmethod
+    def _query_recent_activity(
+        db: Session,
+        user_id: str,
+        start_of_day: datetime,
+    ) -> tuple[list[dict], list[dict], list[dict]]:
+        # One round-trip: a tagged UNION ALL of the three recent-activity lists.
+        recent_notes = select(
+            literal("note").label("kind"),
+            cast(Note.id, Text).label("id"),
+            cast(Note.title, Text).label("title"),
+            Note.last_opened_at.label("opened_at"),
+            Note.metadata_["folder"].astext.label("folder"),
+            cast(null(), Text).label("domain"),
+            cast(null(), Text).label("url"),
+            cast(null(), Integer).label("message_count"),
+        ).where(Note.last_opened_at >= start_of_day, Note.user_id == user_id)
+        recent_websites = select(
+            literal("website"),
+            cast(Website.id, Text),
+            cast(Website.title, Text),
+            Website.last_opened_at,
+            cast(null(), Text),
+            cast(Website.domain, Text),
+            cast(func.coalesce(Website.url_full, Website.url), Text),
+            cast(null(), Integer),
+        ).where(Website.last_opened_at >= start_of_day, Website.user_id == user_id)
+        recent_conversations = select(
+            literal("conversation"),
+            cast(Conversation.id, Text),
+            cast(Conversation.title, Text),
+            Conversation.updated_at,
+            cast(null(), Text),
+            cast(null(), Text),
+            cast(null(), Text),
+            Conversation.message_count,
+        ).where(
+            Conversation.user_id == user_id,
+            Conversation.is_archived == False,
+            Conversation.updated_at >= start_of_day,
         )
-
-        note_items = [
-            {
-                "id": str(note.id),
-                "title": note.title,
-                "last_opened_at": note.last_opened_at.isoformat() if note.last_opened_at else None,
-                "folder": note.metadata_.get("folder") if note.metadata_ else None,
-            }
-            for note in notes
-        ]
-        website_items = [
-            {
-                "id": str(website.id),
-                "title": website.title,
-                "last_opened_at": website.last_opened_at.isoformat() if website.last_opened_at else None,
-                "domain": website.domain,
-                "url": website.url_full or website.url,
-            }
-            for website in websites
-        ]
-        conversation_items = [
-            {
-                "id": str(conversation.id),
-                "title": conversation.title,
-                "last_opened_at": conversation.updated_at.isoformat() if conversation.updated_at else None,
-                "message_count": conversation.message_count,
-            }
-            for conversation in conversations
-        ]
+        activity = union_all(recent_notes, recent_websites, recent_conversations).subquery()
+        rows = db.execute(
+            select(activity).order_by(activity.c.kind, activity.c.opened_at.desc())
+        ).tuples()
+
+        note_items: list[dict] = []
+        website_items: list[dict] = []
+        conversation_items: list[dict] = []
+        for kind, item_id, title, opened_at, folder, domain, url, message_count in rows:
+            last_opened_at = opened_at.isoformat() if opened_at else None
+            if kind == "note":
+                note_items.append(
+                    {"id": item_id, "title": title, "last_opened_at": last_opened_at, "folder": folder}
+                )
+            elif kind == "website":
+                website_items.append(
+                    {
+                        "id": item_id,
+                        "title": title,
+                        "last_opened_at": last_opened_at,
+                        "domain": domain,
+                        "url": url,
+                    }
+                )
+            else:
+                conversation_items.append(
+                    {
+                        "id": item_id,
+                        "title": title,
+                        "last_opened_at": last_opened_at,
+                        "message_count": message_count,
+                    }
+                )
 
         return note_items, website_items, conversation_items
@@ -1,8 +1,10 @@
 """Skill catalog loader for UI and defaults."""
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
@@ -14,6 +16,29 @@ class SkillCatalogService:
 
     @staticmethod
     def list_skills(skills_dir: Path) -> List[Dict[str, str]]:
+        signature = SkillCatalogService._catalog_signature(skills_dir)
+        return [dict(skill) for skill in SkillCatalogService._load_skills(skills_dir, signature)]
+
+    @staticmethod
+    def _catalog_signature(skills_dir: Path) -> Optional[Tuple[int, ...]]:
+        """Cheap stat-based key that changes when skills or their SKILL.md change."""
+        try:
+            stamps = [os.stat(skills_dir).st_mtime_ns]
+            with os.scandir(skills_dir) as entries:
+                for entry in entries:
+                    try:
+                        stamps.append(os.stat(os.path.join(entry.path, "SKILL.md")).st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        return tuple(stamps)
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _load_skills(
+        skills_dir: Path, signature: Optional[Tuple[int, ...]]
+    ) -> Tuple[Dict[str, str], ...]:
         skills: List[Dict[str, str]] = []
         category_map = SkillCatalogService._category_map()
 
@@ -82,7 +107,7 @@ class SkillCatalogService:
                 }
             )
 
-        return [skill for skill in skills if skill["id"] in EXPOSED_SKILLS]
+        return tuple(skill for skill in skills if skill["id"] in EXPOSED_SKILLS)
 
     @staticmethod
     def _read_frontmatter(skill_md: Path) -> Dict[str, str]:
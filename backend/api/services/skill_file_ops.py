@@ -3,10 +3,15 @@ from __future__ import annotations
 
 import fnmatch
 import mimetypes
+import re
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy.orm import Session
 
 from api.db.session import SessionLocal, set_session_user_id
 from api.models.file_object import FileObject
@@ -15,6 +20,7 @@ from api.services.storage.service import get_storage_backend
 
 
 PROFILE_IMAGES_PREFIX = "profile-images"
+_PROFILE_IMAGES_DIR_PREFIX = f"{PROFILE_IMAGES_PREFIX}/"
 
 
 def normalize_path(raw_path: str, *, allow_root: bool = True) -> str:
@@ -22,7 +28,7 @@ def normalize_path(raw_path: str, *, allow_root: bool = True) -> str:
     if raw_path is None:
         raise ValueError("Path is required")
 
-    path = str(raw_path).strip()
+    path = (raw_path if isinstance(raw_path, str) else str(raw_path)).strip()
     if path in {"", ".", "/"}:
         if allow_root:
             return ""
@@ -32,8 +38,9 @@ def normalize_path(raw_path: str, *, allow_root: bool = True) -> str:
     if path.startswith("/"):
         path = path[1:]
 
-    parts = [part for part in Path(path).parts if part not in {"", "."}]
-    if any(part == ".." for part in parts):
+    # Input is POSIX by now, so a plain split is enough (no pathlib parsing).
+    parts = [part for part in path.split("/") if part and part != "."]
+    if ".." in parts:
         raise ValueError(f"Path traversal not allowed: {raw_path}")
 
     normalized = "/".join(parts)
@@ -42,9 +49,22 @@ def normalize_path(raw_path: str, *, allow_root: bool = True) -> str:
     return normalized
 
 
+def is_profile_images_record_path(path: str) -> bool:
+    """Check an already-normalized stored path (e.g. FileObject.path)."""
+    return path == PROFILE_IMAGES_PREFIX or path.startswith(_PROFILE_IMAGES_DIR_PREFIX)
+
+
+@lru_cache(maxsize=2048)
 def _is_profile_images_path(path: str) -> bool:
-    normalized = normalize_path(path)
-    return normalized == PROFILE_IMAGES_PREFIX or normalized.startswith(f"{PROFILE_IMAGES_PREFIX}/")
+    return is_profile_images_record_path(normalize_path(path))
+
+
+@lru_cache(maxsize=256)
+def _glob_matcher(pattern: str) -> Optional[Callable[[str], object]]:
+    """Compiled name matcher for a glob pattern; None when it matches everything."""
+    if pattern == "*":
+        return None
+    return re.compile(fnmatch.translate(pattern)).match
 
 
 def ensure_allowed_path(path: str) -> None:
@@ -72,13 +92,43 @@ def _relative_path(base_path: str, full_path: str) -> str:
     return ""
 
 
+_active_session: ContextVar[tuple[str, Session] | None] = ContextVar(
+    "skill_file_ops_session", default=None
+)
+
+
 @contextmanager
 def session_for_user(user_id: str):
+    """Yield a user-scoped session, reusing the enclosing one when nested.
+
+    Wrapping several file operations in one outer block shares a single
+    session instead of opening one per operation.
+    """
+    active = _active_session.get()
+    if active is not None and active[0] == user_id:
+        # Operations commit their own work, and each commit returns the
+        # connection to the pool; the next one may check out a connection
+        # with another (or no) app.user_id, so set it on every entry.
+        # Roll back a failed operation so the shared session stays usable
+        # for the rest of the outer block, setting the user again since the
+        # rollback can undo it. Savepoints would not help: the operations
+        # call commit() themselves.
+        set_session_user_id(active[1], user_id)
+        try:
+            yield active[1]
+        except Exception:
+            active[1].rollback()
+            set_session_user_id(active[1], user_id)
+            raise
+        return
+
     db = SessionLocal()
-    set_session_user_id(db, user_id)
+    token = _active_session.set((user_id, db))
     try:
+        set_session_user_id(db, user_id)
         yield db
     finally:
+        _active_session.reset(token)
         db.close()
 
 
@@ -98,7 +148,7 @@ def list_entries(
     records = [
         record
         for record in records
-        if record.deleted_at is None and not _is_profile_images_path(record.path)
+        if record.deleted_at is None and not is_profile_images_record_path(record.path)
     ]
 
     if base_path and not records:
@@ -106,6 +156,7 @@ def list_entries(
 
     entries: list[dict] = []
     dir_meta: dict[str, datetime] = {}
+    name_matches = _glob_matcher(pattern)
 
     def register_dir(path: str, updated_at: Optional[datetime]) -> None:
         if not path:
@@ -140,7 +191,7 @@ def list_entries(
         if not recursive and len(parts) > 1:
             continue
 
-        if not fnmatch.fnmatch(parts[-1], pattern):
+        if name_matches is not None and not name_matches(parts[-1]):
             continue
 
         entries.append(
@@ -157,11 +208,12 @@ def list_entries(
     for dir_path, updated_at in dir_meta.items():
         if not recursive and "/" in dir_path:
             continue
-        if not fnmatch.fnmatch(Path(dir_path).name, pattern):
+        name = dir_path.rsplit("/", 1)[-1]
+        if name_matches is not None and not name_matches(name):
             continue
         entries.append(
             {
-                "name": Path(dir_path).name,
+                "name": name,
                 "path": dir_path,
                 "size": 0,
                 "modified": updated_at.isoformat() if updated_at else None,
@@ -294,7 +346,7 @@ def download_file(user_id: str, path: str, local_path: Path) -> FileObject:
 
     storage = get_storage_backend()
     local_path.parent.mkdir(parents=True, exist_ok=True)
-    local_path.write_bytes(storage.get_object(record.bucket_key))
+    storage.download_object(record.bucket_key, local_path)
     return record
 
 
@@ -337,7 +389,7 @@ def delete_path(user_id: str, path: str) -> dict:
         records = FilesService.list_by_prefix(db, user_id, prefix)
         records = [
             item for item in records
-            if item.deleted_at is None and not _is_profile_images_path(item.path)
+            if item.deleted_at is None and not is_profile_images_record_path(item.path)
         ]
         if not records and not record:
             raise FileNotFoundError(f"Path not found: {path}")
@@ -382,7 +434,7 @@ def move_path(user_id: str, source: str, destination: str) -> dict:
         records = FilesService.list_by_prefix(db, user_id, prefix)
         records = [
             item for item in records
-            if item.deleted_at is None and not _is_profile_images_path(item.path)
+            if item.deleted_at is None and not is_profile_images_record_path(item.path)
         ]
         if not records and not (record and record.category == "folder"):
             raise FileNotFoundError(f"Source not found: {source}")
@@ -438,7 +490,7 @@ def copy_path(user_id: str, source: str, destination: str) -> dict:
         records = FilesService.list_by_prefix(db, user_id, prefix)
         records = [
             item for item in records
-            if item.deleted_at is None and not _is_profile_images_path(item.path)
+            if item.deleted_at is None and not is_profile_images_record_path(item.path)
         ]
         if not records and not (record and record.category == "folder"):
             raise FileNotFoundError(f"Source not found: {source}")
@@ -493,7 +545,7 @@ def info(user_id: str, path: str) -> dict:
         records = FilesService.list_by_prefix(db, user_id, prefix)
         records = [
             item for item in records
-            if item.deleted_at is None and not _is_profile_images_path(item.path)
+            if item.deleted_at is None and not is_profile_images_record_path(item.path)
         ]
         if not records:
             raise FileNotFoundError(f"Path not found: {path}")
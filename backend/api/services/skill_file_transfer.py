@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import mimetypes
+import os
 import tempfile
 from pathlib import Path
 from typing import Tuple
@@ -12,6 +13,7 @@ from api.services.skill_file_ops import (
     upload_file,
     normalize_path,
     ensure_allowed_path,
+    is_profile_images_record_path,
     session_for_user,
 )
 from api.services.files_service import FilesService
@@ -63,12 +65,20 @@ def upload_output_path(user_id: str, r2_path: str, local_path: Path) -> str:
 def upload_output_dir(user_id: str, r2_prefix: str, local_dir: Path) -> list[str]:
     uploaded: list[str] = []
     base_prefix = r2_prefix.strip("/")
-    for file_path in local_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
-        rel = file_path.relative_to(local_dir).as_posix()
-        r2_path = f"{base_prefix}/{rel}".strip("/")
-        uploaded.append(upload_output_path(user_id, r2_path, file_path))
+    # scandir reuses readdir's file type and r2 paths are built as we descend,
+    # instead of a stat and relative_to() per rglob result. Like rglob, the
+    # walk does not descend into symlinked directories.
+    pending = [(str(local_dir), f"{base_prefix}/" if base_prefix else "")]
+    while pending:
+        current, prefix = pending.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, f"{prefix}{entry.name}/"))
+                elif entry.is_file():
+                    uploaded.append(
+                        upload_output_path(user_id, prefix + entry.name, Path(entry.path))
+                    )
     return uploaded
 
 
@@ -85,14 +95,17 @@ def download_input_dir(user_id: str, r2_prefix: str, local_dir: Path) -> Path:
     with session_for_user(user_id) as db:
         records = FilesService.list_by_prefix(db, user_id, f"{prefix}/")
 
+    created_dirs: set[Path] = set()
     for record in records:
         if record.deleted_at is not None or record.category == "folder":
             continue
-        if record.path.startswith("profile-images/") or record.path == "profile-images":
+        if is_profile_images_record_path(record.path):
             continue
         rel = record.path[len(prefix) + 1 :]
         local_path = local_dir / rel
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-        local_path.write_bytes(storage.get_object(record.bucket_key))
+        if local_path.parent not in created_dirs:
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(local_path.parent)
+        storage.download_object(record.bucket_key, local_path)
 
     return local_dir
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable, Optional
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 
 @dataclass(frozen=True)
@@ -22,6 +23,15 @@ class StorageBackend:
     def get_object(self, key: str) -> bytes:
         raise NotImplementedError
 
+    def iter_object(self, key: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        yield self.get_object(key)
+
+    def download_object(self, key: str, destination: Path) -> None:
+        """Write an object to a local file without holding it in memory."""
+        with destination.open("wb") as handle:
+            for chunk in self.iter_object(key):
+                handle.write(chunk)
+
     def put_object(self, key: str, data: bytes, content_type: Optional[str] = None) -> StorageObject:
         raise NotImplementedError
 
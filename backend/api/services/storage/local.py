@@ -1,20 +1,56 @@
 """Local filesystem storage backend."""
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 from api.services.storage.base import StorageBackend, StorageObject
 
+# Cap on remembered parent directories per LocalStorage instance.
+KNOWN_DIRS_MAX_ENTRIES = 4096
+
 
 class LocalStorage(StorageBackend):
     def __init__(self, base_path: Path):
         self.base_path = base_path
+        self._known_dirs: set[Path] = set()
+        # Paths under base_path render as "<base>/<key>" ("<key>" for "."),
+        # so keys can be sliced off the string instead of Path.relative_to.
+        base = os.fspath(base_path)
+        self._key_offset = 0 if base == "." else len(base.rstrip("/")) + 1
+
+    def _ensure_parent(self, path: Path) -> None:
+        parent = path.parent
+        if parent in self._known_dirs:
+            return
+        parent.mkdir(parents=True, exist_ok=True)
+        if len(self._known_dirs) >= KNOWN_DIRS_MAX_ENTRIES:
+            self._known_dirs.clear()
+        self._known_dirs.add(parent)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        self._with_parent(path, lambda: path.write_bytes(data))
+
+    def _with_parent(self, path: Path, write: Callable[[], object]) -> None:
+        # Skip the mkdir syscall for directories already created; if one was
+        # removed behind our back, forget it, recreate it once and retry.
+        self._ensure_parent(path)
+        try:
+            write()
+        except FileNotFoundError:
+            self._known_dirs.discard(path.parent)
+            self._ensure_parent(path)
+            write()
 
     def _resolve_key(self, key: str) -> Path:
         normalized = key.lstrip("/")
         return self.base_path / normalized
 
+    def _key(self, path: Path) -> str:
+        return os.fspath(path)[self._key_offset:]
+
     def list_objects(self, prefix: str, recursive: bool = True) -> Iterable[StorageObject]:
         root = self._resolve_key(prefix)
         if not root.exists():
@@ -24,7 +60,7 @@ class LocalStorage(StorageBackend):
             stat = root.stat()
             return [
                 StorageObject(
-                    key=str(root.relative_to(self.base_path)),
+                    key=self._key(root),
                     size=stat.st_size,
                     last_modified=None,
                 )
@@ -38,7 +74,7 @@ class LocalStorage(StorageBackend):
             stat = path.stat()
             objects.append(
                 StorageObject(
-                    key=str(path.relative_to(self.base_path)),
+                    key=self._key(path),
                     size=stat.st_size,
                     last_modified=None,
                 )
@@ -48,13 +84,20 @@ class LocalStorage(StorageBackend):
     def get_object(self, key: str) -> bytes:
         return self._resolve_key(key).read_bytes()
 
+    def iter_object(self, key: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        with self._resolve_key(key).open("rb") as handle:
+            while chunk := handle.read(chunk_size):
+                yield chunk
+
+    def download_object(self, key: str, destination: Path) -> None:
+        shutil.copyfile(self._resolve_key(key), destination)
+
     def put_object(self, key: str, data: bytes, content_type: Optional[str] = None) -> StorageObject:
         path = self._resolve_key(key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(data)
+        self._write(path, data)
         stat = path.stat()
         return StorageObject(
-            key=str(path.relative_to(self.base_path)),
+            key=self._key(path),
             size=stat.st_size,
             content_type=content_type,
             last_modified=None,
@@ -68,8 +111,9 @@ class LocalStorage(StorageBackend):
     def copy_object(self, source_key: str, destination_key: str) -> None:
         source = self._resolve_key(source_key)
         dest = self._resolve_key(destination_key)
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_bytes(source.read_bytes())
+        # copyfile uses sendfile/copy_file_range on Linux, so the bytes never
+        # pass through Python.
+        self._with_parent(dest, lambda: shutil.copyfile(source, dest))
 
     def object_exists(self, key: str) -> bool:
         return self._resolve_key(key).exists()
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
 import boto3
 from botocore.config import Config
@@ -70,6 +70,15 @@ class R2Storage(StorageBackend):
         response = self.client.get_object(Bucket=self.bucket, Key=normalized)
         return response["Body"].read()
 
+    def iter_object(self, key: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        normalized = self._normalize_key(key)
+        response = self.client.get_object(Bucket=self.bucket, Key=normalized)
+        body = response["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
     def put_object(self, key: str, data: bytes, content_type: Optional[str] = None) -> StorageObject:
         normalized = self._normalize_key(key)
         params = {
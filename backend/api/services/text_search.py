@@ -0,0 +1,46 @@
+"""Shared search predicates for notes and websites."""
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import func, or_
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+MAX_QUERY_LENGTH = 128
+
+_PHRASE_RE = re.compile(r"^\w{2,}(?:\s+\w{2,})+$")
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE metacharacters so user input matches literally (use escape="\\")."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def is_phrase_query(query: str) -> bool:
+    """Multi-word queries go to full-text search; single terms keep substring match."""
+    return bool(_PHRASE_RE.match(query.strip()))
+
+
+def apply_search(stmt: StatementLambdaElement, model, query: str) -> StatementLambdaElement:
+    """Append the title/content search filter and ordering for ``model`` to ``stmt``.
+
+    Phrase queries use the stored ``search_tsv`` column and rank by relevance;
+    anything else falls back to ILIKE, which the trigram indexes serve.
+    Queries are capped at ``MAX_QUERY_LENGTH`` characters. Each branch is its
+    own lambda so the compiled SQL is cached and only the binds change.
+    """
+    query = query[:MAX_QUERY_LENGTH]
+    if is_phrase_query(query):
+        stmt += lambda s: s.where(
+            model.search_tsv.op("@@")(func.plainto_tsquery("english", query))
+        ).order_by(
+            func.ts_rank_cd(model.search_tsv, func.plainto_tsquery("english", query)).desc(),
+            model.updated_at.desc(),
+        )
+        return stmt
+
+    pattern = f"%{escape_like(query)}%"
+    stmt += lambda s: s.where(
+        or_(model.title.ilike(pattern, escape="\\"), model.content.ilike(pattern, escape="\\"))
+    ).order_by(model.updated_at.desc())
+    return stmt
@@ -1,12 +1,16 @@
 """Maps MCP tools to Claude tool definitions and handles execution."""
+import asyncio
 import json
+import sys
 import time
 import re
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Optional
+
+import orjson
+
 from api.config import settings
-from api.executors.skill_executor import SkillExecutor
-from api.security.path_validator import PathValidator
-from api.security.audit_logger import AuditLogger
 
 SKILL_DISPLAY = {
     "fs": {
@@ -104,16 +108,149 @@ EXPOSED_SKILLS = {
     "mcp-builder",
 }
 
+# Skill scripts whose entry function can run inside the API process, skipping
+# an interpreter start and re-import per call: (skill, script) -> (function,
+# ToolMapper method that maps tool parameters to its keyword arguments).
+# Everything else still runs as a subprocess through SkillExecutor.
+IN_PROCESS_SCRIPTS = {
+    ("fs", "list.py"): ("list_files", "_fs_list_kwargs"),
+    ("fs", "read.py"): ("read_file", "_fs_read_kwargs"),
+    ("fs", "write.py"): ("write_file", "_fs_write_kwargs"),
+}
+
+# Audit log redaction: these tools' ``content`` is omitted or masked.
+CONTENT_DROPPED_TOOLS = frozenset({"Create Note", "Update Note", "Write File"})
+CONTENT_REDACTED_TOOLS = frozenset({"Update Scratchpad"})
+
+# Shape of every tool result returned to callers.
+_RESULT_KEYS = frozenset({"success", "data", "error"})
+_STATUS_KEYS = frozenset({"success", "error"})
+
+# Read-only tools whose identical concurrent calls (same user and input)
+# share one execution; see ToolMapper.execute_tool.
+COALESCED_TOOLS = frozenset({
+    "Browse Files",
+    "Read File",
+    "Search Files",
+    "Get Note",
+    "List Notes",
+    "Get Scratchpad",
+    "Read Website",
+    "List Websites",
+})
+# (tool, user_id, write generation, canonical parameters) -> running execution
+_inflight_tools: dict[tuple[str, str, int, bytes], asyncio.Future] = {}
+# Bumped whenever any other (possibly writing) tool call starts, so a read
+# issued after a write never joins an execution that began before it.
+_write_generation = 0
+# Process-wide mapper returned by ToolMapper.shared().
+_shared_mapper: Optional["ToolMapper"] = None
+
+# (parameter, CLI flag) pairs forwarded verbatim by the list tools.
+_NOTES_LIST_FLAGS = (
+    ("folder", "--folder"),
+    ("pinned", "--pinned"),
+    ("archived", "--archived"),
+    ("created_after", "--created-after"),
+    ("created_before", "--created-before"),
+    ("updated_after", "--updated-after"),
+    ("updated_before", "--updated-before"),
+    ("opened_after", "--opened-after"),
+    ("opened_before", "--opened-before"),
+    ("title", "--title"),
+)
+_WEBSITE_LIST_FLAGS = (
+    ("domain", "--domain"),
+    ("pinned", "--pinned"),
+    ("archived", "--archived"),
+    ("created_after", "--created-after"),
+    ("created_before", "--created-before"),
+    ("updated_after", "--updated-after"),
+    ("updated_before", "--updated-before"),
+    ("opened_after", "--opened-after"),
+    ("opened_before", "--opened-before"),
+    ("published_after", "--published-after"),
+    ("published_before", "--published-before"),
+    ("title", "--title"),
+)
+
+
+def _bool_flag(value: Any) -> str:
+    """Render a boolean CLI value; non-bool input keeps the old str().lower()."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value).lower()
+
+
+def _freeze_schema(value: Any) -> Any:
+    """Return a read-only copy of a JSON schema with interned keys.
+
+    Schemas are shared by every request for the life of the process, so
+    dicts become mappingproxies and lists become tuples. Neither is JSON
+    serializable by the stdlib encoder; use ``_thaw_schema`` for anything
+    sent to the API.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {sys.intern(key): _freeze_schema(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze_schema(item) for item in value)
+    return value
+
+
+def _thaw_schema(value: Any) -> Any:
+    """Plain dict/list copy of a frozen schema, safe for ``json.dumps``."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw_schema(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw_schema(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class ToolSpec:
+    """Registry entry for a tool; slots keep per-call attribute reads cheap."""
+
+    description: str
+    input_schema: Mapping[str, Any]
+    skill: Optional[str]
+    script: Optional[str]
+    build_args: Optional[Callable[[dict], list]]
+    validate_read: bool = False
+    validate_write: bool = False
+    expect_json: bool = True
+    required_params: tuple[str, ...] = ()
+
 
 class ToolMapper:
     """Maps MCP tools to Claude tool definitions."""
 
+    @staticmethod
+    def shared() -> "ToolMapper":
+        """Return the process-wide mapper.
+
+        The registry, frozen schemas and Claude tool list are built on first
+        use and reused by every request.
+        """
+        global _shared_mapper
+        if _shared_mapper is None:
+            _shared_mapper = ToolMapper()
+        return _shared_mapper
+
     def __init__(self):
+        # Deferred so importing this module for SKILL_DISPLAY/EXPOSED_SKILLS
+        # does not pull in the executor, FastAPI and logging setup.
+        from api.executors.skill_executor import SkillExecutor
+        from api.security.path_validator import PathValidator
+
         self.executor = SkillExecutor(settings.skills_dir, settings.workspace_base)
         self.path_validator = PathValidator(settings.workspace_base, settings.writable_paths)
 
         # Single source of truth for all tools
-        self.tools = {
+        tool_configs = {
             "Browse Files": {
                 "description": "List files and directories in R2-backed storage with glob pattern support",
                 "input_schema": {
@@ -127,7 +264,7 @@ class ToolMapper:
                 },
                 "skill": "fs",
                 "script": "list.py",
-                "build_args": lambda p: self._build_fs_list_args(p),
+                "build_args": self._build_fs_list_args,
                 "validate_read": True
             },
             "Read File": {
@@ -143,7 +280,7 @@ class ToolMapper:
                 },
                 "skill": "fs",
                 "script": "read.py",
-                "build_args": lambda p: self._build_fs_read_args(p),
+                "build_args": self._build_fs_read_args,
                 "validate_read": True
             },
             "Write File": {
@@ -159,7 +296,7 @@ class ToolMapper:
                 },
                 "skill": "fs",
                 "script": "write.py",
-                "build_args": lambda p: self._build_fs_write_args(p),
+                "build_args": self._build_fs_write_args,
                 "validate_write": True
             },
             "Search Files": {
@@ -175,7 +312,7 @@ class ToolMapper:
                 },
                 "skill": "fs",
                 "script": "search.py",
-                "build_args": lambda p: self._build_fs_search_args(p),
+                "build_args": self._build_fs_search_args,
                 "validate_read": True
             },
             "Unpack DOCX": {
@@ -190,7 +327,7 @@ class ToolMapper:
                 },
                 "skill": "docx",
                 "script": "ooxml/scripts/unpack.py",
-                "build_args": lambda p: [p["input_file"], p["output_dir"]],
+                "build_args": self._build_unpack_args,
                 "expect_json": False
             },
             "Pack DOCX": {
@@ -205,7 +342,7 @@ class ToolMapper:
                 },
                 "skill": "docx",
                 "script": "ooxml/scripts/pack.py",
-                "build_args": lambda p: [p["input_dir"], p["output_file"]],
+                "build_args": self._build_pack_args,
                 "expect_json": False
             },
             "Validate DOCX": {
@@ -221,7 +358,7 @@ class ToolMapper:
                 },
                 "skill": "docx",
                 "script": "ooxml/scripts/validate.py",
-                "build_args": lambda p: self._build_docx_validate_args(p),
+                "build_args": self._build_docx_validate_args,
                 "expect_json": False
             },
             "Check PDF Fillable Fields": {
@@ -235,7 +372,7 @@ class ToolMapper:
                 },
                 "skill": "pdf",
                 "script": "check_fillable_fields.py",
-                "build_args": lambda p: [p["input_pdf"]],
+                "build_args": self._build_pdf_check_fillable_args,
                 "expect_json": False
             },
             "Extract PDF Form Fields": {
@@ -250,7 +387,7 @@ class ToolMapper:
                 },
                 "skill": "pdf",
                 "script": "extract_form_field_info.py",
-                "build_args": lambda p: [p["input_pdf"], p["output_json"]],
+                "build_args": self._build_pdf_extract_fields_args,
                 "expect_json": False
             },
             "Fill PDF Form Fields": {
@@ -266,7 +403,7 @@ class ToolMapper:
                 },
                 "skill": "pdf",
                 "script": "fill_fillable_fields.py",
-                "build_args": lambda p: [p["input_pdf"], p["fields_json"], p["output_pdf"]],
+                "build_args": self._build_pdf_fill_args,
                 "expect_json": False
             },
             "Fill PDF Form Annotations": {
@@ -282,7 +419,7 @@ class ToolMapper:
                 },
                 "skill": "pdf",
                 "script": "fill_pdf_form_with_annotations.py",
-                "build_args": lambda p: [p["input_pdf"], p["fields_json"], p["output_pdf"]],
+                "build_args": self._build_pdf_fill_args,
                 "expect_json": False
             },
             "Convert PDF To Images": {
@@ -297,7 +434,7 @@ class ToolMapper:
                 },
                 "skill": "pdf",
                 "script": "convert_pdf_to_images.py",
-                "build_args": lambda p: [p["input_pdf"], p["output_dir"]],
+                "build_args": self._build_pdf_to_images_args,
                 "expect_json": False
             },
             "Create PDF Validation Image": {
@@ -314,12 +451,7 @@ class ToolMapper:
                 },
                 "skill": "pdf",
                 "script": "create_validation_image.py",
-                "build_args": lambda p: [
-                    str(p["page_number"]),
-                    p["fields_json"],
-                    p["input_image"],
-                    p["output_image"],
-                ],
+                "build_args": self._build_pdf_validation_image_args,
                 "expect_json": False
             },
             "Check PDF Bounding Boxes": {
@@ -333,7 +465,7 @@ class ToolMapper:
                 },
                 "skill": "pdf",
                 "script": "check_bounding_boxes.py",
-                "build_args": lambda p: [p["fields_json"]],
+                "build_args": self._build_pdf_bounding_boxes_args,
                 "expect_json": False
             },
             "Extract PPTX Text Inventory": {
@@ -349,7 +481,7 @@ class ToolMapper:
                 },
                 "skill": "pptx",
                 "script": "inventory.py",
-                "build_args": lambda p: self._build_pptx_inventory_args(p),
+                "build_args": self._build_pptx_inventory_args,
                 "expect_json": False
             },
             "Rearrange PPTX Slides": {
@@ -365,7 +497,7 @@ class ToolMapper:
                 },
                 "skill": "pptx",
                 "script": "rearrange.py",
-                "build_args": lambda p: [p["template_pptx"], p["output_pptx"], p["sequence"]],
+                "build_args": self._build_pptx_rearrange_args,
                 "expect_json": False
             },
             "Replace PPTX Text": {
@@ -381,7 +513,7 @@ class ToolMapper:
                 },
                 "skill": "pptx",
                 "script": "replace.py",
-                "build_args": lambda p: [p["input_pptx"], p["replacements_json"], p["output_pptx"]],
+                "build_args": self._build_pptx_replace_args,
                 "expect_json": False
             },
             "Generate PPTX Thumbnails": {
@@ -398,7 +530,7 @@ class ToolMapper:
                 },
                 "skill": "pptx",
                 "script": "thumbnail.py",
-                "build_args": lambda p: self._build_pptx_thumbnail_args(p),
+                "build_args": self._build_pptx_thumbnail_args,
                 "expect_json": False
             },
             "Unpack PPTX": {
@@ -413,7 +545,7 @@ class ToolMapper:
                 },
                 "skill": "pptx",
                 "script": "ooxml/scripts/unpack.py",
-                "build_args": lambda p: [p["input_file"], p["output_dir"]],
+                "build_args": self._build_unpack_args,
                 "expect_json": False
             },
             "Pack PPTX": {
@@ -428,7 +560,7 @@ class ToolMapper:
                 },
                 "skill": "pptx",
                 "script": "ooxml/scripts/pack.py",
-                "build_args": lambda p: [p["input_dir"], p["output_file"]],
+                "build_args": self._build_pack_args,
                 "expect_json": False
             },
             "Validate PPTX": {
@@ -444,7 +576,7 @@ class ToolMapper:
                 },
                 "skill": "pptx",
                 "script": "ooxml/scripts/validate.py",
-                "build_args": lambda p: self._build_docx_validate_args(p),
+                "build_args": self._build_docx_validate_args,
                 "expect_json": False
             },
             "Recalculate Spreadsheet": {
@@ -459,7 +591,7 @@ class ToolMapper:
                 },
                 "skill": "xlsx",
                 "script": "recalc.py",
-                "build_args": lambda p: self._build_xlsx_recalc_args(p),
+                "build_args": self._build_xlsx_recalc_args,
                 "expect_json": False
             },
             "Create Skill": {
@@ -474,7 +606,7 @@ class ToolMapper:
                 },
                 "skill": "skill-creator",
                 "script": "init_skill.py",
-                "build_args": lambda p: [p["skill_name"], "--path", p["output_dir"]],
+                "build_args": self._build_skill_init_args,
                 "expect_json": False
             },
             "Package Skill": {
@@ -489,7 +621,7 @@ class ToolMapper:
                 },
                 "skill": "skill-creator",
                 "script": "package_skill.py",
-                "build_args": lambda p: self._build_skill_package_args(p),
+                "build_args": self._build_skill_package_args,
                 "expect_json": False
             },
             "Validate Skill": {
@@ -503,7 +635,7 @@ class ToolMapper:
                 },
                 "skill": "skill-creator",
                 "script": "quick_validate.py",
-                "build_args": lambda p: [p["skill_dir"]],
+                "build_args": self._build_skill_validate_args,
                 "expect_json": False
             },
             "Evaluate MCP Server": {
@@ -525,7 +657,7 @@ class ToolMapper:
                 },
                 "skill": "mcp-builder",
                 "script": "evaluation.py",
-                "build_args": lambda p: self._build_mcp_evaluation_args(p),
+                "build_args": self._build_mcp_evaluation_args,
                 "expect_json": False
             },
             "Discover Subdomains": {
@@ -544,7 +676,7 @@ class ToolMapper:
                 },
                 "skill": "subdomain-discover",
                 "script": "discover_subdomains.py",
-                "build_args": lambda p: self._build_subdomain_discover_args(p)
+                "build_args": self._build_subdomain_discover_args
             },
             "Analyze Crawler Policy": {
                 "description": "Analyze robots.txt and llms.txt policies for a domain.",
@@ -562,7 +694,7 @@ class ToolMapper:
                 },
                 "skill": "web-crawler-policy",
                 "script": "analyze_policies.py",
-                "build_args": lambda p: self._build_crawler_policy_args(p)
+                "build_args": self._build_crawler_policy_args
             },
             "Transcribe Audio": {
                 "description": "Transcribe an audio file into text and save it as a note.",
@@ -579,7 +711,7 @@ class ToolMapper:
                 },
                 "skill": "audio-transcribe",
                 "script": "transcribe_audio.py",
-                "build_args": lambda p: self._build_audio_transcribe_args(p)
+                "build_args": self._build_audio_transcribe_args
             },
             "Download YouTube": {
                 "description": "Download YouTube video or audio to R2 (Videos folder by default).",
@@ -595,7 +727,7 @@ class ToolMapper:
                 },
                 "skill": "youtube-download",
                 "script": "download_video.py",
-                "build_args": lambda p: self._build_youtube_download_args(p)
+                "build_args": self._build_youtube_download_args
             },
             "Transcribe YouTube": {
                 "description": "Download YouTube audio, transcribe it, and save it as a note.",
@@ -614,7 +746,7 @@ class ToolMapper:
                 },
                 "skill": "youtube-transcribe",
                 "script": "transcribe_youtube.py",
-                "build_args": lambda p: self._build_youtube_transcribe_args(p)
+                "build_args": self._build_youtube_transcribe_args
             },
             "Create Note": {
                 "description": "Create a searchable, persistent markdown note in the database with metadata. Notes are visible in the UI and fully searchable. Preferred for remembering information across sessions.",
@@ -630,7 +762,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "save_markdown.py",
-                "build_args": lambda p: self._build_notes_create_args(p)
+                "build_args": self._build_notes_create_args
             },
             "Update Note": {
                 "description": "Update an existing note in the database by ID.",
@@ -645,7 +777,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "save_markdown.py",
-                "build_args": lambda p: self._build_notes_update_args(p)
+                "build_args": self._build_notes_update_args
             },
             "Delete Note": {
                 "description": "Delete a note in the database by ID.",
@@ -658,7 +790,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "delete_note.py",
-                "build_args": lambda p: [p["note_id"], "--database", "--user-id", p["user_id"]]
+                "build_args": self._build_note_id_args
             },
             "Pin Note": {
                 "description": "Pin or unpin a note in the database.",
@@ -672,14 +804,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "pin_note.py",
-                "build_args": lambda p: [
-                    p["note_id"],
-                    "--pinned",
-                    str(p["pinned"]).lower(),
-                    "--database",
-                    "--user-id",
-                    p["user_id"],
-                ]
+                "build_args": self._build_notes_pin_args
             },
             "Move Note": {
                 "description": "Move a note to a folder by ID.",
@@ -693,14 +818,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "move_note.py",
-                "build_args": lambda p: [
-                    p["note_id"],
-                    "--folder",
-                    p["folder"],
-                    "--database",
-                    "--user-id",
-                    p["user_id"],
-                ]
+                "build_args": self._build_notes_move_args
             },
             "Get Note": {
                 "description": "Fetch a note by ID.",
@@ -713,7 +831,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "read_note.py",
-                "build_args": lambda p: [p["note_id"], "--database", "--user-id", p["user_id"]]
+                "build_args": self._build_note_id_args
             },
             "List Notes": {
                 "description": "List notes with optional filters.",
@@ -734,7 +852,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "list_notes.py",
-                "build_args": lambda p: self._build_notes_list_args(p)
+                "build_args": self._build_notes_list_args
             },
             "Get Scratchpad": {
                 "description": "Fetch the scratchpad note.",
@@ -744,7 +862,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "scratchpad_get.py",
-                "build_args": lambda p: ["--database", "--user-id", p["user_id"]]
+                "build_args": self._build_user_only_args
             },
             "Update Scratchpad": {
                 "description": "Update the scratchpad content.",
@@ -757,13 +875,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "scratchpad_update.py",
-                "build_args": lambda p: [
-                    "--content",
-                    p["content"],
-                    "--database",
-                    "--user-id",
-                    p["user_id"],
-                ]
+                "build_args": self._build_scratchpad_update_args
             },
             "Clear Scratchpad": {
                 "description": "Clear the scratchpad content.",
@@ -773,7 +885,7 @@ class ToolMapper:
                 },
                 "skill": "notes",
                 "script": "scratchpad_clear.py",
-                "build_args": lambda p: ["--database", "--user-id", p["user_id"]]
+                "build_args": self._build_user_only_args
             },
             "Save Website": {
                 "description": "Save a website to the database (visible in UI).",
@@ -786,7 +898,7 @@ class ToolMapper:
                 },
                 "skill": "web-save",
                 "script": "save_url.py",
-                "build_args": lambda p: [p["url"], "--database", "--user-id", p["user_id"]]
+                "build_args": self._build_website_save_args
             },
             "Delete Website": {
                 "description": "Delete a website in the database by ID.",
@@ -799,7 +911,7 @@ class ToolMapper:
                 },
                 "skill": "web-save",
                 "script": "delete_website.py",
-                "build_args": lambda p: [p["website_id"], "--database", "--user-id", p["user_id"]]
+                "build_args": self._build_website_id_args
             },
             "Pin Website": {
                 "description": "Pin or unpin a website in the database.",
@@ -813,14 +925,7 @@ class ToolMapper:
                 },
                 "skill": "web-save",
                 "script": "pin_website.py",
-                "build_args": lambda p: [
-                    p["website_id"],
-                    "--pinned",
-                    str(p["pinned"]).lower(),
-                    "--database",
-                    "--user-id",
-                    p["user_id"],
-                ]
+                "build_args": self._build_website_pin_args
             },
             "Archive Website": {
                 "description": "Archive or unarchive a website in the database.",
@@ -834,14 +939,7 @@ class ToolMapper:
                 },
                 "skill": "web-save",
                 "script": "archive_website.py",
-                "build_args": lambda p: [
-                    p["website_id"],
-                    "--archived",
-                    str(p["archived"]).lower(),
-                    "--database",
-                    "--user-id",
-                    p["user_id"],
-                ]
+                "build_args": self._build_website_archive_args
             },
             "Read Website": {
                 "description": "Fetch a website by ID.",
@@ -854,7 +952,7 @@ class ToolMapper:
                 },
                 "skill": "web-save",
                 "script": "read_website.py",
-                "build_args": lambda p: [p["website_id"], "--database", "--user-id", p["user_id"]]
+                "build_args": self._build_website_id_args
             },
             "List Websites": {
                 "description": "List websites with optional filters.",
@@ -877,7 +975,7 @@ class ToolMapper:
                 },
                 "skill": "web-save",
                 "script": "list_websites.py",
-                "build_args": lambda p: self._build_website_list_args(p)
+                "build_args": self._build_website_list_args
             },
             "Set UI Theme": {
                 "description": "Set the UI theme to light or dark.",
@@ -934,7 +1032,27 @@ class ToolMapper:
                 "build_args": None
             }
         }
+        self.tools: Dict[str, ToolSpec] = {
+            name: ToolSpec(
+                **{**config, "input_schema": _freeze_schema(config["input_schema"])},
+                required_params=tuple(config["input_schema"].get("required", ())),
+            )
+            for name, config in tool_configs.items()
+        }
         self._build_tool_name_maps()
+        self._theme_tool_names = frozenset({"Set UI Theme", self.tool_name_reverse["Set UI Theme"]})
+        # Schemas never change after init; build them once and only filter per request.
+        self._claude_tools = [
+            (
+                spec.skill,
+                {
+                    "name": self.tool_name_reverse.get(name, name),
+                    "description": spec.description,
+                    "input_schema": _thaw_schema(spec.input_schema)
+                }
+            )
+            for name, spec in self.tools.items()
+        ]
 
     def _build_tool_name_maps(self) -> None:
         self.tool_name_map = {}
@@ -964,6 +1082,12 @@ class ToolMapper:
     @staticmethod
     def _normalize_result(result: Any) -> Dict[str, Any]:
         if isinstance(result, dict):
+            # Already canonical (the usual case): hand it back as-is.
+            if result.keys() == _RESULT_KEYS and (
+                (result["success"] is True and result["data"] is not None)
+                or (result["success"] is False and result["error"])
+            ):
+                return result
             success = bool(result.get("success", False))
             data = result.get("data")
             error = result.get("error")
@@ -972,7 +1096,7 @@ class ToolMapper:
                 data = {
                     key: value
                     for key, value in result.items()
-                    if key not in {"success", "error"}
+                    if key not in _STATUS_KEYS
                 }
 
             if not success and not error:
@@ -991,15 +1115,18 @@ class ToolMapper:
         }
 
     def get_claude_tools(self, allowed_skills: List[str] | None = None) -> List[Dict[str, Any]]:
-        """Convert tool configs to Claude tool schema."""
+        """Return Claude tool schemas for the enabled skills.
+
+        The list is fresh so callers can append to it; the schema dicts are
+        shared across calls and must not be modified.
+        """
+        if allowed_skills is None:
+            return [schema for _, schema in self._claude_tools]
+        allowed = set(allowed_skills)
         return [
-            {
-                "name": self.tool_name_reverse.get(name, name),
-                "description": config["description"],
-                "input_schema": config["input_schema"]
-            }
-            for name, config in self.tools.items()
-            if self._is_skill_enabled(config.get("skill"), allowed_skills)
+            schema
+            for skill, schema in self._claude_tools
+            if not skill or skill in allowed
         ]
 
     async def execute_tool(
@@ -1009,8 +1136,64 @@ class ToolMapper:
         allowed_skills: List[str] | None = None,
         context: Dict[str, Any] | None = None
     ) -> Dict[str, Any]:
-        """Execute tool via skill executor."""
-        start_time = time.time()
+        """Execute tool via skill executor.
+
+        Concurrent identical calls to a read-only tool for the same user
+        await a single execution (and produce a single audit entry). Calls
+        without a user are never shared, and a read does not join one that
+        started before a later tool call (such as a write) began. Writes made
+        outside tool calls are not tracked, so a joined read can be as stale
+        as any read racing such a write.
+        """
+        global _write_generation
+        if name in self._theme_tool_names:
+            return self._set_ui_theme(name, parameters, allowed_skills)
+
+        key = self._inflight_key(name, parameters, allowed_skills, context)
+        if key is None:
+            _write_generation += 1
+            return await self._execute_tool(name, parameters, allowed_skills, context)
+        task = _inflight_tools.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._execute_tool(name, parameters, allowed_skills, context)
+            )
+            _inflight_tools[key] = task
+            task.add_done_callback(lambda _: _inflight_tools.pop(key, None))
+        # Shielded so one caller going away does not cancel the others' result.
+        return await asyncio.shield(task)
+
+    def _inflight_key(
+        self,
+        name: str,
+        parameters: dict,
+        allowed_skills: List[str] | None,
+        context: Dict[str, Any] | None,
+    ) -> Optional[tuple[str, str, int, bytes]]:
+        display_name = self.get_tool_display_name(name)
+        if display_name not in COALESCED_TOOLS:
+            return None
+        user_id = context.get("user_id") if context else None
+        if not user_id:
+            return None
+        if not self._is_skill_enabled(self.tools[display_name].skill, allowed_skills):
+            return None
+        try:
+            canonical = orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            return None
+        return display_name, user_id, _write_generation, canonical
+
+    async def _execute_tool(
+        self,
+        name: str,
+        parameters: dict,
+        allowed_skills: List[str] | None,
+        context: Dict[str, Any] | None,
+    ) -> Dict[str, Any]:
+        from api.security.audit_logger import AuditLogger
+
+        start_ns = time.perf_counter_ns()
 
         try:
             # Get tool config
@@ -1022,29 +1205,12 @@ class ToolMapper:
                     "error": f"Unknown tool: {display_name}"
                 })
 
-            if not self._is_skill_enabled(tool_config.get("skill"), allowed_skills):
+            if not self._is_skill_enabled(tool_config.skill, allowed_skills):
                 return self._normalize_result({
                     "success": False,
-                    "error": f"Skill disabled: {tool_config.get('skill')}"
+                    "error": f"Skill disabled: {tool_config.skill}"
                 })
 
-            # Special case: UI theme (no skill execution)
-            if display_name == "Set UI Theme":
-                theme = parameters.get("theme")
-                if theme not in {"light", "dark"}:
-                    return self._normalize_result({"success": False, "error": "Invalid theme"})
-
-                result = {"success": True, "data": {"theme": theme}}
-
-                AuditLogger.log_tool_call(
-                    tool_name=name,
-                    parameters={"theme": theme},
-                    duration_ms=(time.time() - start_time) * 1000,
-                    success=True
-                )
-
-                return self._normalize_result(result)
-
             # Special case: prompt preview
             if display_name == "Generate Prompts":
                 if not context:
@@ -1082,7 +1248,7 @@ class ToolMapper:
                 AuditLogger.log_tool_call(
                     tool_name=display_name,
                     parameters={},
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
                     success=True
                 )
 
@@ -1109,14 +1275,14 @@ class ToolMapper:
                 return self._normalize_result(result)
 
             # Validate paths if needed
-            if tool_config.get("validate_write"):
+            if tool_config.validate_write:
                 if "path" in parameters:
                     self.path_validator.validate_write_path(parameters["path"])
-            elif tool_config.get("validate_read"):
+            elif tool_config.validate_read:
                 path_to_validate = parameters.get("path") or parameters.get("directory", ".")
                 self.path_validator.validate_read_path(path_to_validate)
 
-            if context and tool_config.get("skill") in {
+            if context and tool_config.skill in {
                 "fs",
                 "notes",
                 "web-save",
@@ -1133,9 +1299,14 @@ class ToolMapper:
                 if user_id:
                     parameters = {**parameters, "user_id": user_id}
 
+            # Fail clearly on missing inputs instead of a KeyError from the builder
+            missing = [key for key in tool_config.required_params if key not in parameters]
+            if missing:
+                raise ValueError(f"Missing required parameter(s): {', '.join(missing)}")
+
             # Build arguments using the tool's build function
-            args = tool_config["build_args"](parameters)
-            if parameters.get("user_id") and tool_config.get("skill") in {
+            args = tool_config.build_args(parameters)
+            if parameters.get("user_id") and tool_config.skill in {
                 "fs",
                 "pdf",
                 "pptx",
@@ -1150,24 +1321,37 @@ class ToolMapper:
                     args.extend(["--user-id", parameters["user_id"]])
 
             # Execute skill
-            result = await self.executor.execute(
-                tool_config["skill"],
-                tool_config["script"],
-                args,
-                expect_json=tool_config.get("expect_json", True),
-            )
+            in_process = self._in_process_call(tool_config, parameters)
+            if in_process is not None:
+                function, kwargs = in_process
+                result = await self.executor.execute_function(
+                    tool_config.skill,
+                    tool_config.script,
+                    function,
+                    kwargs,
+                    args,
+                    user_id=parameters["user_id"],
+                )
+            else:
+                result = await self.executor.execute(
+                    tool_config.skill,
+                    tool_config.script,
+                    args,
+                    expect_json=tool_config.expect_json,
+                )
 
             # Log execution (redact sensitive content)
-            log_params = parameters.copy()
-            if "content" in log_params and display_name == "Update Scratchpad":
-                log_params["content"] = "<redacted>"
-            if "content" in log_params and display_name in ["Create Note", "Update Note", "Write File"]:
-                log_params.pop("content", None)
+            log_params = parameters
+            if "content" in parameters:
+                if display_name in CONTENT_DROPPED_TOOLS:
+                    log_params = {k: v for k, v in parameters.items() if k != "content"}
+                elif display_name in CONTENT_REDACTED_TOOLS:
+                    log_params = {**parameters, "content": "<redacted>"}
 
             AuditLogger.log_tool_call(
                 tool_name=display_name,
                 parameters=log_params,
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
                 success=result.get("success", False)
             )
 
@@ -1177,12 +1361,41 @@ class ToolMapper:
             AuditLogger.log_tool_call(
                 tool_name=name,
                 parameters=parameters,
-                duration_ms=(time.time() - start_time) * 1000,
+                duration_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
                 success=False,
                 error=str(e)
             )
             return self._normalize_result({"success": False, "error": str(e)})
 
+    def _set_ui_theme(self, name: str, parameters: dict, allowed_skills: List[str] | None) -> Dict[str, Any]:
+        """UI theme toggle: answered inline, no skill execution or registry lookup."""
+        from api.security.audit_logger import AuditLogger
+
+        start_ns = time.perf_counter_ns()
+        skill = self.tools["Set UI Theme"].skill
+        if not self._is_skill_enabled(skill, allowed_skills):
+            return {"success": False, "data": None, "error": f"Skill disabled: {skill}"}
+        theme = parameters.get("theme")
+        if theme != "light" and theme != "dark":
+            return {"success": False, "data": None, "error": "Invalid theme"}
+
+        AuditLogger.log_tool_call(
+            tool_name=name,
+            parameters={"theme": theme},
+            duration_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
+            success=True
+        )
+        return {"success": True, "data": {"theme": theme}, "error": None}
+
+    def _in_process_call(self, spec: ToolSpec, parameters: dict) -> Optional[tuple[Callable, dict]]:
+        entry = IN_PROCESS_SCRIPTS.get((spec.skill, spec.script))
+        if entry is None or not parameters.get("user_id") or parameters.get("dry_run"):
+            return None
+        function = self.executor.load_function(spec.skill, spec.script, entry[0])
+        if function is None:
+            return None
+        return function, getattr(self, entry[1])(parameters)
+
     @staticmethod
     def _is_skill_enabled(skill_name: str | None, allowed_skills: List[str] | None) -> bool:
         if not skill_name:
@@ -1191,6 +1404,30 @@ class ToolMapper:
             return True
         return skill_name in set(allowed_skills)
 
+    # Keyword arguments for in-process skill functions
+    def _fs_list_kwargs(self, params: dict) -> dict:
+        return {
+            "user_id": params["user_id"],
+            "directory": params.get("path", "."),
+            "pattern": params.get("pattern", "*"),
+            "recursive": bool(params.get("recursive", False)),
+        }
+
+    def _fs_read_kwargs(self, params: dict) -> dict:
+        return {
+            "user_id": params["user_id"],
+            "filename": params["path"],
+            "start_line": int(params["start_line"]) if params.get("start_line") is not None else None,
+            "end_line": int(params["end_line"]) if params.get("end_line") is not None else None,
+        }
+
+    def _fs_write_kwargs(self, params: dict) -> dict:
+        return {
+            "user_id": params["user_id"],
+            "filename": params["path"],
+            "content": params["content"],
+        }
+
     # Argument builders for each tool type
     def _build_fs_list_args(self, params: dict) -> list:
         path = params.get("path", ".")
@@ -1294,18 +1531,7 @@ class ToolMapper:
         user_id = params.get("user_id")
         if user_id:
             args.extend(["--user-id", user_id])
-        for key, flag in [
-            ("folder", "--folder"),
-            ("pinned", "--pinned"),
-            ("archived", "--archived"),
-            ("created_after", "--created-after"),
-            ("created_before", "--created-before"),
-            ("updated_after", "--updated-after"),
-            ("updated_before", "--updated-before"),
-            ("opened_after", "--opened-after"),
-            ("opened_before", "--opened-before"),
-            ("title", "--title"),
-        ]:
+        for key, flag in _NOTES_LIST_FLAGS:
             value = params.get(key)
             if value is not None:
                 args.extend([flag, str(value)])
@@ -1316,20 +1542,7 @@ class ToolMapper:
         user_id = params.get("user_id")
         if user_id:
             args.extend(["--user-id", user_id])
-        for key, flag in [
-            ("domain", "--domain"),
-            ("pinned", "--pinned"),
-            ("archived", "--archived"),
-            ("created_after", "--created-after"),
-            ("created_before", "--created-before"),
-            ("updated_after", "--updated-after"),
-            ("updated_before", "--updated-before"),
-            ("opened_after", "--opened-after"),
-            ("opened_before", "--opened-before"),
-            ("published_after", "--published-after"),
-            ("published_before", "--published-before"),
-            ("title", "--title"),
-        ]:
+        for key, flag in _WEBSITE_LIST_FLAGS:
             value = params.get(key)
             if value is not None:
                 args.extend([flag, str(value)])
@@ -1486,3 +1699,105 @@ class ToolMapper:
         if params.get("output"):
             args.extend(["--output", params["output"]])
         return args
+
+    def _build_unpack_args(self, params: dict) -> list:
+        return [params["input_file"], params["output_dir"]]
+
+    def _build_pack_args(self, params: dict) -> list:
+        return [params["input_dir"], params["output_file"]]
+
+    def _build_pdf_check_fillable_args(self, params: dict) -> list:
+        return [params["input_pdf"]]
+
+    def _build_pdf_extract_fields_args(self, params: dict) -> list:
+        return [params["input_pdf"], params["output_json"]]
+
+    def _build_pdf_fill_args(self, params: dict) -> list:
+        return [params["input_pdf"], params["fields_json"], params["output_pdf"]]
+
+    def _build_pdf_to_images_args(self, params: dict) -> list:
+        return [params["input_pdf"], params["output_dir"]]
+
+    def _build_pdf_validation_image_args(self, params: dict) -> list:
+        return [
+            str(params["page_number"]),
+            params["fields_json"],
+            params["input_image"],
+            params["output_image"],
+        ]
+
+    def _build_pdf_bounding_boxes_args(self, params: dict) -> list:
+        return [params["fields_json"]]
+
+    def _build_pptx_rearrange_args(self, params: dict) -> list:
+        return [params["template_pptx"], params["output_pptx"], params["sequence"]]
+
+    def _build_pptx_replace_args(self, params: dict) -> list:
+        return [params["input_pptx"], params["replacements_json"], params["output_pptx"]]
+
+    def _build_skill_init_args(self, params: dict) -> list:
+        return [params["skill_name"], "--path", params["output_dir"]]
+
+    def _build_skill_validate_args(self, params: dict) -> list:
+        return [params["skill_dir"]]
+
+    def _build_note_id_args(self, params: dict) -> list:
+        return [params["note_id"], "--database", "--user-id", params["user_id"]]
+
+    def _build_notes_pin_args(self, params: dict) -> list:
+        return [
+            params["note_id"],
+            "--pinned",
+            _bool_flag(params["pinned"]),
+            "--database",
+            "--user-id",
+            params["user_id"],
+        ]
+
+    def _build_notes_move_args(self, params: dict) -> list:
+        return [
+            params["note_id"],
+            "--folder",
+            params["folder"],
+            "--database",
+            "--user-id",
+            params["user_id"],
+        ]
+
+    def _build_user_only_args(self, params: dict) -> list:
+        return ["--database", "--user-id", params["user_id"]]
+
+    def _build_scratchpad_update_args(self, params: dict) -> list:
+        return [
+            "--content",
+            params["content"],
+            "--database",
+            "--user-id",
+            params["user_id"],
+        ]
+
+    def _build_website_save_args(self, params: dict) -> list:
+        return [params["url"], "--database", "--user-id", params["user_id"]]
+
+    def _build_website_id_args(self, params: dict) -> list:
+        return [params["website_id"], "--database", "--user-id", params["user_id"]]
+
+    def _build_website_pin_args(self, params: dict) -> list:
+        return [
+            params["website_id"],
+            "--pinned",
+            _bool_flag(params["pinned"]),
+            "--database",
+            "--user-id",
+            params["user_id"],
+        ]
+
+    def _build_website_archive_args(self, params: dict) -> list:
+        return [
+            params["website_id"],
+            "--archived",
+            _bool_flag(params["archived"]),
+            "--database",
+            "--user-id",
+            params["user_id"],
+        ]
@@ -1,11 +1,11 @@
 """Websites service for shared website business logic."""
 from __future__ import annotations
 
-import uuid
 from datetime import datetime, timezone
 from typing import Iterable, Optional
 from urllib.parse import urlparse
 
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session, load_only
 
 from api.models.website import Website
@@ -61,7 +61,6 @@ class WebsitesService:
         pinned: bool = False,
         archived: bool = False,
     ) -> Website:
-        now = datetime.now(timezone.utc)
         normalized_url = WebsitesService.normalize_url(url)
         domain = WebsitesService.extract_domain(normalized_url)
         metadata = {"pinned": pinned, "archived": archived}
@@ -77,8 +76,6 @@ class WebsitesService:
             saved_at=saved_at,
             published_at=published_at,
             metadata_=metadata,
-            created_at=now,
-            updated_at=now,
             last_opened_at=None,
             deleted_at=None,
         )
@@ -138,8 +135,6 @@ class WebsitesService:
             saved_at=saved_at,
             published_at=published_at,
             metadata_=metadata,
-            created_at=now,
-            updated_at=now,
             last_opened_at=None,
             deleted_at=None,
         )
@@ -152,7 +147,7 @@ class WebsitesService:
     def update_website(
         db: Session,
         user_id: str,
-        website_id: uuid.UUID,
+        website_id: str,
         *,
         title: Optional[str] = None,
         content: Optional[str] = None,
@@ -192,7 +187,7 @@ class WebsitesService:
     def update_pinned(
         db: Session,
         user_id: str,
-        website_id: uuid.UUID,
+        website_id: str,
         pinned: bool,
     ) -> Website:
         website = (
@@ -217,7 +212,7 @@ class WebsitesService:
     def update_archived(
         db: Session,
         user_id: str,
-        website_id: uuid.UUID,
+        website_id: str,
         archived: bool,
     ) -> Website:
         website = (
@@ -239,7 +234,7 @@ class WebsitesService:
         return website
 
     @staticmethod
-    def delete_website(db: Session, user_id: str, website_id: uuid.UUID) -> bool:
+    def delete_website(db: Session, user_id: str, website_id: str) -> bool:
         website = (
             db.query(Website)
             .filter(
@@ -262,7 +257,7 @@ class WebsitesService:
     def get_website(
         db: Session,
         user_id: str,
-        website_id: uuid.UUID,
+        website_id: str,
         *,
         mark_opened: bool = True,
     ) -> Optional[Website]:
@@ -301,7 +296,9 @@ class WebsitesService:
         published_before: Optional[datetime] = None,
         title_search: Optional[str] = None,
     ) -> Iterable[Website]:
-        query = db.query(Website).options(load_only(
+        # Each optional filter is its own lambda so every filter combination
+        # gets a cached compiled statement and only the bind values change.
+        stmt = lambda_stmt(lambda: select(Website).options(load_only(
             Website.id,
             Website.title,
             Website.url,
@@ -311,41 +308,45 @@ class WebsitesService:
             Website.metadata_,
             Website.updated_at,
             Website.last_opened_at,
-        )).filter(
+        )))
+        stmt += lambda s: s.where(
             Website.user_id == user_id,
             Website.deleted_at.is_(None),
         )
 
         if domain is not None:
-            query = query.filter(Website.domain == domain)
+            stmt += lambda s: s.where(Website.domain == domain)
 
         if pinned is not None:
-            query = query.filter(Website.metadata_["pinned"].astext == str(pinned).lower())
+            pinned_value = str(pinned).lower()
+            stmt += lambda s: s.where(Website.metadata_["pinned"].astext == pinned_value)
 
         if archived is not None:
-            query = query.filter(Website.metadata_["archived"].astext == str(archived).lower())
+            archived_value = str(archived).lower()
+            stmt += lambda s: s.where(Website.metadata_["archived"].astext == archived_value)
 
         if created_after is not None:
-            query = query.filter(Website.created_at >= created_after)
+            stmt += lambda s: s.where(Website.created_at >= created_after)
         if created_before is not None:
-            query = query.filter(Website.created_at <= created_before)
+            stmt += lambda s: s.where(Website.created_at <= created_before)
         if updated_after is not None:
-            query = query.filter(Website.updated_at >= updated_after)
+            stmt += lambda s: s.where(Website.updated_at >= updated_after)
         if updated_before is not None:
-            query = query.filter(Website.updated_at <= updated_before)
+            stmt += lambda s: s.where(Website.updated_at <= updated_before)
         if opened_after is not None:
-            query = query.filter(Website.last_opened_at >= opened_after)
+            stmt += lambda s: s.where(Website.last_opened_at >= opened_after)
         if opened_before is not None:
-            query = query.filter(Website.last_opened_at <= opened_before)
+            stmt += lambda s: s.where(Website.last_opened_at <= opened_before)
         if published_after is not None:
-            query = query.filter(Website.published_at >= published_after)
+            stmt += lambda s: s.where(Website.published_at >= published_after)
         if published_before is not None:
-            query = query.filter(Website.published_at <= published_before)
+            stmt += lambda s: s.where(Website.published_at <= published_before)
 
         if title_search:
-            query = query.filter(Website.title.ilike(f"%{title_search}%"))
+            title_pattern = f"%{title_search}%"
+            stmt += lambda s: s.where(Website.title.ilike(title_pattern))
 
-        return (
-            query.order_by(Website.saved_at.desc().nullslast(), Website.created_at.desc())
-            .all()
+        stmt += lambda s: s.order_by(
+            Website.saved_at.desc().nullslast(), Website.created_at.desc()
         )
+        return db.execute(stmt).scalars().all()
@@ -6,11 +6,12 @@ Create a new directory in workspace.
 """
 
 import sys
-import json
 import argparse
 from pathlib import Path
 from typing import Dict, Any
 
+import orjson
+
 BACKEND_ROOT = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(BACKEND_ROOT))
 
@@ -32,6 +33,12 @@ def create_directory(
     return result
 
 
+def _emit(payload: Dict[str, Any], stream) -> None:
+    """Write compact JSON; the skill executor parses it, so no indentation."""
+    stream.buffer.write(orjson.dumps(payload) + b"\n")
+    stream.flush()
+
+
 def main():
     """Main entry point for mkdir script."""
     parser = argparse.ArgumentParser(
@@ -72,7 +79,7 @@ def main():
             'success': True,
             'data': result
         }
-        print(json.dumps(output, indent=2))
+        _emit(output, sys.stdout)
         sys.exit(0)
 
     except (ValueError, FileExistsError) as e:
@@ -80,7 +87,7 @@ def main():
             'success': False,
             'error': str(e)
         }
-        print(json.dumps(error_output, indent=2), file=sys.stderr)
+        _emit(error_output, sys.stderr)
         sys.exit(1)
 
     except Exception as e:
@@ -88,7 +95,7 @@ def main():
             'success': False,
             'error': f'Unexpected error: {str(e)}'
         }
-        print(json.dumps(error_output, indent=2), file=sys.stderr)
+        _emit(error_output, sys.stderr)
         sys.exit(1)
 
 
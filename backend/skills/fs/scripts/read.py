@@ -22,8 +22,21 @@ def read_file(
     filename: str,
     offset: int = 0,
     lines: int | None = None,
+    *,
+    start_line: int | None = None,
+    end_line: int | None = None,
 ) -> Dict[str, Any]:
-    """Read file content with optional line range."""
+    """Read file content with optional line range.
+
+    1-indexed ``start_line``/``end_line`` override ``offset``/``lines``.
+    """
+    if start_line is not None:
+        offset = max(start_line - 1, 0)
+    if end_line is not None and start_line is not None:
+        lines = max(end_line - start_line + 1, 0)
+    elif end_line is not None:
+        lines = max(end_line, 0)
+
     content, record = read_text(user_id, filename)
     content_lines = content.splitlines(keepends=True)
 
@@ -88,16 +101,14 @@ def main():
     args = parser.parse_args()
 
     try:
-        offset = args.offset
-        lines = args.lines
-        if args.start_line is not None:
-            offset = max(args.start_line - 1, 0)
-        if args.end_line is not None and args.start_line is not None:
-            lines = max(args.end_line - args.start_line + 1, 0)
-        elif args.end_line is not None:
-            lines = max(args.end_line, 0)
-
-        result = read_file(args.user_id, args.filename, offset, lines)
+        result = read_file(
+            args.user_id,
+            args.filename,
+            args.offset,
+            args.lines,
+            start_line=args.start_line,
+            end_line=args.end_line,
+        )
 
         output = {
             'success': True,
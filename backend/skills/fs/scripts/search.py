@@ -6,18 +6,235 @@ Search for files by name pattern or content within workspace.
 """
 
 import sys
-import json
 import argparse
+import fnmatch
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+import orjson
 
 BACKEND_ROOT = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(BACKEND_ROOT))
 
 from api.services.files_service import FilesService
 from api.services.storage.service import get_storage_backend
-from api.services.skill_file_ops import normalize_path, ensure_allowed_path, session_for_user
+from api.services.skill_file_ops import (
+    normalize_path,
+    ensure_allowed_path,
+    session_for_user,
+    PROFILE_IMAGES_PREFIX,
+)
+from api.services.text_search import escape_like
+
+BINARY_SNIFF_BYTES = 8192
+# Larger objects are left out of content search rather than downloaded.
+MAX_CONTENT_BYTES = 4_000_000
+SEARCH_WORKERS = 16
+# Content reads queued ahead of the one being consumed.
+SEARCH_WINDOW = 2 * SEARCH_WORKERS
+# ASCII characters that also match non-ASCII ones under IGNORECASE
+# (dotted/dotless i, long s), so lower() cannot stand in for them.
+_UNSAFE_FOLD_CHARS = frozenset("iIsS")
+
+
+# Characters with a regex meaning outside classes; everything else is literal.
+_REGEX_SPECIALS = frozenset(".^$*+?{}[]\\|()")
+_QUANTIFIERS = frozenset("*+?{")
+_COUNTED_REPEAT = re.compile(r"\{\d*(?:,\d*)?\}")
+# One escape sequence, including the arguments of \x, \u, \U, \N, octal
+# escapes and group references.
+_ESCAPE = re.compile(
+    r"\\(?:x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|N\{[^}]*\}|[0-7]{3}|\d{1,2}|.)",
+    re.DOTALL,
+)
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Index just past the character class starting at ``pattern[i] == "["``."""
+    i += 1
+    if i < len(pattern) and pattern[i] == "^":
+        i += 1
+    if i < len(pattern) and pattern[i] == "]":
+        i += 1
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Index just past the group starting at ``pattern[i] == "("``."""
+    depth = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            i = _skip_class(pattern, i)
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _required_literal(content_regex: re.Pattern) -> Optional[str]:
+    """Longest literal every match must contain, or None if none is safe to use.
+
+    Only runs of plain characters (or escaped punctuation) at the top level
+    of the pattern count; groups, classes, escapes like ``\\d`` and anchors
+    end a run, a quantifier also drops the character it applies to, and any
+    top-level alternation disables the check. For case-insensitive patterns
+    the literal is lowercased ASCII, to be looked up in lowercased content.
+    """
+    flags = content_regex.flags
+    if flags & re.VERBOSE:
+        return None
+    ignore_case = bool(flags & re.IGNORECASE)
+    pattern = content_regex.pattern
+    best = ""
+    run: list[str] = []
+
+    def end_run() -> None:
+        nonlocal best
+        if len(run) > len(best):
+            best = "".join(run)
+        run.clear()
+
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char in _QUANTIFIERS:
+            # The preceding character may repeat or be absent.
+            if run:
+                run.pop()
+            end_run()
+            counted = _COUNTED_REPEAT.match(pattern, i) if char == "{" else None
+            i = counted.end() if counted else i + 1
+            continue
+        if char == "|":
+            return None
+        if pattern.startswith("(?#", i):
+            # Comments are transparent: a following quantifier applies to
+            # the character before them.
+            close = pattern.find(")", i)
+            i = len(pattern) if close == -1 else close + 1
+            continue
+        if char == "(":
+            end_run()
+            i = _skip_group(pattern, i)
+            continue
+        if char == "[":
+            end_run()
+            i = _skip_class(pattern, i)
+            continue
+        if char == "\\":
+            escape = _ESCAPE.match(pattern, i)
+            if escape is None:
+                return None
+            escaped = escape.group()[1:]
+            i = escape.end()
+            # Escaped ASCII punctuation is that character; letters and
+            # digits are classes, anchors, references or code points.
+            if len(escaped) == 1 and escaped.isascii() and not escaped.isalnum():
+                char = escaped
+            else:
+                end_run()
+                continue
+        elif char in _REGEX_SPECIALS:
+            end_run()
+            i += 1
+            continue
+        else:
+            i += 1
+        if ignore_case and (not char.isascii() or char in _UNSAFE_FOLD_CHARS):
+            end_run()
+            continue
+        run.append(char.lower() if ignore_case else char)
+    end_run()
+    return best if len(best) >= 2 else None
+
+
+def _name_like(name_pattern: str) -> Optional[str]:
+    """SQL LIKE form of a glob, or None when it uses [...] classes LIKE cannot express."""
+    if "[" in name_pattern:
+        return None
+    return escape_like(name_pattern).replace("*", "%").replace("?", "_")
+
+
+def _read_text(storage, key: str) -> Optional[str]:
+    """Stream an object and decode it, giving up after the first chunk if it is binary."""
+    chunks = storage.iter_object(key)
+    try:
+        first = next(chunks, b"")
+        # Skip binary objects without downloading the rest of them.
+        if b"\0" in first[:BINARY_SNIFF_BYTES]:
+            return None
+        data = b"".join([first, *chunks])
+    finally:
+        chunks.close()
+    return data.decode("utf-8", errors="ignore")
+
+
+def _scan_content(
+    storage,
+    record,
+    name: str,
+    content_regex,
+    required_literal: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Fetch one object and return its content match entry, if any."""
+    try:
+        content = _read_text(storage, record.bucket_key)
+    except Exception:
+        return None
+    if content is None:
+        return None
+    # Most files do not match: a substring test rules them out before the regex runs.
+    if required_literal is not None:
+        haystack = content.lower() if content_regex.flags & re.IGNORECASE else content
+        if required_literal not in haystack:
+            return None
+
+    # Count every match but only keep line details for the first few;
+    # newlines are counted incrementally between them.
+    match_lines = []
+    match_count = 0
+    line_num = 1
+    scanned = 0
+    for match in content_regex.finditer(content):
+        match_count += 1
+        if match_count > 5:
+            continue
+        start = match.start()
+        line_num += content.count('\n', scanned, start)
+        scanned = start
+        line_start = content.rfind('\n', 0, start) + 1
+        line_end = content.find('\n', start)
+        if line_end == -1:
+            line_end = len(content)
+        match_lines.append({
+            "line": line_num,
+            "content": content[line_start:line_end].strip()[:100],
+        })
+    if not match_count:
+        return None
+
+    return {
+        "path": record.path,
+        "name": name,
+        "size": record.size,
+        "match_type": "content",
+        "match_count": match_count,
+        "matches": match_lines,
+    }
 
 
 def search_files(
@@ -27,16 +244,18 @@ def search_files(
     content_pattern: str = None,
     case_sensitive: bool = False,
     max_results: int = 100,
+    max_content_bytes: int = MAX_CONTENT_BYTES,
 ) -> Dict[str, Any]:
     """
     Search for files by name or content.
 
     Args:
         directory: Directory to search in (relative to workspace)
-        name_pattern: Pattern to match filenames (supports wildcards * and ?)
+        name_pattern: Pattern to match filenames (shell-style: *, ? and [...])
         content_pattern: Pattern to search for in file contents (regex)
         case_sensitive: Whether search should be case-sensitive
         max_results: Maximum number of results to return
+        max_content_bytes: Files larger than this are skipped by content search
 
     Returns:
         Dictionary with search results
@@ -55,87 +274,89 @@ def search_files(
 
     # Compile content regex if provided
     content_regex = None
+    required_literal = None
     if content_pattern:
         flags = 0 if case_sensitive else re.IGNORECASE
         try:
             content_regex = re.compile(content_pattern, flags)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
+        required_literal = _required_literal(content_regex)
 
     # Convert glob pattern to regex for name matching
     name_regex = None
     if name_pattern:
-        # Convert shell-style wildcards to regex
-        pattern_str = name_pattern.replace(".", r"\.")
-        pattern_str = pattern_str.replace("*", ".*")
-        pattern_str = pattern_str.replace("?", ".")
-        pattern_str = f"^{pattern_str}$"
         flags = 0 if case_sensitive else re.IGNORECASE
-        name_regex = re.compile(pattern_str, flags)
-
-    with session_for_user(user_id) as db:
-        records = FilesService.list_by_prefix(db, user_id, base_path)
+        name_regex = re.compile(fnmatch.translate(name_pattern), flags)
 
     storage = get_storage_backend()
 
-    for record in records:
-        if record.deleted_at is not None:
-            continue
-        if record.category == "folder":
-            continue
-        if record.path.startswith("profile-images/") or record.path == "profile-images":
-            continue
-
-        rel_path = record.path[len(base_path) + 1 :] if base_path and record.path.startswith(f"{base_path}/") else record.path
-        if not rel_path:
-            continue
-        name = Path(rel_path).name
-
-        if name_regex and not name_regex.match(name):
-            continue
-
-        if not content_regex:
-            results.append({
-                "path": record.path,
-                "name": name,
-                "size": record.size,
-                "match_type": "name",
-            })
-            if len(results) >= max_results:
-                break
-            continue
-
-        try:
-            content = storage.get_object(record.bucket_key).decode("utf-8", errors="ignore")
-        except Exception:
-            continue
-
-        matches = list(content_regex.finditer(content))
-        if not matches:
-            continue
-
-        lines = content.split('\n')
-        match_lines = []
-        for match in matches[:5]:
-            line_num = content[:match.start()].count('\n') + 1
-            if line_num <= len(lines):
-                line_content = lines[line_num - 1].strip()
-                match_lines.append({
-                    "line": line_num,
-                    "content": line_content[:100],
+    # Deleted, folder and profile-image rows are filtered in SQL, and the name
+    # pattern narrows the rows there too; the listing is streamed in batches
+    # so name-only searches stop reading once they have enough results.
+    candidates = []
+    with session_for_user(user_id) as db:
+        records = FilesService.iter_search_candidates(
+            db,
+            user_id,
+            base_path,
+            name_like=_name_like(name_pattern) if name_pattern else None,
+            case_sensitive=case_sensitive,
+            exclude_prefix=PROFILE_IMAGES_PREFIX,
+        )
+        for record in records:
+            rel_path = record.path[len(base_path) + 1 :] if base_path and record.path.startswith(f"{base_path}/") else record.path
+            if not rel_path:
+                continue
+            name = Path(rel_path).name
+
+            if name_regex and not name_regex.match(name):
+                continue
+
+            if not content_regex:
+                results.append({
+                    "path": record.path,
+                    "name": name,
+                    "size": record.size,
+                    "match_type": "name",
                 })
-
-        results.append({
-            "path": record.path,
-            "name": name,
-            "size": record.size,
-            "match_type": "content",
-            "match_count": len(matches),
-            "matches": match_lines,
-        })
-
-        if len(results) >= max_results:
-            break
+                if len(results) >= max_results:
+                    break
+                continue
+
+            if record.size > max_content_bytes:
+                continue
+            candidates.append((record, name))
+
+    if candidates:
+        # Fetch objects concurrently (storage reads are I/O bound) while
+        # keeping results in path order. Only a bounded window of reads is
+        # queued ahead, so stopping at max_results leaves the rest unread.
+        executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS)
+        try:
+            remaining = iter(candidates)
+            pending = deque()
+
+            def submit_next() -> None:
+                candidate = next(remaining, None)
+                if candidate is not None:
+                    pending.append(executor.submit(
+                        _scan_content,
+                        storage, candidate[0], candidate[1], content_regex, required_literal,
+                    ))
+
+            for _ in range(SEARCH_WINDOW):
+                submit_next()
+            while pending:
+                result = pending.popleft().result()
+                submit_next()
+                if result is None:
+                    continue
+                results.append(result)
+                if len(results) >= max_results:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     return {
         "success": True,
@@ -151,6 +372,11 @@ def search_files(
     }
 
 
+def _emit(payload: Dict[str, Any], stream) -> None:
+    stream.buffer.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2) + b"\n")
+    stream.flush()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -163,7 +389,7 @@ def main():
     )
     parser.add_argument(
         "--name",
-        help="Filename pattern (supports * and ? wildcards)"
+        help="Filename pattern (supports *, ? and [...] wildcards)"
     )
     parser.add_argument(
         "--content",
@@ -204,7 +430,7 @@ def main():
         )
 
         if args.json:
-            print(json.dumps(result, indent=2))
+            _emit(result, sys.stdout)
         else:
             data = result['data']
             print(f"Found {data['count']} results")
@@ -226,7 +452,7 @@ def main():
         error = {"success": False, "error": str(e)}
 
         if args.json:
-            print(json.dumps(error, indent=2), file=sys.stderr)
+            _emit(error, sys.stderr)
         else:
             print(f"✗ Error: {e}", file=sys.stderr)
 
@@ -236,7 +462,7 @@ def main():
         error = {"success": False, "error": f"Unexpected error: {str(e)}"}
 
         if args.json:
-            print(json.dumps(error, indent=2), file=sys.stderr)
+            _emit(error, sys.stderr)
         else:
             print(f"✗ Unexpected error: {e}", file=sys.stderr)
 
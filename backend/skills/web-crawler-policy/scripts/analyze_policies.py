@@ -29,8 +29,9 @@ BACKEND_ROOT = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(BACKEND_ROOT))
 
 try:
-    from api.services.skill_file_ops import upload_file
+    from api.services.skill_file_ops import session_for_user, upload_file
 except Exception:
+    session_for_user = None
     upload_file = None
 # Try to import subdomain scanner if available
 try:
@@ -1186,12 +1187,14 @@ Requirements:
             raise RuntimeError("Storage dependencies are unavailable")
         domain_folder = output_dir / main_domain
         if domain_folder.exists():
-            for file_path in domain_folder.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                rel_path = file_path.relative_to(domain_folder).as_posix()
-                r2_path = f"{r2_base}/{main_domain}/{rel_path}".strip("/")
-                upload_file(args.user_id, r2_path, file_path)
+            # One shared session for the whole batch of uploads
+            with session_for_user(args.user_id):
+                for file_path in domain_folder.rglob("*"):
+                    if not file_path.is_file():
+                        continue
+                    rel_path = file_path.relative_to(domain_folder).as_posix()
+                    r2_path = f"{r2_base}/{main_domain}/{rel_path}".strip("/")
+                    upload_file(args.user_id, r2_path, file_path)
 
         print(f"\nScan complete. Analyzed {len(domains_to_analyze)} domains.")
         sys.exit(0)
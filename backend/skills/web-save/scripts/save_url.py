@@ -68,6 +68,17 @@ def parse_published_at(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
+_JINA_META_RE = re.compile(
+    r'^(Title|URL Source|Published Time):(.*)\n?|^Markdown Content:\s*',
+    re.MULTILINE,
+)
+_JINA_META_FIELDS = {
+    "Title": "title",
+    "URL Source": "url_source",
+    "Published Time": "published_time",
+}
+
+
 def parse_jina_metadata(content: str) -> Tuple[Dict[str, Optional[str]], str]:
     metadata: Dict[str, Optional[str]] = {
         "title": None,
@@ -75,24 +86,18 @@ def parse_jina_metadata(content: str) -> Tuple[Dict[str, Optional[str]], str]:
         "published_time": None
     }
 
-    title_match = re.search(r'^Title:\s*(.+)$', content, re.MULTILINE)
-    if title_match:
-        metadata["title"] = title_match.group(1).strip()
-
-    url_match = re.search(r'^URL Source:\s*(.+)$', content, re.MULTILINE)
-    if url_match:
-        metadata["url_source"] = url_match.group(1).strip()
-
-    published_match = re.search(r'^Published Time:\s*(.+)$', content, re.MULTILINE)
-    if published_match:
-        metadata["published_time"] = published_match.group(1).strip()
-
-    cleaned = content
-    cleaned = re.sub(r'^Title:.*\n?', '', cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r'^URL Source:.*\n?', '', cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r'^Published Time:.*\n?', '', cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r'^Markdown Content:\s*', '', cleaned, flags=re.MULTILINE)
-    cleaned = cleaned.lstrip()
+    # Extract the first value of each header and strip every header line in
+    # a single pass over the content.
+    def _consume(match: re.Match) -> str:
+        key = match.group(1)
+        if key:
+            field = _JINA_META_FIELDS[key]
+            value = match.group(2).strip()
+            if value and metadata[field] is None:
+                metadata[field] = value
+        return ""
+
+    cleaned = _JINA_META_RE.sub(_consume, content).lstrip()
 
     return metadata, cleaned
 
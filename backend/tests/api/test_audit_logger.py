@@ -200,3 +200,33 @@ class TestAuditLoggerEdgeCases:
         json_start = record.message.index("{")
         data = json.loads(record.message[json_start:])
         assert data["parameters"]["path"] == "file with spaces & special-chars.txt"
+
+
+class TestBackgroundAuditLogging:
+    """Test queued audit logging."""
+
+    def test_records_reach_root_handlers_after_stop(self):
+        """Should deliver queued records to the root handlers and flush on stop."""
+        records = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        handler = ListHandler(level=logging.INFO)
+        root = logging.getLogger()
+        root.addHandler(handler)
+        audit_level = logging.getLogger("sidebar.audit").level
+        logging.getLogger("sidebar.audit").setLevel(logging.INFO)
+        try:
+            AuditLogger.start_background_logging()
+            AuditLogger.log_tool_call(tool_name="queued", parameters={}, success=True)
+            AuditLogger.stop_background_logging()
+        finally:
+            AuditLogger.stop_background_logging()
+            root.removeHandler(handler)
+            logging.getLogger("sidebar.audit").setLevel(audit_level)
+
+        assert len(records) == 1
+        assert "queued" in records[0].getMessage()
+        assert logging.getLogger("sidebar.audit").propagate is True
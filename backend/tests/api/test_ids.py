@@ -0,0 +1,20 @@
+"""Tests for identifier validation."""
+import uuid
+
+from api.services.ids import is_uuid
+
+
+def test_is_uuid_accepts_canonical_forms():
+    value = str(uuid.uuid4())
+
+    assert is_uuid(value)
+    assert is_uuid(value.upper())
+
+
+def test_is_uuid_rejects_trailing_newline_and_non_strings():
+    value = str(uuid.uuid4())
+
+    assert not is_uuid(f"{value}\n")
+    assert not is_uuid(f" {value}")
+    assert not is_uuid(uuid.UUID(value))
+    assert not is_uuid(None)
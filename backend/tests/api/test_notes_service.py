@@ -7,7 +7,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from api.db.base import Base
-from api.services.notes_service import NotesService
+from api.services.notes_service import NoteNotFoundError, NotesService
 
 
 @pytest.fixture
@@ -65,6 +65,19 @@ def test_update_folder_and_pinned(db_session):
     assert (pinned.metadata_ or {}).get("pinned") is True
 
 
+def test_rename_note_updates_heading(db_session):
+    note = NotesService.create_note(db_session, "test_user", "# Old Title\n\nBody")
+    renamed = NotesService.rename_note(db_session, "test_user", note.id, "New Title")
+
+    assert renamed.title == "New Title"
+    assert renamed.content == "# New Title\n\nBody"
+
+
+def test_update_pinned_missing_note(db_session):
+    with pytest.raises(NoteNotFoundError):
+        NotesService.update_pinned(db_session, "test_user", uuid.uuid4(), True)
+
+
 def test_list_notes_filters(db_session):
     now = datetime.now(timezone.utc)
     earlier = now - timedelta(days=2)
@@ -87,6 +100,7 @@ def test_list_notes_filters(db_session):
 
     active_notes = NotesService.list_notes(db_session, "test_user", archived=False)
     assert all(n.id != note_b.id for n in active_notes)
+    assert any(n.id == note_a.id for n in active_notes)
 
     filtered = NotesService.list_notes(db_session, "test_user", folder="Work", title_search="Alpha")
     assert len(filtered) == 1
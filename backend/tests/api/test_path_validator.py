@@ -61,6 +61,13 @@ class TestPathValidatorRead:
         assert exc_info.value.status_code == 403
         assert "Path outside workspace" in str(exc_info.value.detail)
 
+    def test_validate_read_rejects_sibling_with_shared_prefix(self, validator, temp_workspace):
+        """Should reject siblings whose name starts with the workspace name."""
+        sibling = str(temp_workspace.parent / "workspace-other" / "file.txt")
+        with pytest.raises(HTTPException) as exc_info:
+            validator.validate_read_path(sibling)
+        assert exc_info.value.status_code == 403
+
     def test_validate_read_accepts_absolute_in_workspace(self, validator, temp_workspace):
         """Should accept absolute paths within workspace."""
         abs_path = str(temp_workspace / "notes" / "test.md")
@@ -159,3 +166,36 @@ class TestPathValidatorEdgeCases:
         abs_path = temp_workspace / "notes" / "test.md"
         relative = validator.get_relative_path(abs_path)
         assert relative == "notes/test.md"
+
+
+class TestPathValidatorR2:
+    """Test string-level validation used with the R2 backend."""
+
+    @pytest.fixture(autouse=True)
+    def r2_backend(self, monkeypatch):
+        from api.config import settings
+        monkeypatch.setattr(settings, "storage_backend", "r2")
+
+    def test_caches_accepted_paths(self, validator, temp_workspace):
+        """Should reuse the resolved path for repeated lookups."""
+        first = validator.validate_write_path("notes/a.md")
+        assert first == temp_workspace / "notes" / "a.md"
+        assert validator.validate_read_path("notes/a.md") is first
+
+    def test_cache_is_shared_across_validators(self, validator, temp_workspace, tmp_path):
+        """Should reuse results across validators for the same workspace only."""
+        first = validator.validate_read_path("notes/shared.md")
+        same = PathValidator(temp_workspace, [])
+        assert same.validate_read_path("notes/shared.md") is first
+
+        other_workspace = tmp_path / "other"
+        other_workspace.mkdir()
+        other = PathValidator(other_workspace, [])
+        assert other.validate_read_path("notes/shared.md") == other_workspace.resolve() / "notes" / "shared.md"
+
+    def test_rejections_are_not_cached(self, validator):
+        """Should raise on every call for rejected paths."""
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                validator.validate_read_path("profile-images/a.png")
+            assert exc_info.value.status_code == 403
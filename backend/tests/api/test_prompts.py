@@ -75,6 +75,14 @@ def test_build_first_message_prompt_includes_profile() -> None:
     assert "I am the Engineer at Acme." in prompt
 
 
+def test_build_first_message_prompt_tracks_age_by_date() -> None:
+    settings = DummySettings(name="Sam", date_of_birth=date(2000, 1, 2))
+    before = build_first_message_prompt(settings, None, datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc))
+    after = build_first_message_prompt(settings, None, datetime(2025, 1, 2, 9, 0, tzinfo=timezone.utc))
+    assert "I am 24 years old." in before
+    assert "I am 25 years old." in after
+
+
 def test_build_recent_activity_block() -> None:
     notes = [
         {
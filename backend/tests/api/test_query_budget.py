@@ -0,0 +1,40 @@
+"""Tests for the per-request SQL statement budget."""
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from api.db.query_budget import (
+    QueryBudgetExceeded,
+    QueryBudgetMiddleware,
+    install_query_budget,
+)
+
+
+def _run_request(limit, strict, statements):
+    engine = create_engine("sqlite://")
+    install_query_budget(engine)
+
+    async def app(scope, receive, send):
+        with engine.connect() as conn:
+            for _ in range(statements):
+                conn.execute(text("SELECT 1"))
+
+    middleware = QueryBudgetMiddleware(app, limit=limit, strict=strict)
+    scope = {"type": "http", "method": "GET", "path": "/api/notes/tree"}
+    asyncio.run(middleware(scope, None, None))
+
+
+def test_within_budget_is_silent(caplog):
+    _run_request(limit=3, strict=False, statements=3)
+    assert "possible N+1" not in caplog.text
+
+
+def test_over_budget_logs_warning(caplog):
+    _run_request(limit=2, strict=False, statements=5)
+    assert "issued 5 SQL statements (budget 2)" in caplog.text
+
+
+def test_strict_mode_raises():
+    with pytest.raises(QueryBudgetExceeded):
+        _run_request(limit=1, strict=True, statements=2)
@@ -1,4 +1,5 @@
 """Tests for SkillExecutor security and functionality."""
+import json
 import pytest
 import asyncio
 from pathlib import Path
@@ -256,3 +257,143 @@ print(json.dumps({"success": True, "data": {"message": message}}))
         # Should succeed and treat input as literal string
         assert result["success"] is True
         assert result["data"]["message"] == malicious_input
+
+
+class TestSkillExecutorInProcess:
+    """Test in-process execution of skill script functions."""
+
+    @pytest.mark.asyncio
+    async def test_execute_function_wraps_result(self, executor, temp_skills_dir):
+        """Should load a script function and wrap its return value."""
+        script = temp_skills_dir / "test-skill" / "scripts" / "shout.py"
+        script.write_text('''
+def shout(message):
+    if not message:
+        raise ValueError("Message is required")
+    return {"message": message.upper()}
+''')
+
+        function = executor.load_function("test-skill", "shout.py", "shout")
+        result = await executor.execute_function(
+            "test-skill", "shout.py", function, {"message": "hi"}, ["hi"]
+        )
+        assert result == {"success": True, "data": {"message": "HI"}}
+
+        result = await executor.execute_function(
+            "test-skill", "shout.py", function, {"message": ""}, [""]
+        )
+        assert result == {"success": False, "error": "Message is required"}
+
+    def test_load_function_rejects_unknown_skill(self, executor):
+        """Should not import scripts outside the allowed skills."""
+        assert executor.load_function("not-a-skill", "shout.py", "shout") is None
+
+    def test_load_function_returns_none_on_import_error(self, executor, temp_skills_dir):
+        """Should fall back to subprocess execution when the script cannot be imported."""
+        script = temp_skills_dir / "test-skill" / "scripts" / "broken.py"
+        script.write_text("import module_that_does_not_exist\n")
+        assert executor.load_function("test-skill", "broken.py", "run") is None
+
+    @pytest.mark.asyncio
+    async def test_execute_function_enforces_limits(self, executor):
+        """Should apply path validation, the timeout and the output cap."""
+        import time
+
+        result = await executor.execute_function(
+            "test-skill", "echo.py", lambda: {}, {}, ["../../etc/passwd"]
+        )
+        assert result["success"] is False
+        assert "Path traversal not allowed" in result["error"]
+
+        original_timeout = settings.skill_timeout_seconds
+        settings.skill_timeout_seconds = 0.2
+        try:
+            result = await executor.execute_function(
+                "test-skill", "echo.py", lambda: time.sleep(1), {}, []
+            )
+        finally:
+            settings.skill_timeout_seconds = original_timeout
+        assert result["success"] is False
+        assert "timeout" in result["error"].lower()
+
+        original_limit = settings.skill_max_output_bytes
+        settings.skill_max_output_bytes = 100
+        try:
+            result = await executor.execute_function(
+                "test-skill", "echo.py", lambda: "x" * 200, {}, []
+            )
+        finally:
+            settings.skill_max_output_bytes = original_limit
+        assert result["success"] is False
+        assert "exceeded limit" in result["error"]
+
+
+class TestSkillExecutorWorkerPool:
+    """Test script execution through the warm worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_script_with_args_and_env(self, executor, temp_workspace, temp_skills_dir):
+        """Should pass argv, cwd and environment to each script run."""
+        script = temp_skills_dir / "test-skill" / "scripts" / "where.py"
+        script.write_text('''#!/usr/bin/env python3
+import os
+import sys
+import json
+print(json.dumps({"success": True, "data": {
+    "argv": sys.argv[1:],
+    "cwd": os.getcwd(),
+    "workspace": os.getenv("WORKSPACE_BASE"),
+}}))
+''')
+
+        SkillExecutor.start_worker_pool(size=2)
+        try:
+            for _ in range(3):
+                result = await executor.execute("test-skill", "where.py", ["a b"], expect_json=False)
+                data = json.loads(result["data"]["stdout"])["data"]
+                assert data["argv"] == ["a b"]
+                assert data["cwd"] == str(temp_workspace)
+                assert data["workspace"] == str(temp_workspace)
+        finally:
+            await SkillExecutor.stop_worker_pool()
+
+    @pytest.mark.asyncio
+    async def test_reports_script_errors(self, executor, temp_skills_dir):
+        """Should surface stderr and exit codes like a subprocess."""
+        script = temp_skills_dir / "test-skill" / "scripts" / "fail.py"
+        script.write_text('''#!/usr/bin/env python3
+import sys
+import json
+print(json.dumps({"success": False, "error": "Something went wrong"}), file=sys.stderr)
+sys.exit(1)
+''')
+
+        SkillExecutor.start_worker_pool(size=1)
+        try:
+            result = await executor.execute("test-skill", "fail.py", [])
+            assert result == {"success": False, "error": "Something went wrong"}
+
+            result = await executor.execute("test-skill", "echo.py", ["still ok"])
+            assert result["data"]["message"] == "still ok"
+        finally:
+            await SkillExecutor.stop_worker_pool()
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_script(self, executor, temp_skills_dir):
+        """Should enforce the timeout inside the worker."""
+        script = temp_skills_dir / "test-skill" / "scripts" / "hang.py"
+        script.write_text('''#!/usr/bin/env python3
+import time
+time.sleep(60)
+''')
+
+        original_timeout = settings.skill_timeout_seconds
+        settings.skill_timeout_seconds = 1
+        SkillExecutor.start_worker_pool(size=1)
+        try:
+            result = await executor.execute("test-skill", "hang.py", [])
+            assert result["success"] is False
+            assert "timeout" in result["error"].lower()
+        finally:
+            await SkillExecutor.stop_worker_pool()
+            settings.skill_timeout_seconds = original_timeout
@@ -0,0 +1,37 @@
+"""Tests for shared skill file operation helpers."""
+import os
+
+import pytest
+from sqlalchemy import text
+
+from api.services.skill_file_ops import session_for_user
+
+
+def test_nested_failure_keeps_session_user():
+    """Should keep app.user_id set on the shared session after a nested block fails."""
+    if not os.getenv("DATABASE_URL"):
+        pytest.skip("DATABASE_URL not set")
+
+    with session_for_user("user-1") as db:
+        with pytest.raises(Exception):
+            with session_for_user("user-1") as inner:
+                assert inner is db
+                inner.execute(text("SELECT 1 / 0"))
+        user_id = db.execute(text("SELECT current_setting('app.user_id', true)")).scalar()
+
+    assert user_id == "user-1"
+
+
+def test_nested_block_sets_user_after_commit():
+    """Should set app.user_id again when a nested block follows a commit."""
+    if not os.getenv("DATABASE_URL"):
+        pytest.skip("DATABASE_URL not set")
+
+    with session_for_user("user-1") as db:
+        db.commit()
+        # Stand in for a pooled connection that never had the user set.
+        db.execute(text("RESET app.user_id"))
+        with session_for_user("user-1") as inner:
+            user_id = inner.execute(text("SELECT current_setting('app.user_id', true)")).scalar()
+
+    assert user_id == "user-1"
@@ -0,0 +1,26 @@
+"""Tests for skill output uploads."""
+from pathlib import Path
+
+from api.services import skill_file_transfer
+
+
+def test_upload_output_dir_skips_symlinked_directories(tmp_path, monkeypatch):
+    """Should upload regular files without following directory symlinks."""
+    out = tmp_path / "out"
+    (out / "sub").mkdir(parents=True)
+    (out / "top.txt").write_text("top")
+    (out / "sub" / "f.txt").write_text("f")
+    (out / "sub" / "loop").symlink_to(out, target_is_directory=True)
+
+    uploaded = []
+
+    def fake_upload(user_id: str, r2_path: str, local_path: Path) -> str:
+        uploaded.append((r2_path, local_path.read_text()))
+        return r2_path
+
+    monkeypatch.setattr(skill_file_transfer, "upload_output_path", fake_upload)
+
+    result = skill_file_transfer.upload_output_dir("user-1", "/pre/", out)
+
+    assert sorted(result) == ["pre/sub/f.txt", "pre/top.txt"]
+    assert sorted(uploaded) == [("pre/sub/f.txt", "f"), ("pre/top.txt", "top")]
@@ -0,0 +1,23 @@
+"""Tests for ToolMapper tool schemas."""
+import json
+
+from api.services.tool_mapper import ToolMapper
+
+
+def test_claude_tools_serialize_with_stdlib_json():
+    mapper = ToolMapper()
+
+    tools = mapper.get_claude_tools()
+
+    assert tools
+    payload = json.loads(json.dumps(tools))
+    assert all(isinstance(tool["input_schema"], dict) for tool in payload)
+
+
+def test_claude_tools_filtered_by_skill_serialize():
+    mapper = ToolMapper()
+
+    tools = mapper.get_claude_tools(allowed_skills=["fs"])
+
+    assert tools
+    json.dumps(tools)
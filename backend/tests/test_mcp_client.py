@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """Test client for MCP Streamable HTTP protocol."""
 import asyncio
-import httpx
-import json
 import os
-from typing import AsyncIterator, Dict, Any
+from typing import Dict, Any, Optional
+
+import httpx
+import orjson
 
 
 class MCPClient:
@@ -14,6 +15,25 @@ class MCPClient:
         self.base_url = base_url.rstrip('/')
         self.bearer_token = bearer_token
         self.session_id = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "MCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Shared client, so calls reuse pooled keep-alive connections."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.base_url, timeout=30)
+        return self._client
 
     def _get_headers(self, accept: str = "application/json") -> Dict[str, str]:
         """Get headers with authentication."""
@@ -27,36 +47,35 @@ class MCPClient:
             headers["mcp-session-id"] = self.session_id
         return headers
 
-    def _parse_sse_response(self, text: str) -> Dict[str, Any]:
-        """Parse Server-Sent Events response."""
-        lines = text.strip().split('\n')
-        data_lines = [line[6:] for line in lines if line.startswith('data: ')]
-        if data_lines:
-            return json.loads(data_lines[0])
+    async def _read_sse_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Parse a streamed SSE response, stopping at the first data line."""
+        async for line in response.aiter_lines():
+            if line.startswith('data: '):
+                return orjson.loads(line[6:])
         return {}
 
     async def initialize_session(self) -> Dict[str, Any]:
         """Initialize an MCP session."""
-        async with httpx.AsyncClient() as client:
-            # Try to initialize with POST to /mcp
-            response = await client.post(
-                f"{self.base_url}/mcp",
-                headers=self._get_headers("application/json, text/event-stream"),
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "clientInfo": {
-                            "name": "test-client",
-                            "version": "1.0.0"
-                        }
-                    },
-                    "id": 1
-                }
-            )
-
+        client = self._http()
+        # Try to initialize with POST to /mcp
+        async with client.stream(
+            "POST",
+            "/mcp",
+            headers=self._get_headers("application/json, text/event-stream"),
+            content=orjson.dumps({
+                "jsonrpc": "2.0",
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {
+                        "name": "test-client",
+                        "version": "1.0.0"
+                    }
+                },
+                "id": 1
+            })
+        ) as response:
             print(f"Initialize response status: {response.status_code}")
 
             if response.status_code == 200:
@@ -65,53 +84,55 @@ class MCPClient:
                 print(f"Session ID: {self.session_id}")
 
                 # Parse SSE response
-                result = self._parse_sse_response(response.text)
-                return result
+                return await self._read_sse_response(response)
             else:
+                await response.aread()
                 raise Exception(f"Failed to initialize: {response.text}")
 
     async def list_tools(self) -> Dict[str, Any]:
         """List all available tools."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/mcp",
-                headers=self._get_headers("application/json, text/event-stream"),
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tools/list",
-                    "id": 2
-                }
-            )
-
+        client = self._http()
+        async with client.stream(
+            "POST",
+            "/mcp",
+            headers=self._get_headers("application/json, text/event-stream"),
+            content=orjson.dumps({
+                "jsonrpc": "2.0",
+                "method": "tools/list",
+                "id": 2
+            })
+        ) as response:
             print(f"\nList tools response status: {response.status_code}")
 
             if response.status_code == 200:
-                return self._parse_sse_response(response.text)
+                return await self._read_sse_response(response)
             else:
+                await response.aread()
                 raise Exception(f"Failed to list tools: {response.text}")
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specific tool."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/mcp",
-                headers=self._get_headers("application/json, text/event-stream"),
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments
-                    },
-                    "id": 3
-                }
-            )
-
+        client = self._http()
+        async with client.stream(
+            "POST",
+            "/mcp",
+            headers=self._get_headers("application/json, text/event-stream"),
+            content=orjson.dumps({
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments
+                },
+                "id": 3
+            })
+        ) as response:
             print(f"\nCall tool response status: {response.status_code}")
 
             if response.status_code == 200:
-                return self._parse_sse_response(response.text)
+                return await self._read_sse_response(response)
             else:
+                await response.aread()
                 raise Exception(f"Failed to call tool: {response.text}")
 
 
@@ -130,13 +151,21 @@ async def main():
     print("MCP Streamable HTTP Client Test")
     print("=" * 60)
 
-    client = MCPClient(base_url, bearer_token)
+    async with MCPClient(base_url, bearer_token) as client:
+        await run_checks(client)
 
+    print("\n" + "=" * 60)
+    print("Test complete!")
+    print("=" * 60)
+
+
+async def run_checks(client: MCPClient):
+    """Run the endpoint checks against one client."""
     try:
         # Test 1: Initialize session
         print("\n[Test 1] Initializing MCP session...")
         init_result = await client.initialize_session()
-        print(f"✓ Session initialized: {json.dumps(init_result, indent=2)}")
+        print(f"✓ Session initialized: {orjson.dumps(init_result, option=orjson.OPT_INDENT_2).decode()}")
 
     except Exception as e:
         print(f"✗ Initialize failed: {e}")
@@ -146,7 +175,7 @@ async def main():
         # Test 2: List available tools
         print("\n[Test 2] Listing available tools...")
         tools_result = await client.list_tools()
-        print(f"✓ Tools listed: {json.dumps(tools_result, indent=2)}")
+        print(f"✓ Tools listed: {orjson.dumps(tools_result, option=orjson.OPT_INDENT_2).decode()}")
 
     except Exception as e:
         print(f"✗ List tools failed: {e}")
@@ -155,15 +184,11 @@ async def main():
         # Test 3: Call fs_list tool
         print("\n[Test 3] Calling fs_list tool...")
         call_result = await client.call_tool("fs_list", {"path": ".", "pattern": "*"})
-        print(f"✓ Tool called: {json.dumps(call_result, indent=2)}")
+        print(f"✓ Tool called: {orjson.dumps(call_result, option=orjson.OPT_INDENT_2).decode()}")
 
     except Exception as e:
         print(f"✗ Call tool failed: {e}")
 
-    print("\n" + "=" * 60)
-    print("Test complete!")
-    print("=" * 60)
-
 
 if __name__ == "__main__":
     asyncio.run(main())